@@ -0,0 +1,51 @@
+"""浏览器池基准测试（需要安装 Playwright 和 Chromium）
+
+对比每次搜索都启动 Playwright、Chromium 并新建上下文（原 search_full 的做法）
+与从 BrowserPool 借用预热上下文打开页面的耗时。页面只加载 about:blank，
+测的是启动和创建开销，不含网络。
+
+运行：python benchmarks/bench_browser_pool.py [次数，默认 20]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import time
+
+from crawler.browser_pool import BrowserPool
+
+
+def cold_search() -> None:
+    """原做法：每次完整启动和关闭"""
+    pool = BrowserPool(size=1)
+    try:
+        with pool.page() as page:
+            page.goto("about:blank")
+    finally:
+        pool.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    start = time.perf_counter()
+    for _ in range(count):
+        cold_search()
+    cold = (time.perf_counter() - start) / count
+
+    with BrowserPool(size=2, max_pages_per_context=10) as pool:
+        start = time.perf_counter()
+        for _ in range(count):
+            with pool.page() as page:
+                page.goto("about:blank")
+        warm = (time.perf_counter() - start) / count
+        stats = pool.stats
+
+    print(f"{count} 次")
+    print(f"每次启动：{cold * 1000:.1f} ms/次")
+    print(f"浏览器池：{warm * 1000:.1f} ms/次（{stats}）")
+    print(f"加速比：{cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""日期解析基准测试
+
+按列表页的实际分布生成输入：发布日期集中在最近 60 天内，截止时间约一半是
+"详见内容"、其余为"日期 时间"（整点或半点），少量为中文日期。对比：
+
+- 原实现：re.match 判断后 strptime，否则中文正则（每次调用 re 模块函数）
+- 不缓存：data.dates 的定宽快速路径 + 预编译正则
+- 缓存：data.dates.parse_date（LRU 缓存，计时前清空）
+
+运行：python benchmarks/bench_date_parser.py [输入条数，默认 200000]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import random
+import re
+import time
+from datetime import datetime, timedelta
+
+from data import dates
+
+
+def legacy_parse_date(date_str):
+    """原 SearchCrawler._parse_date / BrowserCrawler._parse_date（去掉日志）"""
+    if not date_str:
+        return None
+    try:
+        date_str = date_str.strip()
+        if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
+            return datetime.strptime(date_str[:10], "%Y-%m-%d")
+        match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', date_str)
+        if match:
+            year, month, day = match.groups()
+            return datetime(int(year), int(month), int(day))
+    except Exception:
+        pass
+    return None
+
+
+def make_inputs(count: int, rng: random.Random) -> list:
+    today = datetime(2026, 2, 2)
+    values = []
+    for _ in range(count // 2):
+        # 发布日期
+        day = today - timedelta(days=rng.randint(0, 59))
+        values.append(day.strftime("%Y-%m-%d"))
+        # 截止时间
+        roll = rng.random()
+        deadline = today + timedelta(days=rng.randint(5, 30))
+        if roll < 0.5:
+            values.append("详见内容")
+        elif roll < 0.95:
+            values.append(f"{deadline:%Y-%m-%d} {rng.choice((9, 10, 14, 17))}:{rng.choice(('00', '30'))}")
+        else:
+            values.append(f"{deadline.year}年{deadline.month}月{deadline.day}日")
+    return values
+
+
+def run(func, values) -> float:
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    values = make_inputs(count, random.Random(42))
+
+    uncached = dates._parse.__wrapped__
+    for value in values:
+        expected = legacy_parse_date(value)
+        result = dates.parse_date(value)
+        # 原实现不解析时间，只比较日期部分
+        assert (result.date() if result else None) == (expected.date() if expected else None), value
+
+    legacy = run(legacy_parse_date, values)
+    plain = run(lambda value: uncached(value.strip()) if value else None, values)
+    dates._parse.cache_clear()
+    cached = run(dates.parse_date, values)
+
+    print(f"{count} 条输入，{len(set(values))} 个不同值")
+    print(f"{'实现':<10}{'耗时(ms)':>10}{'每条(µs)':>10}{'加速比':>8}")
+    for name, seconds in (("原实现", legacy), ("不缓存", plain), ("缓存", cached)):
+        print(f"{name:<10}{seconds * 1000:>10.1f}{seconds / count * 1e6:>10.2f}{legacy / seconds:>8.2f}x")
+    print(f"缓存命中：{dates._parse.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
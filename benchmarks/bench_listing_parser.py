@@ -0,0 +1,159 @@
+"""列表解析基准测试
+
+对比原 BrowserCrawler.parse_content 的逐行实现（每行重建省份列表、逐个信息类型
+startswith、每次调用 re 模块函数）与 crawler.listing_parser 的解析耗时，
+并确认两者解析结果一致（截止时间只比较日期部分，原实现不解析时间）。
+
+运行：python benchmarks/bench_listing_parser.py [页面行数，默认 50000]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import random
+import re
+import time
+from datetime import datetime
+
+from crawler.listing_parser import parse_listing
+from data.keyword_location import split_location_tag, LABEL_LINES
+
+
+INFO_TYPES = ['招标公告', '中标结果', '招标变更', '采购信息', '拟在建项目', '拍卖转让', '招标预告']
+PROVINCE_LIST = ['四川', '北京', '上海', '重庆', '广东', '浙江', '江苏', '湖北', '内蒙古', '黑龙江']
+TAGS = ['', ' (广告,标识等在内容中)', ' (广告,标识等在内容或附件中) 附件', ' (广告,标识等在内容或标书中) 标书']
+TITLE_CHARS = "项目采购招标公告工程建设服务施工设计监理改造维修标识标牌宣传栏广告导视亮化户外门头"
+
+
+def make_page(line_count: int, rng: random.Random) -> str:
+    """生成与页面复制内容格式相同的文本，约每 5 行一个项目"""
+    lines = ["采招网 - 搜索结果", "共找到 12345 条结果", ""]
+    while len(lines) < line_count:
+        title = "".join(rng.choice(TITLE_CHARS) for _ in range(rng.randint(12, 30)))
+        lines.append(f"{rng.choice(INFO_TYPES)} {title}{rng.choice(TAGS)}")
+        if rng.random() < 0.5:
+            lines.append(f"采购预算：{rng.randint(1, 99999) / 100}万元 ")
+            lines.append(f" 采购方式：比选 截止时间：2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 17:00")
+        else:
+            lines.append("采购预算：详见内容 采购方式：公开招标 截止时间：详见内容 ")
+            lines.append("")
+        lines.append(rng.choice(PROVINCE_LIST))
+        lines.append(f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+    return "\n".join(lines[:line_count])
+
+
+def _legacy_parse_date(date_str):
+    if not date_str:
+        return None
+    try:
+        date_str = date_str.strip()
+        if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
+            return datetime.strptime(date_str[:10], "%Y-%m-%d")
+        match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', date_str)
+        if match:
+            year, month, day = match.groups()
+            return datetime(int(year), int(month), int(day))
+    except Exception:
+        pass
+    return None
+
+
+def legacy_parse(content: str, region_filter: str = None) -> list:
+    """原 BrowserCrawler.parse_content 的解析逻辑（去掉日志）"""
+    items = []
+    lines = content.strip().split('\n')
+    current_item = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        info_types = ['招标公告', '中标结果', '招标变更', '采购信息', '拟在建项目', '拍卖转让', '招标预告']
+        found_new_item = False
+        for info_type in info_types:
+            if line.startswith(info_type):
+                if current_item and current_item.get('title'):
+                    items.append(current_item)
+                current_item = {
+                    'id': None, 'title': '', 'info_type': info_type, 'publish_date': None,
+                    'province': None, 'city': None, 'district': None, 'owner_unit': None,
+                    'budget_amount': None, 'procurement_type': None, 'bidding_deadline': None,
+                    'keywords_matched': [], 'keyword_location': [], 'keyword_location_tag': '',
+                    'has_attachments': False, 'has_bidding_docs': False, 'project_address': None,
+                    'attachments': [], 'source_url': ''
+                }
+                title, tag, has_attachments, has_bidding_docs = split_location_tag(line[len(info_type):])
+                current_item['title'] = title
+                current_item['keyword_location_tag'] = tag
+                current_item['has_attachments'] = has_attachments
+                current_item['has_bidding_docs'] = has_bidding_docs
+                found_new_item = True
+                break
+        if not found_new_item and current_item:
+            if line in LABEL_LINES:
+                current_item['has_attachments' if line == '附件' else 'has_bidding_docs'] = True
+            if '采购预算：' in line or '中标金额：' in line:
+                match = re.search(r'[采购预算|中标金额]：(.+?)(?:\s|$)', line)
+                if match:
+                    current_item['budget_amount'] = match.group(1).strip()
+            if '采购方式：' in line:
+                match = re.search(r'采购方式：(.+?)(?:\s|$)', line)
+                if match:
+                    current_item['procurement_type'] = match.group(1).strip()
+            if '截止时间：' in line:
+                match = re.search(r'截止时间：(.+?)(?:\s|$)', line)
+                if match:
+                    current_item['bidding_deadline'] = _legacy_parse_date(match.group(1).strip())
+            provinces = ['四川', '北京', '上海', '天津', '重庆', '河北', '山西', '辽宁', '吉林',
+                         '黑龙江', '江苏', '浙江', '安徽', '福建', '江西', '山东', '河南', '湖北',
+                         '湖南', '广东', '海南', '贵州', '云南', '陕西', '甘肃', '青海', '台湾',
+                         '内蒙古', '广西', '西藏', '宁夏', '新疆']
+            if line in provinces:
+                current_item['province'] = line
+            date_match = re.match(r'(\d{4}-\d{2}-\d{2})$', line)
+            if date_match:
+                current_item['publish_date'] = _legacy_parse_date(date_match.group(1))
+    if current_item and current_item.get('title'):
+        items.append(current_item)
+    for i, item in enumerate(items):
+        item['id'] = f"browser_{int(datetime.now().timestamp())}_{i}"
+        item['source_url'] = "https://search.bidcenter.com.cn/search?keywords=广告,标识"
+    if region_filter:
+        items = [item for item in items if item.get('province') == region_filter]
+    return items
+
+
+def best_of(func, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    content = make_page(line_count, random.Random(42))
+    source_url = "https://search.bidcenter.com.cn/search?keywords=广告,标识"
+
+    legacy_items = legacy_parse(content)
+    new_items = parse_listing(content, 'browser', source_url)
+    # 原实现的截止时间只保留日期部分
+    for item in new_items:
+        if item['bidding_deadline']:
+            item['bidding_deadline'] = item['bidding_deadline'].replace(hour=0, minute=0, second=0)
+    strip_id = lambda items: [{k: v for k, v in item.items() if k != 'id'} for item in items]
+    assert strip_id(legacy_items) == strip_id(new_items), "解析结果不一致"
+
+    legacy = best_of(lambda: legacy_parse(content))
+    new = best_of(lambda: parse_listing(content, 'browser', source_url))
+
+    print(f"{line_count} 行，{len(new_items)} 个项目（结果一致）")
+    print(f"{'实现':<16}{'耗时(ms)':>10}{'行/秒':>14}")
+    for name, seconds in (("原实现", legacy), ("listing_parser", new)):
+        print(f"{name:<16}{seconds * 1000:>10.1f}{line_count / seconds:>14,.0f}")
+    print(f"加速比：{legacy / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""关键字匹配基准测试
+
+对比逐关键字 ``keyword in text`` 循环（原实现）与 Aho-Corasick 自动机
+在 7 / 100 / 300 / 1000 个关键字下的匹配耗时，分别测试短标题和较长正文。
+match 按关键字数量和文本长度选择其中之一，其耗时应接近两者中较快的一个。
+
+运行：python benchmarks/bench_matcher.py [文本条数，默认 20000]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import random
+import time
+
+from data.aho_corasick import AhoCorasick
+from data.matcher import KeywordMatcher
+
+
+CONFIG_KEYWORDS = ["广告", "标识", "牌", "标志", "宣传", "栏", "文化"]
+
+# 生成关键字和文本使用的常用字
+COMMON_CHARS = (
+    "项目采购招标公告工程建设服务施工设计监理改造维修提升安装制作设备系统"
+    "城市道路公园学校医院社区街道乡镇县区市政府局中心管理综合智慧景观照明"
+    "绿化环境保护交通安全消防供水排水电力通信信息平台数据软件硬件运营维护"
+    "文化旅游体育广场展示标识标牌宣传栏广告导视亮化户外门头党建文明创建"
+)
+CITIES = ["成都", "绵阳", "德阳", "泸州", "乐山", "宜宾", "南充", "自贡", "广元", "眉山"]
+
+
+def make_keywords(count: int, rng: random.Random) -> list:
+    """配置中的关键字加上随机生成的 2~4 字词组"""
+    keywords = list(CONFIG_KEYWORDS[:count])
+    seen = set(keywords)
+    while len(keywords) < count:
+        word = "".join(rng.choice(COMMON_CHARS) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            keywords.append(word)
+    return keywords
+
+
+def make_texts(count: int, length: int, rng: random.Random) -> list:
+    texts = []
+    for i in range(count):
+        body = "".join(rng.choice(COMMON_CHARS) for _ in range(length))
+        texts.append(f"{rng.choice(CITIES)}市第{i}号{body}项目")
+    return texts
+
+
+def substring_loop(keywords: list, text: str) -> list:
+    """原实现"""
+    return [keyword for keyword in keywords if keyword in text]
+
+
+def timed(func, texts: list) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(11)
+
+    corpora = [
+        ("标题（约 30 字）", make_texts(count, 20, rng)),
+        ("正文（约 2000 字）", make_texts(max(count // 20, 1), 2000, rng)),
+    ]
+
+    for keyword_count in (7, 100, 300, 1000):
+        keywords = make_keywords(keyword_count, rng)
+        build_start = time.perf_counter()
+        automaton = AhoCorasick(keywords)
+        build = time.perf_counter() - build_start
+        matcher = KeywordMatcher(keywords)
+        print(f"\n关键字数: {keyword_count}（自动机构造 {build * 1000:.1f} ms）")
+
+        for label, texts in corpora:
+            engine = "自动机" if matcher._scanner.automaton_for(texts[0]) else "子串循环"
+            # 结果一致性检查
+            for text in texts[:200]:
+                expected = substring_loop(keywords, text)
+                assert matcher.match(text) == expected
+                assert [keywords[i] for i in sorted(automaton.matched_indexes(text))] == expected
+
+            legacy = timed(lambda text: substring_loop(keywords, text), texts)
+            scanned = timed(automaton.matched_indexes, texts)
+            current = timed(matcher.match, texts)
+            per_text = 1e6 / len(texts)
+            print(f"  {label} x{len(texts)}: 子串循环 {legacy * per_text:8.1f} µs/条，"
+                  f"自动机 {scanned * per_text:8.1f} µs/条（{legacy / scanned:5.2f}x），"
+                  f"match（{engine}） {current * per_text:8.1f} µs/条")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""BiddingInfo 内存占用与转换速度基准测试
+
+对比 __slots__ + 字符串驻留的 BiddingInfo 与等价的普通 dataclass：
+每条记录占用的字节数、to_dict / from_dict / from_dicts 每秒转换次数。
+
+运行：python benchmarks/bench_models.py [记录数]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import dataclasses
+import gc
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from data.models import BiddingInfo
+
+
+# 与 BiddingInfo 字段相同、但不使用 __slots__ 的普通 dataclass，作为对照
+LegacyBiddingInfo = dataclasses.make_dataclass(
+    "LegacyBiddingInfo",
+    [(f.name, f.type, f) for f in dataclasses.fields(BiddingInfo)],
+)
+
+CITIES = ["成都", "绵阳", "德阳", "泸州", "乐山", "宜宾", "南充", "自贡", "广元", "眉山"]
+INFO_TYPES = ["招标公告", "中标结果", "招标变更", "采购信息"]
+PROCUREMENT_TYPES = ["公开招标", "询比", "竞争性磋商", "比选", "谈判"]
+KEYWORDS = ["广告", "标识", "牌", "标志", "宣传", "栏", "文化"]
+
+
+def make_records_json(count: int) -> str:
+    """生成模拟 JSON 文本（记录格式与存储文件一致）"""
+    rng = random.Random(42)
+    base = datetime(2026, 1, 1)
+    crawled = datetime(2026, 2, 2, 8, 0, 0)
+    records = []
+    for i in range(count):
+        city = rng.choice(CITIES)
+        records.append({
+            "id": f"browser_1738491312_{i}",
+            "title": f"{city}市第{i}号标识标牌采购项目",
+            "info_type": rng.choice(INFO_TYPES),
+            "publish_date": (base + timedelta(days=rng.randrange(90))).isoformat(),
+            "province": "四川",
+            "city": city,
+            "district": None,
+            "owner_unit": f"{city}市文化旅游局",
+            "budget_amount": f"{rng.randrange(10, 500)}万元",
+            "procurement_type": rng.choice(PROCUREMENT_TYPES),
+            "bidding_deadline": (base + timedelta(days=rng.randrange(90, 120), hours=17)).isoformat(),
+            "keywords_matched": rng.sample(KEYWORDS, 2),
+            "keyword_location": ["正文"],
+            "project_address": f"四川省{city}市",
+            "attachments": [],
+            "has_attachments": False,
+            "has_bidding_docs": False,
+            "source_url": "https://search.bidcenter.com.cn/search",
+            "detail_url": "https://search.bidcenter.com.cn/search",
+            # 与真实数据一样精确到微秒，每条不同
+            "crawled_at": (crawled + timedelta(microseconds=i * 137)).isoformat(),
+        })
+    return json.dumps(records, ensure_ascii=False)
+
+
+def measure_memory(factory, text: str) -> float:
+    """从 JSON 文本构造全部对象，释放原始字典后返回每条记录的平均常驻字节数"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    records = json.loads(text)
+    objects = [factory(record) for record in records]
+    del records
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def legacy_from_dict(data):
+    for name in ("publish_date", "bidding_deadline", "crawled_at"):
+        if data.get(name):
+            data[name] = datetime.fromisoformat(data[name])
+    return LegacyBiddingInfo(**data)
+
+
+def rate(func, items) -> float:
+    """返回每秒处理条数"""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    text = make_records_json(count)
+    records = json.loads(text)
+    print(f"记录数: {count}")
+
+    legacy_bytes = measure_memory(legacy_from_dict, text)
+    slotted_bytes = measure_memory(BiddingInfo.from_dict, text)
+    print(f"\n每条记录内存占用")
+    print(f"  普通 dataclass:        {legacy_bytes:8.0f} B")
+    print(f"  __slots__ + 字符串驻留: {slotted_bytes:8.0f} B  ({slotted_bytes / legacy_bytes:.0%})")
+
+    legacy_items = [legacy_from_dict(dict(r)) for r in records]
+    items = [BiddingInfo.from_dict(dict(r)) for r in records]
+
+    asdict_rate = rate(dataclasses.asdict, legacy_items)
+    to_dict_rate = rate(BiddingInfo.to_dict, items)
+    print(f"\nto_dict 每秒转换次数")
+    print(f"  dataclasses.asdict:    {asdict_rate:10.0f}")
+    print(f"  BiddingInfo.to_dict:   {to_dict_rate:10.0f}  ({to_dict_rate / asdict_rate:.1f}x)")
+
+    copies = [dict(r) for r in records]
+    from_dict_rate = rate(BiddingInfo.from_dict, copies)
+    print(f"\nfrom_dict 每秒转换次数")
+    print(f"  BiddingInfo.from_dict: {from_dict_rate:10.0f}")
+
+    copies = [dict(r) for r in records]
+    start = time.perf_counter()
+    BiddingInfo.from_dicts(copies)
+    from_dicts_rate = count / (time.perf_counter() - start)
+    print(f"  BiddingInfo.from_dicts:{from_dicts_rate:10.0f}  ({from_dicts_rate / from_dict_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""列式快照加载基准测试（需要 pyarrow 和 pandas）
+
+生成同一批模拟数据的 JSON 数据文件（JSONStorage 格式）和列式快照，对比界面加载数据的方式：
+
+- 原界面：json.load 整个数据文件后 pd.DataFrame（引入快照前 src/ui/app.py 的做法）
+- JSONStorage：JSONStorage.load() 得到 BiddingInfo 列表，再 to_dict 转为 DataFrame
+- 早期快照读取：本系列最初的 load_snapshot（pandas 2.x 下字符串列为 Python 对象、
+  列表列逐行转换为 list），只用来单独看保留 Arrow 存储的效果
+- 当前快照读取：load_snapshot 内存映射读取界面所需列，字符串和列表列保持 Arrow 存储
+
+记录加载耗时、展示时连接关键字列的耗时、DataFrame 占用和进程常驻内存增量。
+每种方式在单独的子进程中测量，互不影响。
+
+运行：python benchmarks/bench_snapshot.py [记录数，默认 1000000]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import json
+import multiprocessing
+import os
+import random
+import resource
+import tempfile
+import textwrap
+import time
+from datetime import datetime, timedelta
+
+from data.models import BiddingInfo
+from data.snapshot import export_snapshot, join_list_column, load_snapshot
+from data.storage import JSONStorage
+
+# 与 src/ui/app.py 的 UI_COLUMNS 相同
+UI_COLUMNS = [
+    'title', 'publish_date', 'info_type', 'city', 'owner_unit', 'budget_amount',
+    'procurement_type', 'bidding_deadline', 'keywords_matched', 'keyword_location_tag',
+    'project_address', 'detail_url',
+]
+
+CITIES = ["成都", "绵阳", "德阳", "泸州", "乐山", "宜宾", "南充", "自贡", "广元", "眉山"]
+INFO_TYPES = ["招标公告", "中标结果", "招标变更", "采购信息"]
+KEYWORDS = ["广告", "标识", "牌", "标志", "宣传", "栏", "文化"]
+
+
+def iter_records(count: int):
+    """逐条生成模拟记录（不在内存中保留整个列表）"""
+    rng = random.Random(8)
+    base = datetime(2026, 1, 1)
+    for i in range(count):
+        city = rng.choice(CITIES)
+        yield {
+            "id": str(10000000 + i),
+            "title": f"{city}市第{i}号标识标牌及宣传栏制作安装采购项目",
+            "info_type": rng.choice(INFO_TYPES),
+            "publish_date": (base + timedelta(days=rng.randrange(90))).isoformat(),
+            "province": "四川",
+            "city": city,
+            "owner_unit": f"{city}市文化广电旅游局",
+            "budget_amount": f"{rng.randrange(10, 500)}万元",
+            "procurement_type": "公开招标",
+            "bidding_deadline": (base + timedelta(days=rng.randrange(90, 120), hours=17)).isoformat(),
+            "keywords_matched": rng.sample(KEYWORDS, rng.randint(1, 3)),
+            "keyword_location": ["标题"],
+            "keyword_location_tag": rng.choice(["", "", "广告,标识等在内容中"]),
+            "project_address": f"四川省{city}市",
+            "detail_url": f"https://www.bidcenter.com.cn/news-{10000000 + i}-1.html",
+        }
+
+
+def iter_full_records(count: int):
+    """模拟记录补全为存储中的完整字段（与 BiddingInfo.to_dict 相同）"""
+    for record in iter_records(count):
+        yield BiddingInfo.from_dict(record).to_dict()
+
+
+def write_json(records, path: str) -> None:
+    """逐条写入与 JSONStorage 相同格式（indent=2）的数据文件，不在内存中保留整个列表"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "metadata": {},\n  "data": [\n')
+        for index, record in enumerate(records):
+            if index:
+                f.write(',\n')
+            f.write(textwrap.indent(json.dumps(record, ensure_ascii=False, indent=2), '    '))
+        f.write('\n  ]\n}')
+
+
+def _object_strings(df):
+    """
+    字符串列转换为 object 列
+
+    pandas 2.x 构造 DataFrame / to_pandas 时字符串列为 Python str 对象（object 列）；pandas 3
+    默认改用 Arrow 存储的 str 列，对比的各种原有方式都经过这一步，以复现 requirements.txt
+    允许的 pandas 2.x 结果（pandas 2.x 下不做任何转换）。
+    """
+    import pandas as pd
+    for name in df.columns:
+        if pd.api.types.is_string_dtype(df[name].dtype) and not isinstance(df[name].dtype, pd.CategoricalDtype):
+            df[name] = df[name].astype(object)
+    return df
+
+
+def json_load(path: str):
+    """原界面：json.load 整个数据文件后构造 DataFrame"""
+    import pandas as pd
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return _object_strings(pd.DataFrame(data['data']))
+
+
+def storage_load(path: str):
+    """JSONStorage.load() 后转为 DataFrame"""
+    import pandas as pd
+    items, _ = JSONStorage(path).load()
+    return _object_strings(pd.DataFrame([item.to_dict() for item in items]))
+
+
+def legacy_load(path: str, columns):
+    """本系列最初的 load_snapshot：默认 to_pandas，列表列逐行转换为 Python list"""
+    import pyarrow.feather as feather
+    df = _object_strings(feather.read_table(path, columns=columns, memory_map=True).to_pandas())
+    for name in ('keywords_matched', 'keyword_location'):
+        if name in df.columns:
+            df[name] = [list(value) if value is not None else [] for value in df[name]]
+    return df
+
+
+def _rss_bytes() -> int:
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def measure(mode: str, json_path: str, snapshot_path: str):
+    """子进程中加载一次，返回 (加载秒数, 连接关键字列秒数, DataFrame 字节数, 常驻内存峰值增量)"""
+    import pandas  # noqa: F401  导入开销不计入加载时间
+    import pyarrow  # noqa: F401
+    before = _rss_bytes()
+    start = time.perf_counter()
+    if mode == 'json':
+        df = json_load(json_path)
+    elif mode == 'storage':
+        df = storage_load(json_path)
+    elif mode == 'legacy':
+        df = legacy_load(snapshot_path, UI_COLUMNS)
+    else:
+        df = load_snapshot(snapshot_path, UI_COLUMNS)
+    seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if mode == 'arrow':
+        join_list_column(df['keywords_matched'])
+    else:
+        # 原界面的写法
+        df['keywords_matched'].apply(lambda x: ', '.join(x) if isinstance(x, list) else str(x))
+    join_seconds = time.perf_counter() - start
+
+    frame_bytes = int(df.memory_usage(deep=True).sum())
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return seconds, join_seconds, frame_bytes, peak - before
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    context = multiprocessing.get_context('fork')
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_path = os.path.join(temp_dir, "bidding_data.json")
+        snapshot_path = os.path.join(temp_dir, "bidding_data.feather")
+        write_json(iter_full_records(count), json_path)
+        start = time.perf_counter()
+        export_snapshot(iter_full_records(count), snapshot_path)
+        print(f"记录数: {count}，数据文件 {os.path.getsize(json_path) / 1024 ** 2:.0f} MB，"
+              f"导出快照 {time.perf_counter() - start:.1f} 秒，快照 {os.path.getsize(snapshot_path) / 1024 ** 2:.0f} MB")
+
+        results = {}
+        for mode in ('json', 'storage', 'legacy', 'arrow'):
+            with context.Pool(1) as pool:
+                results[mode] = pool.apply(measure, (mode, json_path, snapshot_path))
+
+    labels = {
+        'json': '原界面（json.load + DataFrame，全部列）',
+        'storage': 'JSONStorage.load() + DataFrame（全部列）',
+        'legacy': '早期快照读取（界面所需列，Python 对象）',
+        'arrow': '当前快照读取（界面所需列，Arrow 存储）',
+    }
+    for mode, (seconds, join_seconds, frame_bytes, rss) in results.items():
+        print(f"  {labels[mode]}: 加载 {seconds:6.2f} 秒，连接关键字 {join_seconds:5.2f} 秒，"
+              f"DataFrame {frame_bytes / 1024 ** 2:7.0f} MB，常驻内存增量 {rss / 1024 ** 2:7.0f} MB")
+    arrow = results['arrow']
+    print(f"  加载加速比（相对原界面）：{results['json'][0] / arrow[0]:.1f}x，"
+          f"（相对 JSONStorage）：{results['storage'][0] / arrow[0]:.1f}x，"
+          f"（相对早期快照读取）：{results['legacy'][0] / arrow[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""JSONStorage.load 日期解码基准测试
+
+生成模拟数据文件，对比逐条 datetime.fromisoformat（原实现）与
+JSONStorage.load（批量缓存解码、加载期间暂停循环垃圾回收）的加载耗时。
+
+运行：python benchmarks/bench_storage_load.py [记录数，默认 500000]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from data.models import BiddingInfo
+from data.storage import JSONStorage
+
+
+CITIES = ["成都", "绵阳", "德阳", "泸州", "乐山", "宜宾", "南充", "自贡", "广元", "眉山"]
+
+
+def write_dataset(path: str, count: int) -> None:
+    """写入模拟数据：发布日期分布在 90 天内，抓取时间按批次聚集"""
+    rng = random.Random(7)
+    base = datetime(2026, 1, 1)
+    runs = [base + timedelta(days=day, hours=8) for day in range(90)]
+    records = []
+    for i in range(count):
+        city = rng.choice(CITIES)
+        run = rng.choice(runs)
+        records.append({
+            "id": f"browser_{int(run.timestamp())}_{i}",
+            "title": f"{city}市第{i}号标识标牌采购项目",
+            "info_type": "招标公告",
+            "publish_date": (base + timedelta(days=rng.randrange(90))).isoformat(),
+            "province": "四川",
+            "city": city,
+            "district": None,
+            "owner_unit": None,
+            "budget_amount": f"{rng.randrange(10, 500)}万元",
+            "procurement_type": "公开招标",
+            "bidding_deadline": (base + timedelta(days=rng.randrange(90, 120), hours=17)).isoformat(),
+            "keywords_matched": ["标识", "牌"],
+            "keyword_location": ["标题"],
+            "project_address": None,
+            "attachments": [],
+            "has_attachments": False,
+            "has_bidding_docs": False,
+            "source_url": "https://search.bidcenter.com.cn/search",
+            "detail_url": "https://search.bidcenter.com.cn/search",
+            "crawled_at": (run + timedelta(seconds=i % 120)).isoformat(),
+        })
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"metadata": {"total_count": count}, "data": records}, f, ensure_ascii=False, indent=2)
+
+
+def legacy_load(path: str):
+    """原实现：json.load 后逐条三次 datetime.fromisoformat"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    items = []
+    for record in data['data']:
+        record['publish_date'] = datetime.fromisoformat(record['publish_date'])
+        if record.get('bidding_deadline'):
+            record['bidding_deadline'] = datetime.fromisoformat(record['bidding_deadline'])
+        record['crawled_at'] = datetime.fromisoformat(record['crawled_at'])
+        items.append(BiddingInfo(**record))
+    return items
+
+
+def timed(func, *args) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    del result
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bidding_data.json")
+        write_dataset(path, count)
+        print(f"记录数: {count}，文件大小: {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+
+        json_only = timed(lambda p: json.load(open(p, 'r', encoding='utf-8')), path)
+        legacy = timed(legacy_load, path)
+        storage = JSONStorage(path)
+        current = timed(storage.load)
+
+        print(f"\n  json.load（仅解析）:          {json_only:6.2f} s")
+        print(f"  逐条 fromisoformat（原实现）:  {legacy:6.2f} s")
+        print(f"  JSONStorage.load（当前实现）:  {current:6.2f} s")
+        print(f"\n  整体提速: {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
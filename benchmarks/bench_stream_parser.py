@@ -0,0 +1,77 @@
+"""流式解析基准测试
+
+把生成的页面文本写入临时文件，对比两种读取方式：
+
+- 整体读取：f.read() 后 parse_listing（原 parse_from_file 的做法）
+- 流式读取：iter_listing_items 逐行读取文件，产出一个项目处理一个
+
+分别统计总耗时、产出第一个项目的耗时和 tracemalloc 记录的内存峰值。
+下游只统计数量，不保留项目，模拟边解析边入库。
+
+运行：python benchmarks/bench_stream_parser.py [页面行数，默认 200000]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from bench_listing_parser import make_page
+from crawler.listing_parser import iter_listing_items, parse_listing
+
+
+SOURCE_URL = "https://search.bidcenter.com.cn/search?keywords=广告,标识"
+
+
+def read_whole(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    yield from parse_listing(content, 'browser', SOURCE_URL)
+
+
+def read_streaming(path: str):
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from iter_listing_items(f, 'browser', SOURCE_URL)
+
+
+def measure(items_factory, path: str):
+    """返回 (项目数, 总耗时, 首个项目耗时, 内存峰值字节)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in items_factory(path):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, total, first, peak
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(make_page(line_count, random.Random(42)))
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        print(f"{line_count} 行，文件 {size_mb:.1f} MB（tracemalloc 开启，耗时偏高）")
+        print(f"{'方式':<10}{'项目数':>10}{'总耗时(s)':>12}{'首个项目(ms)':>14}{'内存峰值(MB)':>14}")
+        for name, factory in (("整体读取", read_whole), ("流式读取", read_streaming)):
+            count, total, first, peak = measure(factory, path)
+            print(f"{name:<10}{count:>10}{total:>12.2f}{first * 1000:>14.1f}{peak / 1024 / 1024:>14.1f}")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""全文索引查询基准测试
+
+对比逐条 ``query in title`` 扫描（界面"标题关键字"过滤的做法）与倒排索引查询的耗时。
+
+运行：python benchmarks/bench_text_index.py [记录数，默认 200000]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import random
+import time
+from datetime import datetime
+
+from data.models import BiddingInfo
+from data.text_index import TextIndex
+
+
+CITIES = ["成都", "绵阳", "德阳", "泸州", "乐山", "宜宾", "南充", "自贡", "广元", "眉山"]
+SUBJECTS = ["道路改造", "学校食堂", "景区标识标牌", "办公家具", "宣传栏制作", "LED显示屏",
+            "文化墙彩绘", "医疗设备", "绿化养护", "物业管理", "户外广告位租赁", "监控系统"]
+QUERIES = ["标识标牌", "宣传栏", "led", "文化墙", "成都", "物业管理服务", "不存在的项目"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(3)
+    items = [
+        BiddingInfo(
+            id=str(i),
+            title=f"{rng.choice(CITIES)}市{rng.choice(SUBJECTS)}{rng.choice(['采购', '项目', '服务'])}第{i}标段",
+            info_type="招标公告",
+            publish_date=datetime(2026, 1, 1),
+            province="四川",
+        )
+        for i in range(count)
+    ]
+    titles = [item.title for item in items]
+
+    start = time.perf_counter()
+    index = TextIndex()
+    index.add(items)
+    print(f"记录数: {count}，建索引 {time.perf_counter() - start:.2f} s")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        expected = [item.id for item, title in zip(items, titles) if query in title.lower()]
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = index.search(query, fields=("title",))
+        indexed = time.perf_counter() - start
+
+        assert found == expected
+        print(f"  {query:<8} 命中 {len(found):>6}：逐条扫描 {scan * 1000:7.1f} ms，索引 {indexed * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
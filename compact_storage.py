@@ -0,0 +1,54 @@
+"""合并追加式分段存储
+
+将 storage.type 为 segment 时产生的 JSONL 分段合并进快照文件。
+建议在每日增量抓取之后或分段数量较多时运行。
+"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import yaml
+import structlog
+
+from data.storage import create_storage
+from data.segment_storage import SegmentLogStorage
+
+# 配置日志
+structlog.configure(
+    processors=[
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.dev.ConsoleRenderer()
+    ]
+)
+
+logger = structlog.get_logger()
+
+
+def load_config():
+    """加载配置文件"""
+    with open('config.yaml', 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def main():
+    """主函数"""
+    config = load_config()
+    storage = create_storage(config['storage'])
+
+    if not isinstance(storage, SegmentLogStorage):
+        print(f"\n⚠️  当前存储类型为 {config['storage'].get('type', 'json')}，无需合并")
+        return
+
+    segments = storage.segment_count()
+    if segments == 0:
+        print("\n✅ 没有待合并的分段")
+        return
+
+    logger.info("compact.start", segments=segments)
+    total = storage.compact()
+    logger.info("compact.complete", segments=segments, total=total)
+    print(f"\n✅ 已合并 {segments} 个分段，快照共 {total} 条数据")
+
+
+if __name__ == "__main__":
+    main()
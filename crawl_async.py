@@ -0,0 +1,107 @@
+"""异步并行抓取
+
+每个关键字×地区组合作为一个搜索，读取第一页的分页栏后抓取其余结果页
+（最多 crawler.search.max_pages 页），全部页面按 crawler.browser.concurrency 并行抓取，
+同一主机的请求仍按 anti_crawl 配置的间隔发出。结果合并去重后匹配关键字并写入存储。
+
+    python crawl_async.py [地区，多个用逗号分隔，默认 config.yaml 中的地区]
+
+按 Ctrl+C 会取消未完成的搜索并关闭浏览器。
+"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import asyncio
+import time
+from datetime import datetime
+
+import yaml
+import structlog
+
+from crawler.async_search_crawler import AsyncSearchCrawler
+from crawler.resource_filter import create_resource_filter
+from crawler.search_crawler import CrawlerConfig
+from data.storage import create_storage
+from data.models import BiddingInfo
+from data.matcher import KeywordMatcher
+
+# 配置日志
+structlog.configure(
+    processors=[
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.dev.ConsoleRenderer()
+    ]
+)
+
+logger = structlog.get_logger()
+
+
+def load_config():
+    """加载配置文件"""
+    with open('config.yaml', 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+async def crawl(config, regions):
+    """并行执行全部 关键字×地区 搜索"""
+    anti_crawl = config['crawler']['anti_crawl']
+    browser_config = config['crawler'].get('browser', {})
+    crawler_config = CrawlerConfig(
+        min_delay=anti_crawl['min_delay'],
+        max_delay=anti_crawl['max_delay'],
+        max_retries=anti_crawl['max_retries'],
+        max_pages=config['crawler']['search'].get('max_pages', 50)
+    )
+    keywords = config['crawler']['keywords']
+    queries = [([keyword], region) for region in regions for keyword in keywords]
+
+    async with AsyncSearchCrawler(
+        keywords,
+        crawler_config,
+        concurrency=browser_config.get('concurrency', 4),
+        per_host=anti_crawl.get('per_host_concurrency', 1),
+        resource_filter=create_resource_filter(config['crawler'].get('resource_filter'))
+    ) as crawler:
+        return await crawler.search_many(queries)
+
+
+def main():
+    """主函数"""
+    config = load_config()
+    if len(sys.argv) > 1:
+        regions = [region for region in sys.argv[1].split(',') if region]
+    else:
+        regions = [config['crawler']['search']['region']]
+
+    start = time.perf_counter()
+    results = asyncio.run(crawl(config, regions))
+    elapsed = time.perf_counter() - start
+
+    matcher = KeywordMatcher(config['crawler'].get('match_rules') or config['crawler']['keywords'])
+    bidding_items = [BiddingInfo(**item) for item in matcher.annotate_items(results)]
+    logger.info("crawl.complete", regions=regions, count=len(bidding_items), seconds=round(elapsed, 2))
+    print(f"\n✅ 抓取到 {len(bidding_items)} 条项目（{elapsed:.1f} 秒）")
+
+    if not bidding_items:
+        return
+
+    storage = create_storage(config['storage'])
+    if storage.is_first_run():
+        metadata = {
+            "last_full_crawl": datetime.now().isoformat(),
+            "total_count": len(bidding_items),
+            "keywords": config['crawler']['keywords'],
+            "region": ",".join(regions)
+        }
+        storage.save(bidding_items, metadata)
+        logger.info("data.saved", mode="full", count=len(bidding_items))
+        print(f"✅ 已保存 {len(bidding_items)} 条数据（全量）")
+    else:
+        added_count = storage.append(bidding_items)
+        logger.info("data.appended", count=added_count)
+        print(f"✅ 已追加 {added_count} 条新数据")
+
+
+if __name__ == "__main__":
+    main()
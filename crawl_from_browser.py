@@ -13,14 +13,18 @@
 import sys
 sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
 
+import json
+import os
 import yaml
 import structlog
 from datetime import datetime
 
 from crawler.browser_crawler import BrowserCrawler
-from data.storage import JSONStorage
+from data.storage import create_storage
 from data.models import BiddingInfo
 from data.matcher import KeywordMatcher
+from data.subscriptions import SubscriptionMatcher
+from data.stats import summarize
 
 # 配置日志
 structlog.configure(
@@ -40,6 +44,29 @@ def load_config():
         return yaml.safe_load(f)
 
 
+def save_subscription_hits(config, bidding_items):
+    """按订阅方分发项目，打印命中数量并写入命中结果文件"""
+    subscriptions = SubscriptionMatcher(config['subscriptions'])
+    routed = subscriptions.route(bidding_items)
+    
+    print("\n👥 订阅方命中：")
+    for name, items in routed.items():
+        print(f"  {name}: {len(items)} 条")
+    
+    path = config.get('subscription_hits_path', './data/subscription_hits.json')
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "generated_at": datetime.now().isoformat(),
+            "hits": {name: [item.id for item in items] for name, items in routed.items()},
+        }, f, ensure_ascii=False, indent=2)
+    
+    logger.info("subscriptions.routed", path=path,
+                counts={name: len(items) for name, items in routed.items()})
+
+
 def main():
     """主函数"""
     logger.info("tool.start", message="从浏览器内容抓取数据")
@@ -49,7 +76,7 @@ def main():
     
     # 初始化爬虫
     crawler = BrowserCrawler(keywords=config['crawler']['keywords'])
-    matcher = KeywordMatcher(config['crawler']['keywords'])
+    matcher = KeywordMatcher(config['crawler'].get('match_rules') or config['crawler']['keywords'])
     
     # 检查是否有浏览器内容文件
     import os
@@ -60,11 +87,13 @@ def main():
         print(f"\n📄 发现浏览器内容文件: {content_file}")
         print("正在解析...")
         
-        # 从文件解析
-        results = crawler.parse_from_file(
+        # 逐行读取文件解析，每解析完一个项目就匹配关键字、标注位置并转换为 BiddingInfo 对象
+        bidding_items = []
+        for item in crawler.iter_parse_file(
             content_file,
             region_filter=config['crawler']['search']['region']
-        )
+        ):
+            bidding_items.append(BiddingInfo(**matcher.annotate(item)))
     else:
         logger.info("file.not_found", message="未找到浏览器内容文件")
         print(f"\n❌ 未找到文件: {content_file}")
@@ -77,48 +106,31 @@ def main():
         print("6. 再次运行此脚本")
         return
     
-    logger.info("parse.results", count=len(results))
+    logger.info("parse.results", count=len(bidding_items))
     
-    if not results:
+    if not bidding_items:
         logger.warning("no_results", message="未解析到数据")
         print("\n⚠️  未解析到数据，请检查文件内容格式")
         return
     
-    # 转换为 BiddingInfo 对象并匹配关键字
-    bidding_items = []
-    for item in results:
-        # 匹配关键字
-        text = f"{item['title']}"
-        matched_keywords = matcher.match(text)
-        item['keywords_matched'] = matched_keywords
-        
-        # 创建 BiddingInfo 对象
-        bidding_info = BiddingInfo(**item)
-        bidding_items.append(bidding_info)
+    # 分发给各订阅方
+    if config.get('subscriptions'):
+        save_subscription_hits(config, bidding_items)
     
     # 显示统计信息
     print(f"\n{'='*60}")
     print(f"✅ 成功解析 {len(bidding_items)} 条项目")
     print(f"{'='*60}")
     
-    # 按地区统计
-    region_stats = {}
-    for item in bidding_items:
-        region = item.province or "未知"
-        region_stats[region] = region_stats.get(region, 0) + 1
+    # 统计分布
+    stats = summarize(bidding_items)
     
     print("\n📊 地区分布：")
-    for region, count in sorted(region_stats.items(), key=lambda x: x[1], reverse=True):
+    for region, count in stats['by_province'].items():
         print(f"  {region}: {count} 条")
     
-    # 按信息类型统计
-    type_stats = {}
-    for item in bidding_items:
-        info_type = item.info_type or "未知"
-        type_stats[info_type] = type_stats.get(info_type, 0) + 1
-    
     print("\n📋 信息类型分布：")
-    for info_type, count in sorted(type_stats.items(), key=lambda x: x[1], reverse=True):
+    for info_type, count in stats['by_info_type'].items():
         print(f"  {info_type}: {count} 条")
     
     # 显示前5条结果
@@ -136,7 +148,7 @@ def main():
     save = input("是否保存到数据库？(y/n): ").strip().lower()
     
     if save == 'y':
-        storage = JSONStorage(config['storage']['json_path'])
+        storage = create_storage(config['storage'])
         
         # 检查是否首次运行
         is_first = storage.is_first_run()
@@ -0,0 +1,37 @@
+"""导出列式快照供 Streamlit 界面加载
+
+读取界面使用的数据文件（优先 bidding_data_fixed.json），流式解析后写入
+data/bidding_data.feather。每次数据更新后运行一次即可。
+"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import time
+from pathlib import Path
+
+from data.json_stream import iter_json_array
+from data.snapshot import export_snapshot
+
+
+def main():
+    """主函数"""
+    data_dir = Path(__file__).parent / "data"
+    fixed_file = data_dir / "bidding_data_fixed.json"
+    original_file = data_dir / "bidding_data.json"
+    snapshot_file = data_dir / "bidding_data.feather"
+    
+    data_file = fixed_file if fixed_file.exists() else original_file
+    
+    if not data_file.exists():
+        print(f"\n❌ 未找到数据文件: {data_file}")
+        return
+    
+    start = time.perf_counter()
+    count = export_snapshot(iter_json_array(str(data_file)), str(snapshot_file))
+    elapsed = time.perf_counter() - start
+    
+    print(f"\n✅ 已导出 {count} 条数据到 {snapshot_file}（{elapsed:.2f} 秒）")
+
+
+if __name__ == "__main__":
+    main()
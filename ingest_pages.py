@@ -0,0 +1,112 @@
+"""批量导入保存的搜索结果页
+
+把一个目录（或通配符匹配到的多个文件）中的结果页文本并行解析，合并去重后
+匹配关键字并写入存储，同时输出每个文件的解析速度：
+
+    python ingest_pages.py ./pages [进程数，默认 CPU 核数]
+    python ingest_pages.py "./pages/2026-02-*.txt" 4
+"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import time
+from datetime import datetime
+
+import yaml
+import structlog
+
+from crawler.batch_parser import expand_paths, parse_files
+from data.storage import create_storage
+from data.models import BiddingInfo
+from data.matcher import KeywordMatcher
+
+# 配置日志
+structlog.configure(
+    processors=[
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.dev.ConsoleRenderer()
+    ]
+)
+
+logger = structlog.get_logger()
+
+
+def load_config():
+    """加载配置文件"""
+    with open('config.yaml', 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def print_file_stats(stats):
+    """打印每个文件的解析统计"""
+    print(f"\n{'文件':<40}{'项目':>8}{'新增':>8}{'行数':>10}{'MB':>8}{'秒':>8}{'行/秒':>12}")
+    for entry in stats:
+        seconds = entry['seconds'] or 1e-9
+        print(f"{os.path.basename(entry['path']):<40}{entry['items']:>8}{entry['new_items']:>8}"
+              f"{entry['lines']:>10}{entry['bytes'] / 1024 / 1024:>8.2f}{entry['seconds']:>8.2f}"
+              f"{entry['lines'] / seconds:>12,.0f}")
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+    pattern = sys.argv[1]
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    config = load_config()
+    paths = expand_paths(pattern)
+    if not paths:
+        print(f"\n❌ 没有找到文件: {pattern}")
+        return
+
+    keywords = config['crawler']['keywords']
+    matcher = KeywordMatcher(config['crawler'].get('match_rules') or keywords)
+    source_url = f"https://search.bidcenter.com.cn/search?keywords={','.join(keywords)}"
+
+    logger.info("ingest.start", files=len(paths), processes=processes)
+    start = time.perf_counter()
+    results, stats = parse_files(
+        paths,
+        'browser',
+        source_url,
+        region_filter=config['crawler']['search']['region'],
+        processes=processes
+    )
+    bidding_items = [BiddingInfo(**item) for item in matcher.annotate_items(results)]
+    elapsed = time.perf_counter() - start
+
+    print_file_stats(stats)
+    total_lines = sum(entry['lines'] for entry in stats)
+    total_items = sum(entry['items'] for entry in stats)
+    print(f"\n共 {len(paths)} 个文件，{total_lines} 行，解析 {total_items} 条，"
+          f"去重后 {len(bidding_items)} 条，耗时 {elapsed:.2f} 秒（{total_lines / max(elapsed, 1e-9):,.0f} 行/秒）")
+    logger.info("ingest.parsed", files=len(paths), lines=total_lines, items=total_items,
+                unique=len(bidding_items), seconds=round(elapsed, 2))
+
+    if not bidding_items:
+        print("\n⚠️  未解析到数据，请检查文件内容格式")
+        return
+
+    storage = create_storage(config['storage'])
+    if storage.is_first_run():
+        metadata = {
+            "last_full_crawl": datetime.now().isoformat(),
+            "total_count": len(bidding_items),
+            "keywords": keywords,
+            "region": config['crawler']['search']['region']
+        }
+        storage.save(bidding_items, metadata)
+        logger.info("data.saved", mode="full", count=len(bidding_items))
+        print(f"\n✅ 已保存 {len(bidding_items)} 条数据（全量）")
+    else:
+        added_count = storage.append(bidding_items)
+        logger.info("data.appended", count=added_count)
+        print(f"\n✅ 已追加 {added_count} 条新数据")
+
+
+if __name__ == "__main__":
+    main()
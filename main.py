@@ -7,7 +7,7 @@ import structlog
 from datetime import datetime
 
 from crawler.search_crawler import SearchCrawler, CrawlerConfig
-from data.storage import JSONStorage
+from data.storage import create_storage
 from data.models import BiddingInfo
 from data.matcher import KeywordMatcher
 
@@ -130,7 +130,7 @@ def main():
     config = load_config()
     
     # 初始化存储
-    storage = JSONStorage(config['storage']['json_path'])
+    storage = create_storage(config['storage'])
     
     # 检查是否首次运行
     is_first_run = storage.is_first_run()
@@ -159,10 +159,10 @@ def main():
         print(f"   streamlit run src/ui/app.py")
     else:
         logger.info("data_exists", message="数据文件已存在")
-        items, metadata = storage.load()
+        metadata = storage.load_metadata()
         print(f"\n📊 当前数据统计:")
-        print(f"   总项目数: {len(items)}")
-        print(f"   上次更新: {metadata.get('last_full_crawl', '未知')}")
+        print(f"   总项目数: {metadata.get('total_count', '未知')}")
+        print(f"   上次更新: {metadata.get('last_incremental_crawl') or metadata.get('last_full_crawl', '未知')}")
         print(f"\n🚀 运行 Streamlit 查看数据:")
         print(f"   cd /home/ubuntu/bidding-crawler")
         print(f"   streamlit run src/ui/app.py")
@@ -2,6 +2,9 @@
 # -*- coding: utf-8 -*-
 """
 重新生成数据，为标题添加原始的位置标注
+
+新抓取的数据在解析时已保留 keyword_location_tag（见 src/data/keyword_location.py），
+此脚本只处理旧版本抓取、缺少该字段的记录。
 """
 
 import json
@@ -43,6 +46,8 @@ def main():
     # 更新每条数据
     updated_count = 0
     for item in data:
+        if 'keyword_location_tag' in item:
+            continue
         original_title = item['title']
         
         # 检查标题中是否直接包含关键字
@@ -68,6 +73,10 @@ def main():
         else:
             print(f"✓ {original_title[:50]}... [添加标注]")
     
+    if updated_count == 0:
+        print("\n✅ 所有记录都已有位置标注，无需更新")
+        return
+    
     # 保存更新后的数据
     with open(data_file, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,68 @@
+"""关键字列表变更后重新匹配全部历史数据
+
+按 config.yaml 中当前的关键字重新计算每条项目的 keywords_matched 并写回存储。
+数据量较大时使用多进程：python rematch_keywords.py [进程数，默认 CPU 核数]
+"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import time
+
+import yaml
+import structlog
+
+from data.storage import create_storage
+from data.matcher import KeywordMatcher
+
+# 配置日志
+structlog.configure(
+    processors=[
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.dev.ConsoleRenderer()
+    ]
+)
+
+logger = structlog.get_logger()
+
+
+def load_config():
+    """加载配置文件"""
+    with open('config.yaml', 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def main():
+    """主函数"""
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+
+    config = load_config()
+    storage = create_storage(config['storage'])
+    matcher = KeywordMatcher(config['crawler'].get('match_rules') or config['crawler']['keywords'])
+
+    items, metadata = storage.load()
+    if not items:
+        print("\n⚠️  存储中没有数据")
+        return
+
+    logger.info("rematch.start", count=len(items), keywords=len(matcher.keywords), processes=processes)
+    start = time.perf_counter()
+
+    matched_lists = matcher.match_items(items, processes=processes)
+    changed = 0
+    for item, matched_keywords in zip(items, matched_lists):
+        if matched_keywords != item.keywords_matched:
+            item.keywords_matched = matched_keywords
+            changed += 1
+    elapsed = time.perf_counter() - start
+
+    if changed:
+        storage.save(items, metadata)
+
+    logger.info("rematch.complete", count=len(items), changed=changed, seconds=round(elapsed, 2))
+    print(f"\n✅ 已重新匹配 {len(items)} 条数据，{changed} 条的匹配结果发生变化（{elapsed:.2f} 秒）")
+
+
+if __name__ == "__main__":
+    main()
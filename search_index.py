@@ -0,0 +1,55 @@
+"""全文查找项目
+
+在标题、业主单位和项目地址中查找包含查询串的项目（需要在 config.yaml 中设置
+storage.text_index: true，首次运行时自动建立索引）。
+
+运行：python search_index.py <查询串> [字段，如 title / owner_unit / project_address]
+"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import time
+
+import yaml
+
+from data.storage import create_storage
+from data.text_index import INDEXED_FIELDS
+
+
+def load_config():
+    """加载配置文件"""
+    with open('config.yaml', 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    query = sys.argv[1]
+    fields = (sys.argv[2],) if len(sys.argv) > 2 else INDEXED_FIELDS
+    if any(field not in INDEXED_FIELDS for field in fields):
+        print(f"\n❌ 不支持的字段，可用字段: {', '.join(INDEXED_FIELDS)}")
+        return
+
+    config = load_config()
+    storage = create_storage(config['storage'])
+    if getattr(storage, 'text_index', None) is None:
+        print("\n❌ 未启用全文索引，请在 config.yaml 中设置 storage.text_index: true（json / segment 模式）")
+        return
+
+    start = time.perf_counter()
+    ids = storage.search(query, fields)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n🔍 \"{query}\" 共找到 {len(ids)} 条（{elapsed * 1000:.1f} ms）")
+    for item_id in ids[:50]:
+        print(f"  {item_id}  {storage.text_index.get_text(item_id)}")
+    if len(ids) > 50:
+        print(f"  ... 其余 {len(ids) - 50} 条省略")
+
+
+if __name__ == "__main__":
+    main()
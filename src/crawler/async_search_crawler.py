@@ -0,0 +1,343 @@
+"""采招网搜索爬虫 - 异步版本
+
+基于 Playwright 异步 API，多个结果页或 关键字×地区 组合并行抓取：
+
+- 同时打开的页面数由浏览器池大小（concurrency）限制
+- 同一主机的请求按 anti_crawl 配置的 min_delay ~ max_delay 间隔发出（见 throttle.py），
+  限速只作用于导航本身，等待结果和页面内提取时其他页面可以开始导航
+- 导航失败按 max_retries 重试，间隔逐次加倍
+- 检测到人机验证时取消其余任务（继续请求只会加重封禁），也可以调用 cancel() 主动取消
+- 第一页加载后读取分页栏，其余各页并行抓取，哪一页先完成就先交给调用方（iter_pages）
+
+页面内的提取逻辑与 SearchCrawler 相同（EXTRACT_RECORDS_SCRIPT + parse_records）。
+"""
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import structlog
+from crawler.browser_pool import AsyncBrowserPool
+from crawler.listing_parser import INFO_TYPES, PROVINCES, parse_listing, parse_records
+from crawler.pagination import PAGINATION_SCRIPT, CrawlMetrics, merge_pages, page_urls
+from crawler.resource_filter import PAGE_METRICS_SCRIPT, ResourceFilter
+from crawler.search_crawler import EXTRACT_RECORDS_SCRIPT, CrawlerConfig, SearchCrawler
+from crawler.throttle import HostThrottle
+
+logger = structlog.get_logger()
+
+
+class CaptchaDetected(Exception):
+    """结果页触发了人机验证"""
+
+
+class AsyncSearchCrawler:
+    """采招网异步搜索爬虫"""
+
+    BASE_URL = SearchCrawler.BASE_URL
+
+    def __init__(
+        self,
+        keywords: List[str],
+        config: CrawlerConfig,
+        concurrency: int = 4,
+        per_host: int = 1,
+        pool: Optional[AsyncBrowserPool] = None,
+        resource_filter: Optional[ResourceFilter] = None
+    ):
+        """
+        初始化爬虫
+
+        Args:
+            keywords: 默认的搜索关键字列表
+            config: 爬虫配置（min_delay / max_delay 为同一主机的请求间隔，max_retries 为重试次数，
+                max_pages 为每个搜索最多抓取的页数）
+            concurrency: 同时打开的页面数（自建浏览器池的大小）
+            per_host: 同一主机同时进行的导航数
+            pool: 共享的异步浏览器池，由调用方负责关闭
+            resource_filter: 请求拦截规则，为空时页面资源全部下载
+        """
+        self.keywords = keywords
+        self.config = config
+        self.pool = pool
+        self.resource_filter = resource_filter
+        self._owns_pool = pool is None
+        self.concurrency = concurrency
+        self.throttle = HostThrottle(config.min_delay, config.max_delay, per_host)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> 'AsyncSearchCrawler':
+        if self.pool is None:
+            self.pool = AsyncBrowserPool(size=self.concurrency, user_agents=SearchCrawler.USER_AGENTS)
+        await self.pool.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """取消未完成的任务并关闭自建的浏览器池"""
+        self.cancel()
+        if self._owns_pool and self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    def cancel(self) -> None:
+        """取消 search_many / fetch_many / iter_pages 中尚未完成的任务"""
+        for task in list(self._tasks):
+            task.cancel()
+
+    def search_url(self, keywords: Optional[Sequence[str]] = None) -> str:
+        """
+        构建搜索结果页URL
+
+        Args:
+            keywords: 搜索关键字，为空时使用默认关键字
+
+        Returns:
+            str: 结果页URL
+        """
+        return f"{self.BASE_URL}?keywords={','.join(keywords or self.keywords)}&mod=0"
+
+    async def fetch(self, url: str, region: Optional[str] = None) -> List[Dict]:
+        """
+        抓取并解析一个结果页（遵守主机限速，失败时重试）
+
+        Args:
+            url: 结果页URL
+            region: 地区筛选
+
+        Returns:
+            List[Dict]: 项目列表
+
+        Raises:
+            CaptchaDetected: 触发人机验证
+        """
+        items, _ = await self._fetch(url, region)
+        return items
+
+    async def _fetch(self, url: str, region: Optional[str], paginate: bool = False) -> Tuple[List[Dict], Optional[Dict]]:
+        """fetch 的实现，paginate 为真时同时返回页面的分页信息（失败时为 None）"""
+        if self.pool is None:
+            raise RuntimeError("AsyncSearchCrawler 需要在 async with 语句中使用")
+
+        attempts = max(1, self.config.max_retries)
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self.pool.page() as page:
+                    return await self._extract(page, url, region, paginate)
+            except CaptchaDetected:
+                raise
+            except Exception as e:
+                if attempt == attempts:
+                    logger.error("crawler.fetch.failed", url=url, attempts=attempt,
+                                 error=str(e), error_type=type(e).__name__)
+                    return [], None
+                backoff = self.config.max_delay * 2 ** (attempt - 1)
+                logger.warning("crawler.fetch.retry", url=url, attempt=attempt,
+                               backoff=backoff, error=str(e))
+                await asyncio.sleep(backoff)
+        return [], None
+
+    async def _extract(
+        self, page, url: str, region: Optional[str], paginate: bool
+    ) -> Tuple[List[Dict], Optional[Dict]]:
+        """打开结果页并提取项目（与 SearchCrawler._fetch_results 相同，不做固定等待）"""
+        resources = await self.resource_filter.install_async(page) if self.resource_filter else None
+        logger.info("crawler.navigate", url=url)
+        # 只有导航（到收到响应为止）占用主机名额，等待结果和页面内提取不占用，
+        # 多个页面的加载和提取可以重叠，请求的发出仍按 min_delay ~ max_delay 间隔
+        async with self.throttle.slot(url):
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        logger.info("page.loaded", url=url, status=response.status if response else None)
+
+        try:
+            await page.wait_for_selector('input[type="checkbox"]', timeout=10000)
+        except Exception:
+            logger.warning("search_results.not_found", url=url, message="未找到搜索结果，可能触发验证")
+
+        if resources is not None:
+            logger.info("page.resources", url=url, **resources.summary(), **await page.evaluate(PAGE_METRICS_SCRIPT))
+
+        # 与 SearchCrawler 检查 page.content() 相同，但在页面内判断，不传回整页 HTML
+        captcha = await page.evaluate("""
+            () => {
+                const html = document.documentElement.outerHTML;
+                return html.includes('人机验证') || html.includes('aliyunCaptcha');
+            }
+        """)
+        if captcha:
+            logger.error("captcha.detected", url=url, message="检测到人机验证")
+            raise CaptchaDetected(url)
+
+        records = await page.evaluate(EXTRACT_RECORDS_SCRIPT, {
+            'infoTypes': list(INFO_TYPES),
+            'provinces': sorted(PROVINCES),
+        })
+        logger.info("records.extracted", url=url, count=len(records))
+        pagination = await page.evaluate(PAGINATION_SCRIPT) if paginate else None
+        # 来源URL与 SearchCrawler 一致，不带 mod 参数
+        source_url = url.split('&mod=')[0]
+        if records:
+            return parse_records(records, source_url, region_filter=region), pagination
+
+        # 页面结构变化、找不到结果行时退回整页文本解析
+        text_content = await page.evaluate("() => document.body.innerText")
+        logger.warning("records.not_found", url=url, message="未找到结构化结果，改用页面文本解析")
+        return parse_listing(text_content, 'temp', source_url, region_filter=region), pagination
+
+    async def fetch_many(self, requests: Iterable[Tuple[str, Optional[str]]]) -> List[Dict]:
+        """
+        并行抓取多个结果页，按请求顺序合并并去重
+
+        触发人机验证时取消其余请求，返回已完成部分的结果。
+
+        Args:
+            requests: (结果页URL, 地区筛选) 列表
+
+        Returns:
+            List[Dict]: 项目列表
+        """
+        requests = list(requests)
+        results: List[Optional[List[Dict]]] = [None] * len(requests)
+
+        async def run(index: int, url: str, region: Optional[str]) -> None:
+            results[index] = await self.fetch(url, region)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for index, (url, region) in enumerate(requests):
+                    task = group.create_task(run(index, url, region))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+        except* CaptchaDetected:
+            logger.error("crawler.cancelled", reason="captcha",
+                         completed=sum(result is not None for result in results), total=len(requests))
+
+        return merge_pages(results)
+
+    async def iter_pages(
+        self,
+        keywords: Optional[Sequence[str]] = None,
+        region: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        metrics: Optional[CrawlMetrics] = None
+    ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """
+        抓取一个搜索的全部结果页，每页完成后立即产出
+
+        先抓第一页并读取分页栏，其余各页同时发起（受浏览器池大小和主机限速约束），
+        按完成顺序产出，页码不一定递增。
+
+        Args:
+            keywords: 搜索关键字，为空时使用默认关键字
+            region: 地区筛选
+            max_pages: 最多抓取的页数，为空时使用配置的 max_pages
+            metrics: 共享的统计（多个搜索汇总时传入），为空时单独统计并在结束时记录日志
+
+        Yields:
+            Tuple[int, List[Dict]]: (页码, 该页的项目列表)
+
+        Raises:
+            CaptchaDetected: 触发人机验证（其余页已取消）
+        """
+        own_metrics = metrics is None
+        if own_metrics:
+            metrics = CrawlMetrics()
+        first_url = self.search_url(keywords)
+
+        items, pagination = await self._fetch(first_url, region, paginate=True)
+        metrics.add_page(len(items))
+        yield 1, items
+
+        urls = page_urls(first_url, pagination, max_pages or self.config.max_pages)
+        if not urls:
+            if own_metrics:
+                logger.info("crawler.pages.complete", url=first_url, **metrics.summary())
+            return
+        logger.info("crawler.pages.found", url=first_url, pages=len(urls) + 1)
+
+        async def run(page_no: int, url: str) -> Tuple[int, List[Dict]]:
+            return page_no, await self.fetch(url, region)
+
+        tasks = []
+        for page_no, url in enumerate(urls, start=2):
+            task = asyncio.create_task(run(page_no, url))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            tasks.append(task)
+
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                page_no, items = await next_page
+                metrics.add_page(len(items))
+                yield page_no, items
+        finally:
+            # 人机验证、调用方提前结束或取消时停止其余页
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if own_metrics:
+                logger.info("crawler.pages.complete", url=first_url, **metrics.summary())
+
+    async def search_pages(
+        self,
+        keywords: Optional[Sequence[str]] = None,
+        region: Optional[str] = None,
+        max_pages: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        抓取一个搜索的全部结果页，按页码合并去重
+
+        Args:
+            keywords: 搜索关键字，为空时使用默认关键字
+            region: 地区筛选
+            max_pages: 最多抓取的页数，为空时使用配置的 max_pages
+
+        Returns:
+            List[Dict]: 项目列表（触发人机验证时为已完成部分）
+        """
+        pages: Dict[int, List[Dict]] = {}
+        try:
+            async for page_no, items in self.iter_pages(keywords, region, max_pages):
+                pages[page_no] = items
+        except CaptchaDetected:
+            logger.error("crawler.cancelled", reason="captcha", completed=len(pages))
+        return merge_pages(pages[page_no] for page_no in sorted(pages))
+
+    async def search_many(
+        self,
+        queries: Iterable[Tuple[Sequence[str], Optional[str]]],
+        max_pages: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        并行执行多组 关键字×地区 搜索，每组抓取全部结果页
+
+        触发人机验证时取消全部搜索，返回已完成部分的结果。
+
+        Args:
+            queries: (关键字列表, 地区筛选) 列表
+            max_pages: 每组最多抓取的页数，为空时使用配置的 max_pages
+
+        Returns:
+            List[Dict]: 合并去重后的项目列表
+        """
+        queries = list(queries)
+        logger.info("crawler.search.start", mode="async", queries=len(queries), concurrency=self.concurrency)
+        metrics = CrawlMetrics()
+        # 每组的结果按页码保存，合并时保持 查询→页码 的顺序
+        results: List[Dict[int, List[Dict]]] = [{} for _ in queries]
+
+        async def run(index: int, keywords: Sequence[str], region: Optional[str]) -> None:
+            async for page_no, items in self.iter_pages(keywords, region, max_pages, metrics):
+                results[index][page_no] = items
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for index, (keywords, region) in enumerate(queries):
+                    task = group.create_task(run(index, keywords, region))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+        except* CaptchaDetected:
+            logger.error("crawler.cancelled", reason="captcha", pages=metrics.pages)
+
+        items = merge_pages(pages[page_no] for pages in results for page_no in sorted(pages))
+        logger.info("crawler.search.complete", mode="async", total=len(items), **metrics.summary())
+        return items
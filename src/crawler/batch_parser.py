@@ -0,0 +1,116 @@
+"""批量解析保存的结果页
+
+操作员每天把多个搜索结果页保存为文本文件。这里把一个目录（或通配符匹配到的
+文件）分给进程池逐个解析，按文件名顺序合并结果，并去掉多个文件中重复出现的
+同一条公告（结果页之间常有重叠）。
+
+文件内的临时ID在合并后统一生成：各进程在同一秒内解析不同文件时，
+``前缀_时间戳_序号`` 形式的ID会相同。
+"""
+import glob
+import os
+import time
+from datetime import datetime
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
+from crawler.listing_parser import iter_listing
+from data.near_duplicate import normalize_title
+
+
+def expand_paths(pattern: str) -> List[str]:
+    """
+    展开输入路径
+
+    Args:
+        pattern: 目录（取其中的 *.txt）、通配符或单个文件
+
+    Returns:
+        List[str]: 按文件名排序的文件列表
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.txt')
+    return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+
+def _counted(lines, counter: List[int]):
+    for line in lines:
+        counter[0] += 1
+        yield line
+
+
+def _parse_file(args: Tuple[str, Optional[str]]) -> Tuple[str, List[Dict], int, int, float]:
+    """进程池任务：解析一个文件，返回 (路径, 项目, 行数, 字节数, 耗时秒)"""
+    path, region_filter = args
+    start = time.perf_counter()
+    counter = [0]
+    with open(path, 'r', encoding='utf-8') as f:
+        items = [
+            item for item in iter_listing(_counted(f, counter))
+            if not region_filter or item['province'] == region_filter
+        ]
+    return path, items, counter[0], os.path.getsize(path), time.perf_counter() - start
+
+
+def dedup_key(item: Dict) -> Tuple:
+    """同一条公告的判定键：信息类型、规范化标题、发布日期、省份"""
+    return (item['info_type'], normalize_title(item['title']), item['publish_date'], item['province'])
+
+
+def parse_files(
+    paths: List[str],
+    id_prefix: str,
+    source_url: str,
+    region_filter: Optional[str] = None,
+    processes: Optional[int] = None
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    并行解析多个文件，合并并去重
+
+    Args:
+        paths: 文件列表（合并时按此顺序，重复的公告保留先出现的一条）
+        id_prefix: 临时ID前缀
+        source_url: 来源URL
+        region_filter: 地区筛选（省份名），为空时不筛选
+        processes: 进程数，为空时使用 CPU 核数，小于等于 1 或只有一个文件时在当前进程解析
+
+    Returns:
+        Tuple[List[Dict], List[Dict]]: (去重后的项目, 每个文件的统计)，统计字段为
+        path / items / new_items / lines / bytes / seconds
+    """
+    tasks = [(path, region_filter) for path in paths]
+    processes = processes or os.cpu_count() or 1
+
+    if processes <= 1 or len(tasks) <= 1:
+        results = map(_parse_file, tasks)
+        return _merge(results, id_prefix, source_url)
+
+    with Pool(min(processes, len(tasks))) as pool:
+        # imap 按提交顺序返回，合并结果与文件顺序一致
+        return _merge(pool.imap(_parse_file, tasks), id_prefix, source_url)
+
+
+def _merge(results, id_prefix: str, source_url: str) -> Tuple[List[Dict], List[Dict]]:
+    stamp = int(datetime.now().timestamp())
+    seen = set()
+    merged: List[Dict] = []
+    stats: List[Dict] = []
+    for path, items, lines, size, seconds in results:
+        new_items = 0
+        for item in items:
+            key = dedup_key(item)
+            if key in seen:
+                continue
+            seen.add(key)
+            item['id'] = f"{id_prefix}_{stamp}_{len(merged)}"
+            item['source_url'] = source_url
+            merged.append(item)
+            new_items += 1
+        stats.append({
+            'path': path,
+            'items': len(items),
+            'new_items': new_items,
+            'lines': lines,
+            'bytes': size,
+            'seconds': seconds,
+        })
+    return merged, stats
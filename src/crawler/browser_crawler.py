@@ -9,10 +9,9 @@
 3. 使用此模块解析文本内容
 """
 
-import re
-from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List
 import structlog
+from crawler.listing_parser import iter_listing_items, parse_listing
 
 logger = structlog.get_logger()
 
@@ -29,26 +28,8 @@ class BrowserCrawler:
         """
         self.keywords = keywords
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """解析日期字符串"""
-        if not date_str:
-            return None
-        
-        try:
-            date_str = date_str.strip()
-            
-            if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-                return datetime.strptime(date_str[:10], "%Y-%m-%d")
-            
-            match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', date_str)
-            if match:
-                year, month, day = match.groups()
-                return datetime(int(year), int(month), int(day))
-                
-        except Exception as e:
-            logger.warning("date_parse_failed", date_str=date_str, error=str(e))
-        
-        return None
+    def _source_url(self) -> str:
+        return f"https://search.bidcenter.com.cn/search?keywords={','.join(self.keywords)}"
     
     def parse_content(self, content: str, region_filter: str = None) -> List[Dict]:
         """
@@ -61,106 +42,27 @@ class BrowserCrawler:
         Returns:
             List[Dict]: 解析后的项目列表
         """
-        items = []
-        lines = content.strip().split('\n')
+        items = parse_listing(content, 'browser', self._source_url(), region_filter)
         
-        current_item = None
+        logger.info("parse.complete", total=len(items), region=region_filter)
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # 检测新项目的开始
-            info_types = ['招标公告', '中标结果', '招标变更', '采购信息', '拟在建项目', '拍卖转让', '招标预告']
-            
-            # 检测新项目
-            found_new_item = False
-            for info_type in info_types:
-                if line.startswith(info_type):
-                    # 保存上一个项目
-                    if current_item and current_item.get('title'):
-                        items.append(current_item)
-                    
-                    # 开始新项目
-                    current_item = {
-                        'id': None,
-                        'title': '',
-                        'info_type': info_type,
-                        'publish_date': None,
-                        'province': None,
-                        'city': None,
-                        'district': None,
-                        'owner_unit': None,
-                        'budget_amount': None,
-                        'procurement_type': None,
-                        'bidding_deadline': None,
-                        'keywords_matched': [],
-                        'project_address': None,
-                        'attachments': [],
-                        'source_url': ''
-                    }
-                    
-                    # 提取标题
-                    title = line[len(info_type):].strip()
-                    title = re.sub(r'\s*\([^)]*\)\s*$', '', title)
-                    current_item['title'] = title.strip()
-                    found_new_item = True
-                    break
-            
-            if not found_new_item and current_item:
-                # 解析采购预算
-                if '采购预算：' in line or '中标金额：' in line:
-                    match = re.search(r'[采购预算|中标金额]：(.+?)(?:\s|$)', line)
-                    if match:
-                        current_item['budget_amount'] = match.group(1).strip()
-                
-                # 解析采购方式
-                if '采购方式：' in line:
-                    match = re.search(r'采购方式：(.+?)(?:\s|$)', line)
-                    if match:
-                        current_item['procurement_type'] = match.group(1).strip()
-                
-                # 解析截止时间
-                if '截止时间：' in line:
-                    match = re.search(r'截止时间：(.+?)(?:\s|$)', line)
-                    if match:
-                        deadline_str = match.group(1).strip()
-                        current_item['bidding_deadline'] = self._parse_date(deadline_str)
-                
-                # 解析地区
-                provinces = ['四川', '北京', '上海', '天津', '重庆', '河北', '山西', '辽宁', '吉林', 
-                           '黑龙江', '江苏', '浙江', '安徽', '福建', '江西', '山东', '河南', '湖北', 
-                           '湖南', '广东', '海南', '贵州', '云南', '陕西', '甘肃', '青海', '台湾', 
-                           '内蒙古', '广西', '西藏', '宁夏', '新疆']
-                
-                if line in provinces:
-                    current_item['province'] = line
-                
-                # 解析日期
-                date_match = re.match(r'(\d{4}-\d{2}-\d{2})$', line)
-                if date_match:
-                    current_item['publish_date'] = self._parse_date(date_match.group(1))
+        return items
+    
+    def iter_parse_file(self, file_path: str, region_filter: str = None) -> Iterator[Dict]:
+        """
+        逐行读取文件并解析，每解析完一个项目就产出
         
-        # 保存最后一个项目
-        if current_item and current_item.get('title'):
-            items.append(current_item)
+        多个结果页拼接成的大文件不需要整个读入内存。
         
-        # 生成项目ID
-        for i, item in enumerate(items):
-            if not item['id']:
-                item['id'] = f"browser_{int(datetime.now().timestamp())}_{i}"
+        Args:
+            file_path: 文本文件路径
+            region_filter: 地区筛选
             
-            if not item['source_url']:
-                item['source_url'] = f"https://search.bidcenter.com.cn/search?keywords={','.join(self.keywords)}"
-        
-        # 地区筛选
-        if region_filter:
-            items = [item for item in items if item.get('province') == region_filter]
-        
-        logger.info("parse.complete", total=len(items), region=region_filter)
-        
-        return items
+        Yields:
+            Dict: 项目信息字典
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from iter_listing_items(f, 'browser', self._source_url(), region_filter)
     
     def parse_from_file(self, file_path: str, region_filter: str = None) -> List[Dict]:
         """
@@ -173,10 +75,11 @@ class BrowserCrawler:
         Returns:
             List[Dict]: 解析后的项目列表
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        items = list(self.iter_parse_file(file_path, region_filter))
+        
+        logger.info("parse.complete", total=len(items), region=region_filter, path=file_path)
         
-        return self.parse_content(content, region_filter)
+        return items
 
 
 # 使用示例
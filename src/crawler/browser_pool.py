@@ -0,0 +1,294 @@
+"""Playwright 浏览器与上下文池
+
+启动 Playwright、Chromium 并新建上下文每次需要数秒。浏览器池只启动一次浏览器，
+预先创建若干个已安装反检测脚本的上下文，搜索和页面抓取从池中借用上下文新开
+页面，用完归还。一个上下文打开的页面数达到上限后关闭并换成新的上下文，
+避免长时间运行时内存持续增长。
+
+Playwright 同步 API 不是线程安全的，BrowserPool 只应在创建它的线程中使用；
+异步爬虫使用 AsyncBrowserPool，借用时没有空闲上下文就等待归还，池的大小
+即同时打开的页面数上限。
+"""
+import asyncio
+import random
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+import structlog
+
+logger = structlog.get_logger()
+
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+]
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+]
+
+# 反检测脚本，在上下文创建时安装，之后打开的每个页面都会执行
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['zh-CN', 'zh', 'en']
+    });
+"""
+
+
+class _Slot:
+    """池中的一个上下文及其已打开的页面数（context 为 None 时是待重建的空位）"""
+
+    __slots__ = ('context', 'pages')
+
+    def __init__(self, context):
+        self.context = context
+        self.pages = 0
+
+
+class BrowserPool:
+    """可复用的浏览器与预热上下文池"""
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages_per_context: int = 50,
+        user_agents: Optional[List[str]] = None,
+        headless: bool = True
+    ):
+        """
+        初始化浏览器池（首次借用时才启动浏览器）
+
+        Args:
+            size: 保持的空闲上下文数量
+            max_pages_per_context: 每个上下文最多打开的页面数，达到后换成新的上下文
+            user_agents: 新建上下文时随机选用的 User-Agent
+            headless: 是否无头模式
+        """
+        self.size = size
+        self.max_pages_per_context = max_pages_per_context
+        self.user_agents = user_agents or USER_AGENTS
+        self.headless = headless
+        self._playwright = None
+        self._browser = None
+        self._idle: List[_Slot] = []
+        self.stats: Dict[str, int] = {'contexts_created': 0, 'contexts_recycled': 0, 'pages': 0}
+
+    def __enter__(self) -> 'BrowserPool':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """启动浏览器并预热上下文（已启动时只补足空闲上下文）"""
+        if self._browser is not None and not self._browser.is_connected():
+            logger.warning("browser_pool.disconnected", message="浏览器已断开，重新启动")
+            self.close()
+
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+            logger.info("browser.initialized", pool_size=self.size)
+
+        while len(self._idle) < self.size:
+            self._idle.append(self._new_slot())
+
+    def _new_slot(self) -> _Slot:
+        context = self._browser.new_context(
+            user_agent=random.choice(self.user_agents),
+            viewport={'width': 1920, 'height': 1080},
+            locale='zh-CN',
+        )
+        context.add_init_script(STEALTH_SCRIPT)
+        self.stats['contexts_created'] += 1
+        return _Slot(context)
+
+    def _acquire(self) -> _Slot:
+        if self._browser is None or not self._browser.is_connected():
+            self.start()
+        # 空闲上下文都被借出（嵌套借用）时临时新建一个，归还时多余的会被关闭
+        return self._idle.pop() if self._idle else self._new_slot()
+
+    def _release(self, slot: _Slot) -> None:
+        if self._browser is None:
+            return
+        if slot.pages >= self.max_pages_per_context or len(self._idle) >= self.size:
+            slot.context.close()
+            if slot.pages >= self.max_pages_per_context:
+                self.stats['contexts_recycled'] += 1
+                logger.info("browser_pool.context_recycled", pages=slot.pages)
+            if len(self._idle) < self.size:
+                # 换上新的预热上下文，下次借用时不需要再等待创建
+                self._idle.append(self._new_slot())
+        else:
+            self._idle.append(slot)
+
+    @contextmanager
+    def page(self) -> Iterator:
+        """
+        借用一个上下文并打开新页面，退出时关闭页面并归还上下文
+
+        Yields:
+            Page: Playwright 页面
+        """
+        slot = self._acquire()
+        page = slot.context.new_page()
+        slot.pages += 1
+        self.stats['pages'] += 1
+        try:
+            yield page
+        finally:
+            try:
+                page.close()
+            finally:
+                self._release(slot)
+
+    def close(self) -> None:
+        """关闭全部上下文和浏览器"""
+        for slot in self._idle:
+            try:
+                slot.context.close()
+            except Exception:
+                # 浏览器已断开时上下文无法正常关闭
+                pass
+        self._idle = []
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+            logger.info("browser.closed", **self.stats)
+
+
+class AsyncBrowserPool:
+    """BrowserPool 的异步版本（Playwright 异步 API）"""
+
+    def __init__(
+        self,
+        size: int = 4,
+        max_pages_per_context: int = 50,
+        user_agents: Optional[List[str]] = None,
+        headless: bool = True
+    ):
+        """
+        初始化浏览器池（调用 start 或首次借用时启动浏览器）
+
+        Args:
+            size: 上下文数量，即同时打开的页面数上限
+            max_pages_per_context: 每个上下文最多打开的页面数，达到后换成新的上下文
+            user_agents: 新建上下文时随机选用的 User-Agent
+            headless: 是否无头模式
+        """
+        self.size = size
+        self.max_pages_per_context = max_pages_per_context
+        self.user_agents = user_agents or USER_AGENTS
+        self.headless = headless
+        self._playwright = None
+        self._browser = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+        self.stats: Dict[str, int] = {'contexts_created': 0, 'contexts_recycled': 0, 'pages': 0}
+
+    async def __aenter__(self) -> 'AsyncBrowserPool':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """启动浏览器并预热全部上下文"""
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+            self._idle = asyncio.Queue()
+            slots = await asyncio.gather(*(self._new_slot() for _ in range(self.size)))
+            for slot in slots:
+                self._idle.put_nowait(slot)
+            logger.info("browser.initialized", pool_size=self.size, mode="async")
+
+    async def _new_slot(self) -> _Slot:
+        context = await self._browser.new_context(
+            user_agent=random.choice(self.user_agents),
+            viewport={'width': 1920, 'height': 1080},
+            locale='zh-CN',
+        )
+        await context.add_init_script(STEALTH_SCRIPT)
+        self.stats['contexts_created'] += 1
+        return _Slot(context)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator:
+        """
+        借用一个上下文并打开新页面（全部借出时等待归还），退出时关闭页面并归还
+
+        Yields:
+            Page: Playwright 页面
+        """
+        if self._browser is None:
+            await self.start()
+        slot = await self._idle.get()
+        try:
+            if slot.context is None:
+                # 上次换新上下文失败留下的空位，借用时重建（失败时空位照样归还）
+                slot = await self._new_slot()
+            page = await slot.context.new_page()
+            slot.pages += 1
+            self.stats['pages'] += 1
+            try:
+                yield page
+            finally:
+                await page.close()
+        finally:
+            try:
+                if slot.pages >= self.max_pages_per_context:
+                    self.stats['contexts_recycled'] += 1
+                    logger.info("browser_pool.context_recycled", pages=slot.pages)
+                    context, slot = slot.context, _Slot(None)
+                    await context.close()
+                    slot = await self._new_slot()
+            except Exception as e:
+                logger.warning("browser_pool.recycle_failed", error=str(e), error_type=type(e).__name__)
+            finally:
+                # 无论换新是否成功都归还一个位置，否则池会永久少一个上下文，借满后一直等待
+                self._idle.put_nowait(slot)
+
+    async def close(self) -> None:
+        """关闭全部空闲上下文和浏览器（借出中的上下文随浏览器一起关闭）"""
+        if self._idle is not None:
+            while not self._idle.empty():
+                slot = self._idle.get_nowait()
+                if slot.context is None:
+                    continue
+                try:
+                    await slot.context.close()
+                except Exception:
+                    pass
+            self._idle = None
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+            logger.info("browser.closed", mode="async", **self.stats)
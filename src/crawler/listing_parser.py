@@ -0,0 +1,259 @@
+"""搜索结果列表解析
+
+SearchCrawler 和 BrowserCrawler 共用的列表文本解析。页面文本（innerText 或
+手动复制的内容）中每个项目的格式为::
+
+    招标公告 项目标题 (广告,标识等在内容中)
+    采购预算：27218.16万元 采购方式：比选 截止时间：详见内容
+    四川
+    2026-02-02
+
+按行读取，以"信息类型 + 标题"行开始一个新项目，其后的行归入当前项目，
+直到下一个标题行。行的分类只用前缀集合和整行字典查找，正则在模块载入时编译，
+"字段：值"行一次扫描取出全部字段。日期解析见 data/dates.py。
+"""
+import re
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+from data.dates import parse_date
+from data.keyword_location import split_location_tag
+
+# 信息类型（标题行的前缀）
+INFO_TYPES = ('招标公告', '中标结果', '招标变更', '采购信息', '拟在建项目', '拍卖转让', '招标预告')
+
+PROVINCES = frozenset((
+    '四川', '北京', '上海', '天津', '重庆', '河北', '山西', '辽宁', '吉林',
+    '黑龙江', '江苏', '浙江', '安徽', '福建', '江西', '山东', '河南', '湖北',
+    '湖南', '广东', '海南', '贵州', '云南', '陕西', '甘肃', '青海', '台湾',
+    '内蒙古', '广西', '西藏', '宁夏', '新疆',
+))
+
+# 前缀长度 -> 该长度的信息类型
+_INFO_TYPE_PREFIXES = tuple(
+    (length, frozenset(t for t in INFO_TYPES if len(t) == length))
+    for length in sorted({len(t) for t in INFO_TYPES})
+)
+
+# 整行即可确定含义的行：省份名、单独成行的附件/标书标签
+_EXACT_LINES = {province: ('province', province) for province in PROVINCES}
+_EXACT_LINES['附件'] = ('has_attachments', True)
+_EXACT_LINES['标书'] = ('has_bidding_docs', True)
+
+# "字段：值"，值用前瞻捕获，同一行中相邻的字段不会被前一个值吞掉；
+# 截止时间可能是"日期 时间"，中间的空格不作为值的结尾
+_FIELD = re.compile(
+    r'(采购预算|中标金额|采购方式|截止时间)：'
+    r'(?=\s*(\d{4}[-年]\d{1,2}[-月]\d{1,2}日?\s*\d{1,2}[:时]\d{2}(?::\d{2}|分)?|\S+))'
+)
+_FIELD_KEYS = {
+    '采购预算': 'budget_amount',
+    '中标金额': 'budget_amount',
+    '采购方式': 'procurement_type',
+    '截止时间': 'bidding_deadline',
+}
+
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _info_type(line: str) -> Optional[str]:
+    """标题行返回信息类型，其他行返回 None"""
+    for length, prefixes in _INFO_TYPE_PREFIXES:
+        prefix = line[:length]
+        if prefix in prefixes:
+            return prefix
+    return None
+
+
+def _new_item(info_type: str, raw_title: str) -> Dict:
+    title, tag, has_attachments, has_bidding_docs = split_location_tag(raw_title)
+    return {
+        'id': None,
+        'title': title,
+        'info_type': info_type,
+        'publish_date': None,
+        'province': None,
+        'city': None,
+        'district': None,
+        'owner_unit': None,
+        'budget_amount': None,
+        'procurement_type': None,
+        'bidding_deadline': None,
+        'keywords_matched': [],
+        'keyword_location': [],
+        'keyword_location_tag': tag,
+        'has_attachments': has_attachments,
+        'has_bidding_docs': has_bidding_docs,
+        'project_address': None,
+        'attachments': [],
+        'source_url': ''
+    }
+
+
+def iter_listing(lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    逐行解析列表，每解析完一个项目就产出（不生成ID）
+
+    Args:
+        lines: 文本行（可以带换行符）
+
+    Yields:
+        Dict: 项目信息字典，没有标题的项目会被丢弃
+    """
+    exact_lines = _EXACT_LINES
+    field_keys = _FIELD_KEYS
+    field_finditer = _FIELD.finditer
+    date_match = _ISO_DATE.fullmatch
+
+    current = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        info_type = _info_type(line)
+        if info_type is not None:
+            if current is not None and current['title']:
+                yield current
+            current = _new_item(info_type, line[len(info_type):])
+            continue
+
+        # 第一个标题行之前的内容（页面头部等）直接跳过
+        if current is None:
+            continue
+
+        exact = exact_lines.get(line)
+        if exact is not None:
+            current[exact[0]] = exact[1]
+        elif '：' in line:
+            seen = set()
+            for match in field_finditer(line):
+                key = field_keys[match.group(1)]
+                if key in seen:
+                    continue
+                seen.add(key)
+                value = match.group(2)
+                current[key] = parse_date(value) if key == 'bidding_deadline' else value
+        elif len(line) == 10 and date_match(line):
+            current['publish_date'] = parse_date(line)
+
+    if current is not None and current['title']:
+        yield current
+
+
+def iter_listing_items(
+    lines: Iterable[str],
+    id_prefix: str,
+    source_url: str,
+    region_filter: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    逐行解析列表并生成ID，每解析完一个项目就产出
+
+    行可以来自打开的文件对象，整个文件不需要读入内存；下游的匹配、入库
+    可以在文件读完之前开始。
+
+    Args:
+        lines: 文本行（可以带换行符）
+        id_prefix: 临时ID前缀（ID 为 前缀_时间戳_序号）
+        source_url: 来源URL
+        region_filter: 地区筛选（省份名），为空时不筛选
+
+    Yields:
+        Dict: 项目信息字典
+    """
+    stamp = int(datetime.now().timestamp())
+    for i, item in enumerate(iter_listing(lines)):
+        item['id'] = f"{id_prefix}_{stamp}_{i}"
+        item['source_url'] = source_url
+        if region_filter and item['province'] != region_filter:
+            continue
+        yield item
+
+
+def parse_listing(
+    content: str,
+    id_prefix: str,
+    source_url: str,
+    region_filter: Optional[str] = None
+) -> List[Dict]:
+    """
+    解析整页列表文本
+
+    Args:
+        content: 页面文本
+        id_prefix: 临时ID前缀（ID 为 前缀_时间戳_序号）
+        source_url: 来源URL
+        region_filter: 地区筛选（省份名），为空时不筛选
+
+    Returns:
+        List[Dict]: 解析后的项目列表
+    """
+    return list(iter_listing_items(content.split('\n'), id_prefix, source_url, region_filter))
+
+
+def record_to_item(record: Dict, source_url: str) -> Optional[Dict]:
+    """
+    把页面中直接提取的结构化记录转换为项目信息字典
+
+    记录由 SearchCrawler 在页面内一次提取（见 search_crawler.EXTRACT_RECORDS_SCRIPT），
+    字段为 project_id / info_type / raw_title / link_title / budget / method /
+    deadline / region / date / labels / href，缺失的字段为 null。
+
+    Args:
+        record: 页面返回的记录
+        source_url: 来源URL
+
+    Returns:
+        Optional[Dict]: 项目信息字典，ID 为页面中的项目ID；没有项目ID或标题时返回 None
+    """
+    project_id = record.get('project_id')
+    raw_title = record.get('raw_title') or record.get('link_title') or ''
+    if not project_id or not raw_title.strip():
+        return None
+
+    item = _new_item(record.get('info_type') or '', raw_title)
+    if not item['title']:
+        return None
+    item['id'] = str(project_id)
+    item['budget_amount'] = record.get('budget')
+    item['procurement_type'] = record.get('method')
+    item['bidding_deadline'] = parse_date(record.get('deadline'))
+    region = record.get('region')
+    item['province'] = region if region in PROVINCES else None
+    item['publish_date'] = parse_date(record.get('date'))
+    for label in record.get('labels') or ():
+        exact = _EXACT_LINES.get(label)
+        if exact is not None and exact[0] != 'province':
+            item[exact[0]] = exact[1]
+    item['source_url'] = source_url
+    item['detail_url'] = record.get('href') or ''
+    return item
+
+
+def parse_records(
+    records: Iterable[Dict],
+    source_url: str,
+    region_filter: Optional[str] = None
+) -> List[Dict]:
+    """
+    转换页面提取的结构化记录（同一项目ID只保留第一条）
+
+    Args:
+        records: 页面返回的记录列表
+        source_url: 来源URL
+        region_filter: 地区筛选（省份名），为空时不筛选
+
+    Returns:
+        List[Dict]: 项目信息字典列表
+    """
+    items = []
+    seen = set()
+    for record in records:
+        item = record_to_item(record, source_url)
+        if item is None or item['id'] in seen:
+            continue
+        seen.add(item['id'])
+        if region_filter and item['province'] != region_filter:
+            continue
+        items.append(item)
+    return items
@@ -0,0 +1,159 @@
+"""结果分页
+
+第一页加载后在页面内执行 PAGINATION_SCRIPT，得到总页数和分页栏中各页码的链接，
+再用 page_urls 生成其余各页的URL：分页栏中出现的页码直接用其链接，没出现的
+（页码较多时分页栏只显示一部分）按已知链接中值等于页码的查询参数推出，
+分页栏是脚本跳转、没有可用链接时使用 page 参数。
+
+merge_pages 按页码顺序合并各页结果并去重，CrawlMetrics 统计抓取的页数、项目数和速度。
+"""
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from crawler.batch_parser import dedup_key
+
+
+# 页面内提取分页信息，返回 {total: 总页数, links: {页码: 链接}}
+PAGINATION_SCRIPT = r"""
+() => {
+    const links = {};
+    let total = 1;
+    for (const a of document.querySelectorAll('a[href]')) {
+        const text = (a.innerText || '').trim();
+        if (/^\d{1,4}$/.test(text) && a.closest('[class*="page"], [class*="Page"], [id*="page"]')) {
+            const page = parseInt(text, 10);
+            links[page] = a.href;
+            total = Math.max(total, page);
+        }
+    }
+    const match = document.body.innerText.match(/共\s*(\d+)\s*页/);
+    if (match) {
+        total = Math.max(total, parseInt(match[1], 10));
+    }
+    return {total, links};
+}
+"""
+
+DEFAULT_PAGE_PARAM = 'page'
+
+
+def _with_param(url: str, name: str, value: int) -> str:
+    """替换（或添加）URL中的查询参数"""
+    parts = urlsplit(url)
+    query = [(key, val) for key, val in parse_qsl(parts.query, keep_blank_values=True) if key != name]
+    query.append((name, str(value)))
+    return urlunsplit(parts._replace(query=urlencode(query, safe=',')))
+
+
+def _page_param(links: Dict[int, str]) -> Optional[str]:
+    """从已知页码链接中找出值等于页码的查询参数"""
+    for page, href in sorted(links.items()):
+        if page < 2:
+            continue
+        for key, value in parse_qsl(urlsplit(href).query, keep_blank_values=True):
+            if value == str(page):
+                return key
+    return None
+
+
+def page_urls(first_url: str, pagination: Optional[Dict], max_pages: Optional[int] = None) -> List[str]:
+    """
+    生成第 2 页起各页的URL
+
+    Args:
+        first_url: 第一页URL
+        pagination: PAGINATION_SCRIPT 的返回值（页码键可以是字符串）
+        max_pages: 最多抓取的页数（含第一页），为空时不限制
+
+    Returns:
+        List[str]: 第 2 ~ N 页的URL
+    """
+    if not pagination:
+        return []
+    total = int(pagination.get('total') or 1)
+    if max_pages:
+        total = min(total, max_pages)
+
+    links = {}
+    for page, href in (pagination.get('links') or {}).items():
+        if href and href.startswith('http'):
+            links[int(page)] = href
+
+    param = _page_param(links)
+    template = links[min(page for page in links if page >= 2)] if param else None
+
+    urls = []
+    for page in range(2, total + 1):
+        if page in links:
+            urls.append(links[page])
+        elif template:
+            urls.append(_with_param(template, param, page))
+        else:
+            urls.append(_with_param(first_url, DEFAULT_PAGE_PARAM, page))
+    return urls
+
+
+def merge_pages(results: Iterable[Optional[List[Dict]]]) -> List[Dict]:
+    """
+    按顺序合并各页结果并去重
+
+    页面记录的ID是站内项目ID（纯数字），按ID去重；退回文本解析的项目只有临时ID，
+    各页之间会重复，按内容去重后重新编号。
+
+    Args:
+        results: 各页的项目列表（未完成的页为 None）
+
+    Returns:
+        List[Dict]: 合并后的项目列表
+    """
+    stamp = int(datetime.now().timestamp())
+    items = []
+    seen = set()
+    temp_count = 0
+    for result in results:
+        for item in result or ():
+            project_id = item['id']
+            key = project_id if project_id.isdigit() else dedup_key(item)
+            if key in seen:
+                continue
+            seen.add(key)
+            if not project_id.isdigit():
+                item['id'] = f"temp_{stamp}_{temp_count}"
+                temp_count += 1
+            items.append(item)
+    return items
+
+
+class CrawlMetrics:
+    """分页抓取的数量和速度统计"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.pages = 0
+        self.items = 0
+
+    def add_page(self, items: int) -> None:
+        """
+        记录一页
+
+        Args:
+            items: 该页的项目数
+        """
+        self.pages += 1
+        self.items += items
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: pages / items / seconds / pages_per_second / items_per_second
+        """
+        seconds = time.perf_counter() - self.start
+        rate = 1 / seconds if seconds > 0 else 0.0
+        return {
+            'pages': self.pages,
+            'items': self.items,
+            'seconds': round(seconds, 2),
+            'pages_per_second': round(self.pages * rate, 2),
+            'items_per_second': round(self.items * rate, 2),
+        }
@@ -0,0 +1,197 @@
+"""请求拦截
+
+爬虫只读取结果页的文本和结构，图片、字体和统计脚本都不需要下载。
+ResourceFilter 通过 Playwright 路由拦截页面发出的请求，按资源类型和域名规则
+中止不需要的请求，其余请求照常发出：
+
+- block_types：中止的资源类型（Playwright 的 resource_type，如 image / font / stylesheet / media）
+- block_domains：中止的域名（统计、广告脚本等），子域名一并匹配
+- block_third_party：为真时中止 allow_domains 以外的全部域名
+
+install / install_async 在页面上安装路由，返回该页面的 PageResources，记录放行和
+中止的请求数；页面加载完成后用 PAGE_METRICS_SCRIPT 读取实际传输的字节数和加载耗时。
+被中止的请求没有响应，运行时无法得知节省了多少字节和时间，需要用
+benchmarks/bench_resource_filter.py 对比拦截前后的加载结果。
+"""
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+# 不含 stylesheet：没有样式表时原本隐藏的文字会出现在 innerText 中，
+# 结果行按行拆分的提取（EXTRACT_RECORDS_SCRIPT）和整页文本解析都可能受影响，需要时在配置中加入
+DEFAULT_BLOCK_TYPES = ('image', 'media', 'font')
+
+# 常见的统计和广告域名
+DEFAULT_BLOCK_DOMAINS = (
+    'hm.baidu.com',
+    'cnzz.com',
+    '51.la',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'growingio.com',
+)
+
+DEFAULT_ALLOW_DOMAINS = ('bidcenter.com.cn',)
+
+# 页面内读取已加载资源的传输字节数和加载耗时（毫秒），被中止的请求不会出现在其中
+PAGE_METRICS_SCRIPT = """
+() => {
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    let transferred = navigation ? navigation.transferSize : 0;
+    for (const entry of resources) {
+        transferred += entry.transferSize || 0;
+    }
+    return {
+        resources: resources.length,
+        transferred_bytes: transferred,
+        dom_content_loaded_ms: navigation ? Math.round(navigation.domContentLoadedEventEnd) : null,
+    };
+}
+"""
+
+
+def _match_domain(host: str, domains: Iterable[str]) -> bool:
+    """host 是否为 domains 中的域名或其子域名"""
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+
+class PageResources:
+    """一个页面放行和中止的请求数"""
+
+    def __init__(self):
+        self.allowed = 0
+        self.blocked: Counter = Counter()
+
+    def reset(self) -> None:
+        """清零（同一页面访问下一个URL前调用）"""
+        self.allowed = 0
+        self.blocked.clear()
+
+    def summary(self) -> Dict:
+        """
+        Returns:
+            Dict: allowed / blocked / blocked_by（按中止原因计数）
+        """
+        return {
+            'allowed': self.allowed,
+            'blocked': sum(self.blocked.values()),
+            'blocked_by': dict(self.blocked),
+        }
+
+
+class ResourceFilter:
+    """按资源类型和域名中止页面请求"""
+
+    def __init__(
+        self,
+        block_types: Iterable[str] = DEFAULT_BLOCK_TYPES,
+        block_domains: Iterable[str] = DEFAULT_BLOCK_DOMAINS,
+        allow_domains: Iterable[str] = DEFAULT_ALLOW_DOMAINS,
+        block_third_party: bool = False
+    ):
+        """
+        Args:
+            block_types: 中止的资源类型
+            block_domains: 中止的域名
+            allow_domains: 站点自身的域名，block_third_party 为真时只放行这些域名
+            block_third_party: 是否中止 allow_domains 以外的域名
+        """
+        self.block_types = frozenset(block_types)
+        self.block_domains = tuple(block_domains)
+        self.allow_domains = tuple(allow_domains)
+        self.block_third_party = block_third_party
+
+    def should_block(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        判断请求是否应中止
+
+        Args:
+            resource_type: Playwright 的资源类型
+            url: 请求URL
+
+        Returns:
+            Optional[str]: 中止原因（资源类型 / tracker / third_party），放行时为 None
+        """
+        # 主文档和 data: 等非网络请求总是放行
+        if resource_type == 'document' or not url.startswith('http'):
+            return None
+        if resource_type in self.block_types:
+            return resource_type
+        host = urlsplit(url).hostname or ''
+        if _match_domain(host, self.block_domains):
+            return 'tracker'
+        if self.block_third_party and self.allow_domains and not _match_domain(host, self.allow_domains):
+            return 'third_party'
+        return None
+
+    def install(self, page) -> PageResources:
+        """
+        在页面上安装路由（Playwright 同步 API）
+
+        Args:
+            page: Playwright 页面
+
+        Returns:
+            PageResources: 该页面的请求计数
+        """
+        resources = PageResources()
+
+        def handle(route):
+            request = route.request
+            reason = self.should_block(request.resource_type, request.url)
+            if reason:
+                resources.blocked[reason] += 1
+                route.abort()
+            else:
+                resources.allowed += 1
+                route.continue_()
+
+        page.route("**/*", handle)
+        return resources
+
+    async def install_async(self, page) -> PageResources:
+        """
+        在页面上安装路由（Playwright 异步 API）
+
+        Args:
+            page: Playwright 页面
+
+        Returns:
+            PageResources: 该页面的请求计数
+        """
+        resources = PageResources()
+
+        async def handle(route):
+            request = route.request
+            reason = self.should_block(request.resource_type, request.url)
+            if reason:
+                resources.blocked[reason] += 1
+                await route.abort()
+            else:
+                resources.allowed += 1
+                await route.continue_()
+
+        await page.route("**/*", handle)
+        return resources
+
+
+def create_resource_filter(config: Optional[Dict]) -> Optional[ResourceFilter]:
+    """
+    根据配置创建请求拦截规则
+
+    Args:
+        config: crawler.resource_filter 配置
+
+    Returns:
+        Optional[ResourceFilter]: 未配置或 enabled 为假时为 None
+    """
+    if not config or not config.get('enabled', True):
+        return None
+    return ResourceFilter(
+        block_types=config.get('block_types', DEFAULT_BLOCK_TYPES),
+        block_domains=config.get('block_domains', DEFAULT_BLOCK_DOMAINS),
+        allow_domains=config.get('allow_domains', DEFAULT_ALLOW_DOMAINS),
+        block_third_party=config.get('block_third_party', False),
+    )
@@ -1,21 +1,85 @@
 """采招网搜索爬虫 - 真实实现（改进版）"""
 import time
 import random
-import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from playwright.sync_api import sync_playwright, Page, Browser
 import structlog
+from crawler.browser_pool import BrowserPool, USER_AGENTS
+from crawler.listing_parser import INFO_TYPES, PROVINCES, parse_listing, parse_records
+from crawler.pagination import PAGINATION_SCRIPT, CrawlMetrics, merge_pages, page_urls
+from crawler.resource_filter import PAGE_METRICS_SCRIPT, PageResources, ResourceFilter
 
 logger = structlog.get_logger()
 
+# 页面内提取结果列表：每个结果行的复选框 value 是项目ID，行内第一个链接是详情页。
+# 参数为 {infoTypes, provinces}，返回的记录由 listing_parser.parse_records 转换。
+EXTRACT_RECORDS_SCRIPT = r"""
+({infoTypes, provinces}) => {
+    const provinceSet = new Set(provinces);
+    const fieldValue = (text, pattern) => {
+        const match = text.match(pattern);
+        return match ? match[1] : null;
+    };
+    const records = [];
+    const seen = new Set();
+    for (const box of document.querySelectorAll('input[type="checkbox"][value]')) {
+        const projectId = (box.value || '').trim();
+        if (!/^\d+$/.test(projectId) || seen.has(projectId)) {
+            continue;
+        }
+        // 向上找到包含链接的最近容器作为结果行
+        let row = box.parentElement;
+        let link = null;
+        while (row && row !== document.body) {
+            link = row.querySelector('a[href]');
+            if (link) {
+                break;
+            }
+            row = row.parentElement;
+        }
+        if (!link) {
+            continue;
+        }
+        seen.add(projectId);
+
+        const lines = row.innerText.split('\n').map(line => line.trim()).filter(Boolean);
+        const text = lines.join('\n');
+        let infoType = null;
+        let rawTitle = null;
+        for (const line of lines) {
+            const type = infoTypes.find(t => line.startsWith(t));
+            if (type) {
+                infoType = type;
+                rawTitle = line.slice(type.length);
+                break;
+            }
+        }
+        records.push({
+            project_id: projectId,
+            info_type: infoType,
+            raw_title: rawTitle,
+            link_title: (link.getAttribute('title') || link.innerText || '').trim(),
+            budget: fieldValue(text, /(?:采购预算|中标金额)：[ \t]*(\S+)/),
+            method: fieldValue(text, /采购方式：[ \t]*(\S+)/),
+            deadline: fieldValue(text, /截止时间：[ \t]*(\d{4}[-年]\d{1,2}[-月]\d{1,2}日?[ \t]*\d{1,2}[:时]\d{2}(?::\d{2}|分)?|\S+)/),
+            region: lines.find(line => provinceSet.has(line)) || null,
+            date: lines.find(line => /^\d{4}-\d{2}-\d{2}$/.test(line)) || null,
+            labels: lines.filter(line => line === '附件' || line === '标书'),
+            href: link.href,
+        });
+    }
+    return records;
+}
+"""
+
 
 class CrawlerConfig:
     """爬虫配置"""
-    def __init__(self, min_delay=2.0, max_delay=5.0, max_retries=3):
+    def __init__(self, min_delay=2.0, max_delay=5.0, max_retries=3, max_pages=50):
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.max_retries = max_retries
+        self.max_pages = max_pages  # 每个搜索最多抓取的结果页数
 
 
 class SearchCrawler:
@@ -23,89 +87,58 @@ class SearchCrawler:
     
     BASE_URL = "https://search.bidcenter.com.cn/search"
     
-    USER_AGENTS = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    ]
+    USER_AGENTS = USER_AGENTS
     
-    def __init__(self, keywords: List[str], config: CrawlerConfig):
+    def __init__(
+        self,
+        keywords: List[str],
+        config: CrawlerConfig,
+        pool: Optional[BrowserPool] = None,
+        resource_filter: Optional[ResourceFilter] = None
+    ):
         """
         初始化爬虫
         
         Args:
             keywords: 搜索关键字列表
             config: 爬虫配置
+            pool: 共享的浏览器池，由调用方负责关闭；为空时爬虫自建浏览器池，
+                在 with 语句中使用时多次搜索共用，否则每次搜索后关闭
+            resource_filter: 请求拦截规则，为空时页面资源全部下载
         """
         self.keywords = keywords
         self.config = config
-        self.playwright = None
-        self.browser = None
+        self.pool = pool
+        self.resource_filter = resource_filter
+        self._owns_pool = pool is None
+        self._keep_alive = False
     
-    def _get_random_user_agent(self) -> str:
-        """返回随机 User-Agent"""
-        return random.choice(self.USER_AGENTS)
+    def __enter__(self) -> 'SearchCrawler':
+        self._keep_alive = True
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._keep_alive = False
+        self.close()
     
     def _get_delay(self) -> float:
         """返回随机延迟时间"""
         return random.uniform(self.config.min_delay, self.config.max_delay)
     
-    def _init_browser(self):
-        """初始化浏览器"""
-        if not self.playwright:
-            self.playwright = sync_playwright().start()
-            
-            # 使用更真实的浏览器配置
-            self.browser = self.playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                ]
-            )
-            logger.info("browser.initialized")
+    def _get_pool(self) -> BrowserPool:
+        """返回浏览器池（自建的池在首次使用时创建）"""
+        if self.pool is None:
+            self.pool = BrowserPool(size=1, user_agents=self.USER_AGENTS)
+        return self.pool
     
-    def _close_browser(self):
-        """关闭浏览器"""
-        if self.browser:
-            self.browser.close()
-            self.browser = None
-        if self.playwright:
-            self.playwright.stop()
-            self.playwright = None
-            logger.info("browser.closed")
+    def close(self):
+        """关闭自建的浏览器池（共享的池由调用方关闭）"""
+        if self._owns_pool and self.pool is not None:
+            self.pool.close()
+            self.pool = None
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """
-        解析日期字符串
-        
-        Args:
-            date_str: 日期字符串
-            
-        Returns:
-            datetime: 解析后的日期
-        """
-        if not date_str:
-            return None
-        
-        try:
-            date_str = date_str.strip()
-            
-            # 标准格式 YYYY-MM-DD
-            if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-                return datetime.strptime(date_str[:10], "%Y-%m-%d")
-            
-            # 中文格式
-            match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', date_str)
-            if match:
-                year, month, day = match.groups()
-                return datetime(int(year), int(month), int(day))
-                
-        except Exception as e:
-            logger.warning("date_parse_failed", date_str=date_str, error=str(e))
-        
-        return None
+    def _source_url(self) -> str:
+        return f"{self.BASE_URL}?keywords={','.join(self.keywords)}"
     
     def parse_markdown_content(self, markdown: str) -> List[Dict]:
         """
@@ -117,103 +150,7 @@ class SearchCrawler:
         Returns:
             List[Dict]: 解析后的项目列表
         """
-        items = []
-        
-        # 按行分割
-        lines = markdown.strip().split('\n')
-        
-        current_item = None
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # 检测新项目的开始（信息类型 + 标题）
-            # 格式: "招标公告 项目标题 (广告,标识在内容中)"
-            if any(t in line for t in ['招标公告', '中标结果', '招标变更', '采购信息', '拟在建项目', '拍卖转让']):
-                # 保存上一个项目
-                if current_item and current_item.get('title'):
-                    items.append(current_item)
-                
-                # 开始新项目
-                current_item = {
-                    'id': None,
-                    'title': '',
-                    'info_type': '',
-                    'publish_date': None,
-                    'province': None,
-                    'city': None,
-                    'district': None,
-                    'owner_unit': None,
-                    'budget_amount': None,
-                    'procurement_type': None,
-                    'bidding_deadline': None,
-                    'keywords_matched': [],
-                    'project_address': None,
-                    'attachments': [],
-                    'source_url': ''
-                }
-                
-                # 提取信息类型
-                for info_type in ['招标公告', '中标结果', '招标变更', '采购信息', '拟在建项目', '拍卖转让']:
-                    if line.startswith(info_type):
-                        current_item['info_type'] = info_type
-                        # 提取标题（去除信息类型和括号内容）
-                        title = line[len(info_type):].strip()
-                        # 去除括号内容
-                        title = re.sub(r'\s*\([^)]*\)\s*$', '', title)
-                        current_item['title'] = title.strip()
-                        break
-            
-            elif current_item:
-                # 解析采购预算
-                if '采购预算：' in line or '中标金额：' in line:
-                    match = re.search(r'[采购预算|中标金额]：(.+?)(?:\s|$)', line)
-                    if match:
-                        current_item['budget_amount'] = match.group(1).strip()
-                
-                # 解析采购方式
-                if '采购方式：' in line:
-                    match = re.search(r'采购方式：(.+?)(?:\s|$)', line)
-                    if match:
-                        current_item['procurement_type'] = match.group(1).strip()
-                
-                # 解析截止时间
-                if '截止时间：' in line:
-                    match = re.search(r'截止时间：(.+?)(?:\s|$)', line)
-                    if match:
-                        deadline_str = match.group(1).strip()
-                        current_item['bidding_deadline'] = self._parse_date(deadline_str)
-                
-                # 解析地区（单独一行的省份名）
-                provinces = ['四川', '北京', '上海', '天津', '重庆', '河北', '山西', '辽宁', '吉林', 
-                           '黑龙江', '江苏', '浙江', '安徽', '福建', '江西', '山东', '河南', '湖北', 
-                           '湖南', '广东', '海南', '贵州', '云南', '陕西', '甘肃', '青海', '台湾', 
-                           '内蒙古', '广西', '西藏', '宁夏', '新疆']
-                
-                if line in provinces:
-                    current_item['province'] = line
-                
-                # 解析日期（YYYY-MM-DD格式）
-                date_match = re.match(r'(\d{4}-\d{2}-\d{2})$', line)
-                if date_match:
-                    current_item['publish_date'] = self._parse_date(date_match.group(1))
-        
-        # 保存最后一个项目
-        if current_item and current_item.get('title'):
-            items.append(current_item)
-        
-        # 生成项目ID和来源URL
-        for i, item in enumerate(items):
-            if not item['id']:
-                # 使用时间戳和索引生成临时ID
-                item['id'] = f"temp_{int(datetime.now().timestamp())}_{i}"
-            
-            if not item['source_url']:
-                item['source_url'] = f"{self.BASE_URL}?keywords={','.join(self.keywords)}"
-        
-        return items
+        return parse_listing(markdown, 'temp', self._source_url())
     
     def search_full(
         self, 
@@ -241,102 +178,119 @@ class SearchCrawler:
                    region=region,
                    keywords=self.keywords)
         
+        # 构建搜索URL
+        search_url = f"{self.BASE_URL}?keywords={','.join(self.keywords)}&mod=0"
+        
+        metrics = CrawlMetrics()
+        pages = []
         try:
-            self._init_browser()
-            
-            # 构建搜索关键字
-            keywords_str = ",".join(self.keywords)
-            
-            # 构建搜索URL
-            search_url = f"{self.BASE_URL}?keywords={keywords_str}&mod=0"
-            
-            logger.info("crawler.navigate", url=search_url)
-            
-            # 创建上下文，添加反检测措施
-            context = self.browser.new_context(
-                user_agent=self._get_random_user_agent(),
-                viewport={'width': 1920, 'height': 1080},
-                locale='zh-CN',
-            )
-            
-            # 添加反检测脚本
-            context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['zh-CN', 'zh', 'en']
-                });
-            """)
-            
-            page = context.new_page()
-            
-            # 访问搜索页面
-            response = page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
-            
-            logger.info("page.loaded", status=response.status)
-            
-            # 等待页面加载
-            delay = self._get_delay()
-            logger.info("waiting", seconds=delay)
-            time.sleep(delay)
-            
-            # 尝试等待搜索结果加载
-            try:
-                page.wait_for_selector('input[type="checkbox"]', timeout=10000)
-                logger.info("search_results.found")
-            except:
-                logger.warning("search_results.not_found", message="未找到搜索结果，可能触发验证")
-            
-            # 获取页面内容
-            content = page.content()
-            
-            # 检查是否触发验证
-            if '人机验证' in content or 'aliyunCaptcha' in content:
-                logger.error("captcha.detected", message="检测到人机验证")
-                # 保存HTML用于调试
-                with open('/home/ubuntu/bidding-crawler/logs/captcha_page.html', 'w', encoding='utf-8') as f:
-                    f.write(content)
-                page.close()
-                context.close()
-                return []
-            
-            # 使用浏览器工具提取的 Markdown 内容
-            # 由于 Playwright 的 page.content() 返回的是完整HTML
-            # 我们需要手动提取文本内容
-            
-            # 简化方案：直接从页面文本提取
-            text_content = page.evaluate("""
-                () => {
-                    return document.body.innerText;
-                }
-            """)
-            
-            logger.info("content.extracted", length=len(text_content))
-            
-            # 解析内容
-            items = self.parse_markdown_content(text_content)
-            
-            # 过滤地区
-            if region:
-                items = [item for item in items if item.get('province') == region]
-            
-            page.close()
-            context.close()
-            
-            logger.info("crawler.search.complete", total=len(items))
-            return items
+            with self._get_pool().page() as page:
+                resources = self.resource_filter.install(page) if self.resource_filter else None
+                # 搜索URL不带地区，各页先不筛选：是否翻页、是否停止只看整页结果，地区在合并后筛选
+                items = self._fetch_results(page, search_url, None, resources)
+                metrics.add_page(len(items))
+                pages.append(items)
+                
+                # 第一页之后按分页栏逐页抓取（同步 API 只能顺序访问，并行抓取见 AsyncSearchCrawler）
+                pagination = page.evaluate(PAGINATION_SCRIPT) if items else None
+                for page_no, url in enumerate(page_urls(search_url, pagination, self.config.max_pages), start=2):
+                    try:
+                        items = self._fetch_results(page, url, None, resources)
+                    except Exception as e:
+                        # 单页失败不影响已抓取的页，继续下一页
+                        logger.error("crawler.page.failed", page=page_no, url=url,
+                                     error=str(e), error_type=type(e).__name__)
+                        continue
+                    if not items:
+                        # 空页或触发验证，不再继续翻页
+                        logger.warning("crawler.pages.stopped", page=page_no)
+                        break
+                    metrics.add_page(len(items))
+                    pages.append(items)
             
         except Exception as e:
-            logger.error("crawler.search.failed", error=str(e), error_type=type(e).__name__)
+            logger.error("crawler.search.failed", error=str(e), error_type=type(e).__name__,
+                         pages=len(pages))
             import traceback
             logger.error("traceback", trace=traceback.format_exc())
-            return []
         finally:
-            self._close_browser()
+            if not self._keep_alive:
+                self.close()
+        
+        items = merge_pages(pages)
+        if region:
+            items = [item for item in items if item.get('province') == region]
+        logger.info("crawler.search.complete", total=len(items), **metrics.summary())
+        return items
+    
+    def _fetch_results(
+        self, page, url: str, region: Optional[str], resources: Optional[PageResources] = None
+    ) -> List[Dict]:
+        """
+        打开结果页并提取项目
+        
+        Args:
+            page: 从浏览器池借用的页面
+            url: 结果页URL
+            region: 地区筛选
+            resources: 页面上已安装的请求拦截计数
+            
+        Returns:
+            List[Dict]: 项目列表，触发人机验证时为空
+        """
+        logger.info("crawler.navigate", url=url)
+        
+        # 访问搜索页面
+        response = page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        
+        logger.info("page.loaded", status=response.status)
+        
+        # 等待页面加载
+        delay = self._get_delay()
+        logger.info("waiting", seconds=delay)
+        time.sleep(delay)
+        
+        # 尝试等待搜索结果加载
+        try:
+            page.wait_for_selector('input[type="checkbox"]', timeout=10000)
+            logger.info("search_results.found")
+        except:
+            logger.warning("search_results.not_found", message="未找到搜索结果，可能触发验证")
+        
+        if resources is not None:
+            # 本页拦截的请求数、实际传输的字节数和加载耗时
+            logger.info("page.resources", url=url, **resources.summary(), **page.evaluate(PAGE_METRICS_SCRIPT))
+            resources.reset()
+        
+        # 获取页面内容
+        content = page.content()
+        
+        # 检查是否触发验证
+        if '人机验证' in content or 'aliyunCaptcha' in content:
+            logger.error("captcha.detected", message="检测到人机验证")
+            # 保存HTML用于调试
+            with open('/home/ubuntu/bidding-crawler/logs/captcha_page.html', 'w', encoding='utf-8') as f:
+                f.write(content)
+            return []
+        
+        # 在页面内一次提取结构化记录（复选框中的项目ID、详情链接和各字段）
+        records = page.evaluate(EXTRACT_RECORDS_SCRIPT, {
+            'infoTypes': list(INFO_TYPES),
+            'provinces': sorted(PROVINCES),
+        })
+        logger.info("records.extracted", count=len(records))
+        
+        if records:
+            return parse_records(records, self._source_url(), region_filter=region)
+        
+        # 页面结构变化、找不到结果行时退回整页文本解析
+        text_content = page.evaluate("() => document.body.innerText")
+        logger.warning("records.not_found", message="未找到结构化结果，改用页面文本解析",
+                       length=len(text_content))
+        items = self.parse_markdown_content(text_content)
+        if region:
+            items = [item for item in items if item.get('province') == region]
+        return items
     
     def search_incremental(
         self,
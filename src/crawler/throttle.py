@@ -0,0 +1,58 @@
+"""按主机限速
+
+并发抓取时同一主机的请求仍需保持 anti_crawl 配置的间隔：每个主机限制同时
+进行的请求数，并且相邻两次请求的开始时间至少相隔 min_delay ~ max_delay 之间
+的随机秒数。不同主机之间互不影响。
+"""
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlsplit
+
+
+class _HostState:
+    __slots__ = ('semaphore', 'next_at')
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.next_at = 0.0
+
+
+class HostThrottle:
+    """按主机的并发数和请求间隔限制"""
+
+    def __init__(self, min_delay: float, max_delay: float, per_host: int = 1):
+        """
+        Args:
+            min_delay: 同一主机两次请求之间的最小间隔（秒）
+            max_delay: 最大间隔（秒），实际间隔在两者之间随机
+            per_host: 同一主机同时进行的请求数
+        """
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.per_host = per_host
+        self._hosts: Dict[str, _HostState] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        等待轮到该主机后进入，退出时释放并发名额
+
+        Args:
+            url: 请求的URL
+        """
+        host = urlsplit(url).hostname or ''
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.per_host)
+
+        async with state.semaphore:
+            # 预约开始时间后再等待（预约与更新之间没有 await，并发的请求不会拿到同一时刻）
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start = max(now, state.next_at)
+            state.next_at = start + random.uniform(self.min_delay, self.max_delay)
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
@@ -0,0 +1,156 @@
+"""Aho-Corasick 多模式匹配自动机
+
+把全部关键字构造成一个带失败指针的字典树，每段文本只需从头到尾扫描一遍，
+耗时与文本长度和命中次数有关，与关键字数量无关。不出现在任何关键字中的
+字符直接回到根状态，中文正文中绝大多数字符都走这条捷径。
+"""
+from typing import Iterator, List, Sequence, Tuple
+
+
+class AhoCorasick:
+    """Aho-Corasick 自动机（构造后只读）"""
+
+    def __init__(self, patterns: Sequence[str]):
+        """
+        构造自动机
+
+        Args:
+            patterns: 模式串列表（空串会被忽略，重复的模式串只保留第一次出现的序号）
+        """
+        self.patterns = list(patterns)
+
+        # 状态 0 为根；goto[s] 为字符到下一状态的映射，output[s] 为在该状态结束的模式序号
+        goto = [{}]
+        output = [[]]
+        seen = set()
+        for index, pattern in enumerate(self.patterns):
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(index)
+
+        # 按广度优先计算失败指针，并把后缀状态的输出合并进来
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                output[next_state].extend(output[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(values) for values in output]
+        self._alphabet = frozenset(char for pattern in seen for char in pattern)
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        扫描文本，逐个产出命中（包括重叠命中）
+
+        Args:
+            text: 待扫描文本
+
+        Yields:
+            Tuple[int, int]: (模式序号, 起始偏移)
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+        patterns = self.patterns
+
+        state = 0
+        for position, char in enumerate(text):
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                end = position + 1
+                for index in output[state]:
+                    yield index, end - len(patterns[index])
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """
+        返回全部命中，按结束位置排序
+
+        Args:
+            text: 待扫描文本
+
+        Returns:
+            List[Tuple[int, int]]: [(模式序号, 起始偏移)]
+        """
+        return list(self.iter_matches(text))
+
+    def matched_indexes(self, text: str) -> set:
+        """
+        返回命中的模式序号集合（不关心位置时使用，避免生成器开销）
+
+        Args:
+            text: 待扫描文本
+
+        Returns:
+            set: 模式序号集合
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+
+        found = set()
+        state = 0
+        for char in text:
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def contains_any(self, text: str) -> bool:
+        """
+        文本中是否出现任一模式串（命中即返回）
+
+        Args:
+            text: 待扫描文本
+
+        Returns:
+            bool: 是否命中
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+
+        state = 0
+        for char in text:
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+        return False
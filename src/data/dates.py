@@ -0,0 +1,66 @@
+"""列表日期解析
+
+列表中的发布日期和截止时间格式有限（``2026-02-02``、``2026-02-20 17:00``、
+``2026年2月20日`` 等），同一页中反复出现的只有几十个不同的值。
+定宽的 ``YYYY-MM-DD`` 直接按位置取数字，其他格式用预编译正则；
+结果按原字符串缓存（datetime 不可变，可以共享）。
+"""
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+
+# 日期后的时间：17:00 / 17:00:00 / 17时 / 17时30分
+_TIME = re.compile(r'\s*T?\s*(\d{1,2})(?::(\d{2})(?::(\d{2}))?|时(?:(\d{1,2})分)?)')
+# 非定宽的数字日期（2026-2-3、2026/02/03、2026.2.3）
+_NUMERIC_DATE = re.compile(r'(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})(?!\d)')
+_CN_DATE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+
+
+def _with_time(year: int, month: int, day: int, rest: str) -> datetime:
+    """日期后紧跟有效时间时带上时间，否则只取日期"""
+    date = datetime(year, month, day)
+    if rest:
+        match = _TIME.match(rest)
+        if match:
+            hour, minute, second, cn_minute = match.groups()
+            try:
+                return date.replace(hour=int(hour), minute=int(minute or cn_minute or 0), second=int(second or 0))
+            except ValueError:
+                pass
+    return date
+
+
+@lru_cache(maxsize=4096)
+def _parse(value: str) -> Optional[datetime]:
+    try:
+        # 定宽快速路径：YYYY-MM-DD[ HH:MM[:SS]]
+        if len(value) >= 10 and value[4] == '-' and value[7] == '-' and value[:4].isdigit() \
+                and value[5:7].isdigit() and value[8:10].isdigit():
+            return _with_time(int(value[:4]), int(value[5:7]), int(value[8:10]), value[10:])
+
+        match = _NUMERIC_DATE.match(value) or _CN_DATE.search(value)
+        if match:
+            year, month, day = match.groups()
+            return _with_time(int(year), int(month), int(day), value[match.end():])
+    except ValueError:
+        # 月、日超出范围
+        pass
+    return None
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    解析列表中的日期或截止时间
+
+    Args:
+        value: 日期字符串，如 2026-02-02、2026-02-20 17:00、2026年2月20日、
+            2026年2月20日 17时30分
+
+    Returns:
+        Optional[datetime]: 解析结果，带时间时包含时分秒；无法解析（如"详见内容"）时返回 None
+    """
+    if not value:
+        return None
+    return _parse(value.strip())
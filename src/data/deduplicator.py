@@ -1,6 +1,8 @@
 """数据去重器"""
-from typing import List
+from typing import List, Iterable
 from data.models import BiddingInfo
+from data.id_index import IDIndex
+from data.near_duplicate import NearDuplicateDetector
 
 
 class DataDeduplicator:
@@ -9,14 +11,14 @@ class DataDeduplicator:
     def deduplicate(
         self, 
         new_items: List[BiddingInfo], 
-        existing_items: List[BiddingInfo]
+        existing_items: Iterable[BiddingInfo]
     ) -> List[BiddingInfo]:
         """
         去除重复项（基于项目ID）
         
         Args:
             new_items: 新抓取的数据
-            existing_items: 已存在的数据
+            existing_items: 已存在的数据（可以是 iter_items 返回的迭代器）
             
         Returns:
             List[BiddingInfo]: 去重后的新数据
@@ -31,3 +33,47 @@ class DataDeduplicator:
         ]
         
         return unique_items
+    
+    def deduplicate_by_index(
+        self,
+        new_items: List[BiddingInfo],
+        id_index: IDIndex
+    ) -> List[BiddingInfo]:
+        """
+        去除重复项（基于持久化ID索引，不需要加载已存在的数据）
+        
+        Args:
+            new_items: 新抓取的数据
+            id_index: 已存在数据的ID索引
+            
+        Returns:
+            List[BiddingInfo]: 去重后的新数据（批内重复只保留第一条）
+        """
+        new_ids = set(id_index.filter_new(item.id for item in new_items))
+        
+        unique_items = []
+        for item in new_items:
+            if item.id in new_ids:
+                unique_items.append(item)
+                new_ids.discard(item.id)
+        
+        return unique_items
+    
+    def deduplicate_near(
+        self,
+        new_items: List[BiddingInfo],
+        detector: NearDuplicateDetector
+    ) -> List[BiddingInfo]:
+        """
+        去除近似重复项（ID不同但标题、业主、日期相近的同一公告）
+        
+        Args:
+            new_items: 新抓取的数据
+            detector: 近似重复检测器（保留的项目会登记到检测器中）
+            
+        Returns:
+            List[BiddingInfo]: 去重后的新数据
+        """
+        unique_items, _ = detector.filter(new_items)
+        
+        return unique_items
@@ -0,0 +1,293 @@
+"""持久化项目ID索引
+
+索引目录中包含三个文件：
+
+- ``ids.sorted``：按字节序排好的ID，每行一个，查询时二分查找
+- ``ids.log``：最近追加、尚未合并的ID，每行一个
+- ``ids.bloom``：覆盖 ``ids.sorted`` 的布隆过滤器，查询时按位读取（mmap）
+
+判断一批新ID是否已存在只读取索引文件，不需要加载任何项目记录。
+"""
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+from typing import Iterable, List, Set
+
+
+class BloomFilter:
+    """布隆过滤器（双重哈希）"""
+
+    HEADER = struct.Struct('<QI')
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: bytearray = None):
+        """
+        初始化过滤器
+
+        Args:
+            num_bits: 位数组长度
+            num_hashes: 哈希函数个数
+            bits: 已有的位数组
+        """
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01) -> 'BloomFilter':
+        """按容量和误判率创建过滤器（每个元素约 9.6 位、7 个哈希时误判率为 1%）"""
+        capacity = max(capacity, 1)
+        num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2)) + 1
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    @staticmethod
+    def _hashes(key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        return struct.unpack('<QQ', digest)
+
+    def positions(self, key: str) -> List[int]:
+        """返回 key 对应的位下标"""
+        h1, h2 = self._hashes(key)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> None:
+        """加入一个元素"""
+        for pos in self.positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(key))
+
+    def write(self, path: str) -> None:
+        """写入文件（文件头 + 位数组）"""
+        with open(path, 'wb') as f:
+            f.write(self.HEADER.pack(self.num_bits, self.num_hashes))
+            f.write(self.bits)
+
+
+class IDIndex:
+    """持久化项目ID索引"""
+
+    SORTED_NAME = "ids.sorted"
+    LOG_NAME = "ids.log"
+    BLOOM_NAME = "ids.bloom"
+    META_NAME = "meta.json"
+
+    # 二分查找缩小到该字节范围后改为顺序扫描
+    _SCAN_WINDOW = 4096
+
+    def __init__(self, index_dir: str, merge_threshold: int = 50000, use_bloom: bool = True):
+        """
+        初始化索引
+
+        Args:
+            index_dir: 索引目录
+            merge_threshold: 追加日志中的ID数达到该值时合并进有序文件
+            use_bloom: 是否使用布隆过滤器加速不存在的ID的判断
+        """
+        self.index_dir = index_dir
+        self.merge_threshold = merge_threshold
+        self.use_bloom = use_bloom
+        self.sorted_path = os.path.join(index_dir, self.SORTED_NAME)
+        self.log_path = os.path.join(index_dir, self.LOG_NAME)
+        self.bloom_path = os.path.join(index_dir, self.BLOOM_NAME)
+        self.meta_path = os.path.join(index_dir, self.META_NAME)
+        self._log_ids = None
+
+    def exists(self) -> bool:
+        """索引是否已建立"""
+        return os.path.exists(self.meta_path)
+
+    def read_meta(self) -> dict:
+        """读取索引元信息（ID总数、数据文件标记等）"""
+        if not os.path.exists(self.meta_path):
+            return {}
+        with open(self.meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_meta(self, meta: dict) -> None:
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, self.meta_path)
+
+    def set_stamp(self, stamp) -> None:
+        """记录与索引同步的数据文件标记"""
+        meta = self.read_meta()
+        meta['stamp'] = stamp
+        self._write_meta(meta)
+
+    def _load_log_ids(self) -> Set[str]:
+        """加载尚未合并的追加日志（规模受 merge_threshold 限制）"""
+        if self._log_ids is None:
+            ids = set()
+            if os.path.exists(self.log_path):
+                with open(self.log_path, 'r', encoding='utf-8') as f:
+                    ids.update(line.rstrip('\n') for line in f if line.strip())
+            self._log_ids = ids
+        return self._log_ids
+
+    @staticmethod
+    def _line_start_after(f, pos: int) -> int:
+        """定位到第一个起始位置 >= pos 的行"""
+        if pos == 0:
+            f.seek(0)
+        else:
+            f.seek(pos - 1)
+            f.readline()
+        return f.tell()
+
+    def _search_sorted(self, f, size: int, key: bytes) -> bool:
+        """在有序ID文件中二分查找"""
+        lo, hi = 0, size
+        while hi - lo > self._SCAN_WINDOW:
+            mid = (lo + hi) // 2
+            self._line_start_after(f, mid)
+            line = f.readline().rstrip(b'\n')
+            if not line or line >= key:
+                hi = mid
+            else:
+                lo = mid
+
+        self._line_start_after(f, lo)
+        for line in f:
+            line = line.rstrip(b'\n')
+            if line >= key:
+                return line == key
+        return False
+
+    def filter_new(self, ids: Iterable[str]) -> List[str]:
+        """
+        过滤出索引中不存在的ID（保持原顺序，批内重复只保留第一次）
+
+        Args:
+            ids: 待检查的ID
+
+        Returns:
+            List[str]: 不存在的ID
+        """
+        log_ids = self._load_log_ids()
+        has_sorted = os.path.exists(self.sorted_path) and os.path.getsize(self.sorted_path) > 0
+        bloom = None
+        bloom_file = None
+        sorted_file = None
+
+        try:
+            if has_sorted:
+                sorted_file = open(self.sorted_path, 'rb')
+                if self.use_bloom and os.path.exists(self.bloom_path):
+                    bloom_file = open(self.bloom_path, 'rb')
+                    buf = mmap.mmap(bloom_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    num_bits, num_hashes = BloomFilter.HEADER.unpack_from(buf, 0)
+                    bloom = (buf, BloomFilter(num_bits, num_hashes, bits=bytearray()))
+
+            size = os.path.getsize(self.sorted_path) if has_sorted else 0
+            seen = set()
+            result = []
+            for item_id in ids:
+                if item_id in seen or item_id in log_ids:
+                    continue
+                seen.add(item_id)
+
+                if has_sorted:
+                    if bloom is not None:
+                        buf, shape = bloom
+                        offset = BloomFilter.HEADER.size
+                        maybe = all(
+                            buf[offset + (pos >> 3)] & (1 << (pos & 7))
+                            for pos in shape.positions(item_id)
+                        )
+                        if maybe and self._search_sorted(sorted_file, size, item_id.encode('utf-8')):
+                            continue
+                    elif self._search_sorted(sorted_file, size, item_id.encode('utf-8')):
+                        continue
+
+                result.append(item_id)
+            return result
+        finally:
+            if bloom is not None:
+                bloom[0].close()
+            if bloom_file is not None:
+                bloom_file.close()
+            if sorted_file is not None:
+                sorted_file.close()
+
+    def contains(self, item_id: str) -> bool:
+        """判断ID是否已存在"""
+        return not self.filter_new([item_id])
+
+    def add(self, ids: Iterable[str]) -> None:
+        """
+        追加ID（写入追加日志，超过阈值时自动合并）
+
+        Args:
+            ids: 新ID（调用方应已通过 filter_new 去重）
+        """
+        ids = list(ids)
+        if not ids:
+            return
+
+        os.makedirs(self.index_dir, exist_ok=True)
+        log_ids = self._load_log_ids()
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            for item_id in ids:
+                f.write(item_id)
+                f.write('\n')
+        log_ids.update(ids)
+
+        meta = self.read_meta()
+        meta['count'] = meta.get('count', 0) + len(ids)
+        self._write_meta(meta)
+
+        if len(log_ids) >= self.merge_threshold:
+            self.merge()
+
+    def merge(self) -> None:
+        """将追加日志合并进有序文件，并重建布隆过滤器"""
+        ids = set(self._load_log_ids())
+        if os.path.exists(self.sorted_path):
+            with open(self.sorted_path, 'r', encoding='utf-8') as f:
+                ids.update(line.rstrip('\n') for line in f if line.strip())
+        self._write_sorted(ids)
+
+        if os.path.exists(self.log_path):
+            os.unlink(self.log_path)
+        self._log_ids = set()
+
+    def rebuild(self, ids: Iterable[str], stamp=None) -> None:
+        """
+        用给定ID全量重建索引
+
+        Args:
+            ids: 全部ID
+            stamp: 与索引同步的数据文件标记
+        """
+        os.makedirs(self.index_dir, exist_ok=True)
+        ids = set(ids)
+        self._write_sorted(ids)
+        if os.path.exists(self.log_path):
+            os.unlink(self.log_path)
+        self._log_ids = set()
+        self._write_meta({'count': len(ids), 'stamp': stamp})
+
+    def _write_sorted(self, ids: Set[str]) -> None:
+        """写入有序ID文件和布隆过滤器"""
+        os.makedirs(self.index_dir, exist_ok=True)
+        encoded = sorted(item_id.encode('utf-8') for item_id in ids)
+
+        tmp_path = self.sorted_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            for item_id in encoded:
+                f.write(item_id)
+                f.write(b'\n')
+        os.replace(tmp_path, self.sorted_path)
+
+        if self.use_bloom:
+            bloom = BloomFilter.for_capacity(len(encoded))
+            for item_id in ids:
+                bloom.add(item_id)
+            bloom.write(self.bloom_path + ".tmp")
+            os.replace(self.bloom_path + ".tmp", self.bloom_path)
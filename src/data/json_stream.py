@@ -0,0 +1,125 @@
+"""JSON 数组流式读取
+
+按块读取文件，用 ``json.JSONDecoder.raw_decode`` 逐个解码数组元素，
+内存占用只与单条记录和读块大小有关，与文件总大小无关。
+支持两种文件结构：
+
+- ``{"metadata": {...}, "data": [...]}``（JSONStorage 的格式）
+- ``[...]``（顶层即为数组）
+"""
+import json
+import re
+from typing import Any, Dict, Iterator, TextIO
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _ChunkReader:
+    """带缓冲的增量解码器"""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """读取下一块，丢弃已消费的部分"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """跳过空白，返回下一个字符（文件结束时返回空串）"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"JSON 结构错误：期望 {char!r}，位置 {self.pos}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """解码一个完整的 JSON 值"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 数字等值可能被块边界截断，到达缓冲区末尾时多读一块再确认
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def array(self) -> Iterator[Any]:
+        """逐个产出数组元素"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(f"JSON 结构错误：数组中出现 {char!r}")
+
+
+def iter_json_array(path: str, key: str = 'data', chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """
+    流式读取 JSON 文件中的记录数组
+
+    Args:
+        path: 文件路径
+        key: 顶层为对象时，记录数组所在的键
+        chunk_size: 每次读取的字符数
+
+    Yields:
+        Dict: 单条记录
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _ChunkReader(f, chunk_size)
+        first = reader.peek()
+
+        if first == '[':
+            yield from reader.array()
+            return
+
+        if first != '{':
+            return
+
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            name = reader.value()
+            reader.expect(':')
+            if name == key:
+                yield from reader.array()
+                return
+            reader.value()
+            char = reader.peek()
+            reader.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f"JSON 结构错误：对象中出现 {char!r}")
@@ -0,0 +1,79 @@
+"""关键字位置标注
+
+采招网搜索结果在标题后用括号标注关键字出现的位置（见 location_tag_types.md）：
+
+- 无标注：关键字在标题中
+- ``(广告,标识等在内容中)``：在正文中
+- ``(广告,标识等在内容或附件中) 附件``：在正文或附件中
+- ``(广告,标识等在内容或标书中) 标书``：在正文或标书中
+
+解析列表时用 split_location_tag 把标注从标题中拆出来，匹配关键字时再用
+keyword_locations 结合"标题是否命中关键字"得到位置列表，不再需要抓取后
+重新读写整个数据文件。
+"""
+import re
+from typing import List, Tuple
+
+
+# 标题末尾的位置标注，以及紧随其后的"附件"/"标书"标签
+_LOCATION_TAG = re.compile(
+    r'\s*([(（][^()（）]*(?:在内容|在正文|在标题|附件|标书)[^()（）]*[)）])((?:\s*(?:附件|标书))*)\s*$'
+)
+# 标注被去掉后仍可能残留的标签
+_TRAILING_LABELS = re.compile(r'((?:\s+(?:附件|标书))+)\s*$')
+
+# 单独成行的标签（页面复制内容中标签可能单独占一行）
+LABEL_LINES = frozenset(('附件', '标书'))
+
+
+def split_location_tag(raw_title: str) -> Tuple[str, str, bool, bool]:
+    """
+    拆分标题和位置标注
+
+    Args:
+        raw_title: 列表中的原始标题（已去掉信息类型前缀）
+
+    Returns:
+        Tuple[str, str, bool, bool]: (标题, 位置标注, 是否有附件, 是否有标书)，
+        没有标注时位置标注为空串
+    """
+    raw_title = raw_title.strip()
+    match = _LOCATION_TAG.search(raw_title)
+    if match:
+        tag, labels = match.group(1), match.group(2)
+        title = raw_title[:match.start()].rstrip()
+    else:
+        tag = ''
+        label_match = _TRAILING_LABELS.search(raw_title)
+        labels = label_match.group(1) if label_match else ''
+        title = raw_title[:label_match.start()].rstrip() if label_match else raw_title
+
+    has_attachments = '附件' in tag or '附件' in labels
+    has_bidding_docs = '标书' in tag or '标书' in labels
+    return title, tag, has_attachments, has_bidding_docs
+
+
+def keyword_locations(in_title: bool, tag: str) -> List[str]:
+    """
+    计算关键字位置列表
+
+    Args:
+        in_title: 标题中是否命中关键字
+        tag: 位置标注（可为空）
+
+    Returns:
+        List[str]: 位置列表，取值为 标题 / 正文 / 附件 / 标书；没有任何信息时为 ['正文']
+    """
+    locations = []
+    if in_title or '在标题' in tag:
+        locations.append('标题')
+    if tag:
+        if '在内容' in tag or '在正文' in tag or '附件' in tag or '标书' in tag:
+            locations.append('正文')
+        if '附件' in tag:
+            locations.append('附件')
+        if '标书' in tag:
+            locations.append('标书')
+    if not locations:
+        locations.append('正文')
+    return locations
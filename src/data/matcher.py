@@ -1,5 +1,91 @@
-"""关键字匹配引擎"""
-from typing import List, Dict
+"""关键字匹配引擎
+
+关键字较多时编译为 Aho-Corasick 自动机，每段文本只扫描一遍，耗时不随关键字
+数量增长；关键字较少时逐个 ``keyword in text`` 由 C 实现的子串查找完成，
+比纯 Python 的逐字符状态转移更快（见 benchmarks/bench_matcher.py）。两者的耗时都
+随文本长度增长，但自动机每个字符的常数大得多，长文本（标题+正文）上需要更多关键字
+才值得改用自动机，因此按关键字数量和文本长度一起选择。
+
+关键字列表中也可以写布尔规则（如 ``标识 AND NOT 停车场``、``牌 AND owner_unit:学校``，
+语法见 data/rules.py），规则中的项按字段合并扫描，每个字段只扫描一遍。
+"""
+from multiprocessing import Pool
+from typing import List, Dict, Tuple, Iterable, Optional, Set, Union
+from data.aho_corasick import AhoCorasick
+from data.rules import RuleCompiler, TEXT_FIELD
+from data.keyword_location import keyword_locations
+
+
+# 关键字数量达到该值时改用自动机（标题长度文本上两者耗时大致持平的位置）
+AUTOMATON_MIN_KEYWORDS = 100
+
+# 超过该长度的文本（如标题+正文）按 AUTOMATON_MIN_KEYWORDS_LONG_TEXT 选择：
+# 约 2000 字的正文上 100 个关键字时自动机只有子串循环 0.6 倍的速度，约 300 个时超过子串循环
+LONG_TEXT_CHARS = 200
+AUTOMATON_MIN_KEYWORDS_LONG_TEXT = 300
+
+# 文本数量少于该值时不启动进程池（进程启动和结果回传的开销大于收益）
+POOL_MIN_TEXTS = 20000
+
+# 进程池子进程中的匹配器，由 _init_worker 创建，避免每批任务重复传输和编译关键字
+_worker_matcher = None
+
+
+def _init_worker(keywords: List[str]) -> None:
+    global _worker_matcher
+    _worker_matcher = KeywordMatcher(keywords)
+
+
+def _match_chunk(texts: List[str]) -> List[List[str]]:
+    return _worker_matcher._match_list(texts)
+
+
+def _match_items_chunk(items: List) -> List[List[str]]:
+    return _worker_matcher._match_items_list(items)
+
+
+def _relevant_chunk(items: List) -> List[bool]:
+    return _worker_matcher._relevant_list(items)
+
+
+def _chunks(values: List, size: int) -> List[List]:
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def _field(item, name: str) -> str:
+    """读取项目字段（支持字典和 BiddingInfo），空值返回空串"""
+    value = item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+    return value or ''
+
+
+class _TermScanner:
+    """一组关键字的子串扫描器，按关键字数量和文本长度选择子串循环或自动机"""
+    
+    def __init__(self, terms: List[str]):
+        self.terms = terms
+        self.automaton = AhoCorasick(terms)
+        self.use_automaton = len(terms) >= AUTOMATON_MIN_KEYWORDS
+        self.use_automaton_long = len(terms) >= AUTOMATON_MIN_KEYWORDS_LONG_TEXT
+    
+    def automaton_for(self, text: str) -> bool:
+        """该文本是否使用自动机扫描"""
+        if len(text) > LONG_TEXT_CHARS:
+            return self.use_automaton_long
+        return self.use_automaton
+    
+    def indexes(self, text: str) -> List[int]:
+        """命中的关键字序号（升序）"""
+        if not self.automaton_for(text):
+            return [index for index, term in enumerate(self.terms) if term in text]
+        return sorted(self.automaton.matched_indexes(text))
+    
+    def has_any(self, text: str) -> bool:
+        if self.automaton_for(text):
+            return self.automaton.contains_any(text)
+        for term in self.terms:
+            if term in text:
+                return True
+        return False
 
 
 class KeywordMatcher:
@@ -10,14 +96,91 @@ class KeywordMatcher:
         初始化匹配器
         
         Args:
-            keywords: 关键字列表
+            keywords: 关键字或规则列表
+            
+        Raises:
+            ValueError: 规则语法错误
         """
         self.keywords = keywords
+        
+        compiler = RuleCompiler()
+        self.rules = [compiler.compile(keyword) for keyword in keywords]
+        self._plain = all(rule.plain for rule in self.rules)
+        
+        # 普通关键字列表：直接扫描，结果按关键字列表顺序返回
+        self._scanner = _TermScanner(keywords) if self._plain else None
+        
+        # 规则：按字段分组的扫描器，以及 项编号 -> 关键字
+        self._field_scanners: Dict[str, Tuple[_TermScanner, List[int]]] = {}
+        self._term_names: Dict[int, str] = {}
+        if not self._plain:
+            grouped: Dict[str, Tuple[List[str], List[int]]] = {}
+            for (field, term), term_id in compiler.terms.items():
+                terms, ids = grouped.setdefault(field, ([], []))
+                terms.append(term)
+                ids.append(term_id)
+                self._term_names[term_id] = term
+            self._field_scanners = {
+                field: (_TermScanner(terms), ids) for field, (terms, ids) in grouped.items()
+            }
+        
+    
+    def _hits(self, fields: Dict[str, str]) -> Set[int]:
+        """逐字段扫描一遍，返回命中的项编号"""
+        hits = set()
+        for field, (scanner, ids) in self._field_scanners.items():
+            text = fields.get(field)
+            if text:
+                hits.update(ids[index] for index in scanner.indexes(text))
+        return hits
+    
+    def _rule_results(self, fields: Dict[str, str]) -> Dict[int, List[str]]:
+        """规则求值，返回 {成立的规则序号: 命中的肯定项}"""
+        if self._plain:
+            text = fields.get(TEXT_FIELD)
+            if not text:
+                return {}
+            keywords = self.keywords
+            return {index: [keywords[index]] for index in self._scanner.indexes(text)}
+        
+        hits = self._hits(fields)
+        results = {}
+        if not hits:
+            return results
+        names = self._term_names
+        for index, rule in enumerate(self.rules):
+            if rule.evaluate(hits):
+                results[index] = [names[term_id] for term_id in rule.positive if term_id in hits]
+        return results
+    
+    def _evaluate(self, fields: Dict[str, str]) -> List[str]:
+        """规则求值，返回成立的规则中命中的肯定项（去重，按规则顺序）"""
+        matched = []
+        for terms in self._rule_results(fields).values():
+            for term in terms:
+                if term not in matched:
+                    matched.append(term)
+        return matched
+    
+    @staticmethod
+    def _item_fields(item: Union[Dict, object]) -> Dict[str, str]:
+        """项目中参与匹配的字段"""
+        title = _field(item, 'title')
+        content = _field(item, 'content')
+        return {
+            TEXT_FIELD: f"{title} {content}",
+            'title': title,
+            'content': content,
+            'owner_unit': _field(item, 'owner_unit'),
+            'project_address': _field(item, 'project_address'),
+        }
     
     def match(self, text: str) -> List[str]:
         """
         在文本中匹配关键字
         
+        使用规则时 text 同时作为标题参与 title: 限定的项，其余字段视为空。
+        
         Args:
             text: 待匹配文本
             
@@ -27,12 +190,189 @@ class KeywordMatcher:
         if not text:
             return []
         
-        matched = []
-        for keyword in self.keywords:
-            if keyword in text:
-                matched.append(keyword)
+        if self._plain:
+            # 按关键字列表中的顺序返回
+            if not self._scanner.automaton_for(text):
+                return [keyword for keyword in self.keywords if keyword in text]
+            keywords = self.keywords
+            return [keywords[index] for index in sorted(self._scanner.automaton.matched_indexes(text))]
         
-        return matched
+        return self._evaluate({TEXT_FIELD: text, 'title': text})
+    
+    def match_item(self, item: Union[Dict, object]) -> List[str]:
+        """
+        匹配项目的关键字（规则中的字段限定按项目对应字段匹配）
+        
+        Args:
+            item: 项目信息字典或 BiddingInfo
+            
+        Returns:
+            List[str]: 匹配到的关键字列表
+        """
+        if self._plain:
+            title = _field(item, 'title')
+            content = _field(item, 'content')
+            return self.match(f"{title} {content}")
+        
+        return self._evaluate(self._item_fields(item))
+    
+    def match_rules(self, item: Union[Dict, object]) -> Dict[int, List[str]]:
+        """
+        按规则返回项目的匹配结果
+        
+        Args:
+            item: 项目信息字典或 BiddingInfo
+            
+        Returns:
+            Dict[int, List[str]]: {成立的规则在关键字列表中的序号: 命中的关键字}
+        """
+        return self._rule_results(self._item_fields(item))
+    
+    def annotate(self, item: Dict) -> Dict:
+        """
+        匹配关键字并标注位置（原地更新项目字典）
+        
+        设置 keywords_matched 和 keyword_location：标题命中关键字时位置包含"标题"，
+        其余位置来自解析时拆出的 keyword_location_tag（见 data/keyword_location.py）。
+        has_attachments / has_bidding_docs 由解析器根据标注设置，这里不改动。
+        
+        Args:
+            item: 项目信息字典
+            
+        Returns:
+            Dict: 同一个字典
+        """
+        matched = self.match_item(item)
+        title = item.get('title') or ''
+        item['keywords_matched'] = matched
+        item['keyword_location'] = keyword_locations(
+            any(keyword in title for keyword in matched),
+            item.get('keyword_location_tag') or ''
+        )
+        return item
+    
+    def annotate_items(self, items: Iterable[Dict]) -> List[Dict]:
+        """
+        批量匹配关键字并标注位置
+        
+        Args:
+            items: 项目信息字典列表
+            
+        Returns:
+            List[Dict]: 同一批字典
+        """
+        annotate = self.annotate
+        return [annotate(item) for item in items]
+    
+    def find(self, text: str) -> List[Tuple[str, int]]:
+        """
+        在文本中查找关键字及其出现位置（同一关键字多次出现时全部返回）
+        
+        使用规则时只报告未限定字段的项，不做规则求值。
+        
+        Args:
+            text: 待匹配文本
+            
+        Returns:
+            List[Tuple[str, int]]: [(关键字, 起始偏移)]，按起始偏移排序
+        """
+        scanner = self._scanner or self._field_scanners.get(TEXT_FIELD, (None,))[0]
+        if not text or scanner is None:
+            return []
+        
+        terms = scanner.terms
+        hits = [(terms[index], start) for index, start in scanner.automaton.iter_matches(text)]
+        hits.sort(key=lambda hit: hit[1])
+        return hits
+    
+    def _is_relevant_item(self, item) -> bool:
+        if self._plain:
+            # 标题和内容之间以空格连接，命中一个关键字即停止
+            text = f"{_field(item, 'title')} {_field(item, 'content')}"
+            return self._scanner.has_any(text)
+        return bool(self.match_item(item))
+    
+    def _match_list(self, texts: List[str]) -> List[List[str]]:
+        match = self.match
+        return [match(text) for text in texts]
+    
+    def _match_items_list(self, items: List) -> List[List[str]]:
+        match_item = self.match_item
+        return [match_item(item) for item in items]
+    
+    def _relevant_list(self, items: List) -> List[bool]:
+        is_relevant = self._is_relevant_item
+        return [is_relevant(item) for item in items]
+    
+    def _run(self, values: List, processes: Optional[int], local, worker) -> List:
+        """在本进程或进程池中批量执行，结果顺序与输入一致"""
+        if not processes or processes <= 1 or len(values) < POOL_MIN_TEXTS:
+            return local(values)
+        
+        # 每个进程分到若干块，块足够大以摊薄进程间通信开销
+        chunk_size = max(1000, len(values) // (processes * 4))
+        with Pool(processes, initializer=_init_worker, initargs=(list(self.keywords),)) as pool:
+            results = []
+            for part in pool.imap(worker, _chunks(values, chunk_size)):
+                results.extend(part)
+        return results
+    
+    def match_many(self, texts: Iterable[str], processes: Optional[int] = None):
+        """
+        批量匹配关键字
+        
+        Args:
+            texts: 文本列表，也可以是 pandas Series（空值视为空文本）
+            processes: 进程数，大于 1 且文本数量达到 POOL_MIN_TEXTS 时使用进程池
+            
+        Returns:
+            List[List[str]]: 每段文本匹配到的关键字列表；输入为 Series 时返回同索引的 Series
+        """
+        series = None
+        if type(texts).__name__ == 'Series' and hasattr(texts, 'index'):
+            series = texts
+            texts = [text if isinstance(text, str) else '' for text in series.tolist()]
+        elif not isinstance(texts, list):
+            texts = list(texts)
+        
+        results = self._run(texts, processes, self._match_list, _match_chunk)
+        
+        if series is not None:
+            return type(series)(results, index=series.index, name=series.name)
+        return results
+    
+    def match_items(self, items: Iterable, processes: Optional[int] = None) -> List[List[str]]:
+        """
+        批量匹配项目的关键字（match_item 的批量版本）
+        
+        Args:
+            items: 项目信息字典或 BiddingInfo 列表
+            processes: 进程数，含义同 match_many
+            
+        Returns:
+            List[List[str]]: 每个项目匹配到的关键字列表
+        """
+        if not isinstance(items, list):
+            items = list(items)
+        return self._run(items, processes, self._match_items_list, _match_items_chunk)
+    
+    def filter_relevant(self, items: Iterable[Dict], processes: Optional[int] = None) -> List[Dict]:
+        """
+        批量筛选相关项目（标题或内容中至少匹配一个关键字）
+        
+        Args:
+            items: 项目信息字典列表
+            processes: 进程数，含义同 match_many
+            
+        Returns:
+            List[Dict]: 相关项目，保持原顺序
+        """
+        if not isinstance(items, list):
+            items = list(items)
+        
+        flags = self._run(items, processes, self._relevant_list, _relevant_chunk)
+        
+        return [item for item, relevant in zip(items, flags) if relevant]
     
     def is_relevant(self, item: Dict) -> bool:
         """
@@ -44,11 +384,4 @@ class KeywordMatcher:
         Returns:
             bool: True 表示相关，False 表示不相关
         """
-        title = item.get('title', '')
-        content = item.get('content', '')
-        
-        # 在标题和内容中搜索关键字
-        text = f"{title} {content}"
-        matched = self.match(text)
-        
-        return len(matched) > 0
+        return self._is_relevant_item(item)
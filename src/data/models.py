@@ -1,12 +1,49 @@
 """数据模型定义"""
-from dataclasses import dataclass, asdict, field
+import gc
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict
+from functools import lru_cache
+from typing import Optional, List, Dict, Iterable, Callable
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def decode_datetime(value: str) -> datetime:
+    """
+    解析 ISO 格式日期字符串（带缓存）
+    
+    发布日期和截止时间在大量记录中重复出现，datetime 不可变，可以安全共享。
+    
+    Args:
+        value: ISO 格式字符串
+        
+    Returns:
+        datetime: 解析结果
+    """
+    return datetime.fromisoformat(value)
+
+
+@contextmanager
+def paused_gc():
+    """
+    暂停循环垃圾回收（可嵌套）
+    
+    解析大文件、批量构造实例时会连续新建数十万个容器对象，分代回收会被
+    反复触发并扫描整个堆，而这些对象之间并不存在循环引用。
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@dataclass(slots=True)
 class BiddingInfo:
-    """招投标信息实体"""
+    """招投标信息实体（使用 __slots__，无实例 __dict__）"""
     
     # 唯一标识
     id: str
@@ -32,6 +69,7 @@ class BiddingInfo:
     # 内容与附件
     keywords_matched: List[str] = field(default_factory=list)
     keyword_location: List[str] = field(default_factory=list)  # 新增：关键字出现位置
+    keyword_location_tag: str = ""  # 列表中标题后的位置标注原文，如 "(广告,标识等在内容中)"
     project_address: Optional[str] = None
     attachments: List[str] = field(default_factory=list)
     
@@ -45,25 +83,96 @@ class BiddingInfo:
     crawled_at: datetime = None
     
     def __post_init__(self):
-        """初始化默认值"""
+        """初始化默认值，驻留低基数字段和关键字字符串"""
         if self.crawled_at is None:
             self.crawled_at = datetime.now()
+        
+        # 取值有限、在大量记录中反复出现的字段驻留以共享字符串对象；
+        # 逐字段展开，批量加载时比 getattr/setattr 循环快
+        intern = sys.intern
+        if self.info_type.__class__ is str:
+            self.info_type = intern(self.info_type)
+        if self.province.__class__ is str:
+            self.province = intern(self.province)
+        if self.city.__class__ is str:
+            self.city = intern(self.city)
+        if self.district.__class__ is str:
+            self.district = intern(self.district)
+        if self.procurement_type.__class__ is str:
+            self.procurement_type = intern(self.procurement_type)
+        for values in (self.keywords_matched, self.keyword_location):
+            if values:
+                values[:] = [intern(v) if v.__class__ is str else v for v in values]
     
     def to_dict(self) -> Dict:
-        """转换为字典"""
-        data = asdict(self)
-        # 转换 datetime 为 ISO 格式字符串
-        if isinstance(data['publish_date'], datetime):
-            data['publish_date'] = data['publish_date'].isoformat()
-        if data['bidding_deadline'] and isinstance(data['bidding_deadline'], datetime):
-            data['bidding_deadline'] = data['bidding_deadline'].isoformat()
-        if isinstance(data['crawled_at'], datetime):
-            data['crawled_at'] = data['crawled_at'].isoformat()
-        return data
+        """转换为字典（逐字段构造，列表浅拷贝，不使用 asdict 的递归深拷贝）"""
+        publish_date = self.publish_date
+        bidding_deadline = self.bidding_deadline
+        crawled_at = self.crawled_at
+        return {
+            'id': self.id,
+            'title': self.title,
+            'info_type': self.info_type,
+            # 转换 datetime 为 ISO 格式字符串
+            'publish_date': publish_date.isoformat() if isinstance(publish_date, datetime) else publish_date,
+            'province': self.province,
+            'city': self.city,
+            'district': self.district,
+            'owner_unit': self.owner_unit,
+            'budget_amount': self.budget_amount,
+            'procurement_type': self.procurement_type,
+            'bidding_deadline': (
+                bidding_deadline.isoformat()
+                if bidding_deadline and isinstance(bidding_deadline, datetime)
+                else bidding_deadline
+            ),
+            'keywords_matched': list(self.keywords_matched),
+            'keyword_location': list(self.keyword_location),
+            'keyword_location_tag': self.keyword_location_tag,
+            'project_address': self.project_address,
+            'attachments': list(self.attachments),
+            'has_attachments': self.has_attachments,
+            'has_bidding_docs': self.has_bidding_docs,
+            'source_url': self.source_url,
+            'detail_url': self.detail_url,
+            'crawled_at': crawled_at.isoformat() if isinstance(crawled_at, datetime) else crawled_at,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'BiddingInfo':
         """从字典创建实例"""
+        return cls._from_dict(data, decode_datetime)
+    
+    @classmethod
+    def from_dicts(cls, records: Iterable[Dict]) -> List['BiddingInfo']:
+        """
+        批量从字典创建实例
+        
+        整批共用一个日期解码缓存（普通字典，无淘汰开销），同一天的发布日期和
+        截止时间只解析一次。抓取时间精确到微秒、几乎每条不同，不经过缓存，
+        缓存大小只与不同日期的数量有关。构造期间暂停循环垃圾回收。
+        
+        Args:
+            records: 字典列表
+            
+        Returns:
+            List[BiddingInfo]: 实例列表
+        """
+        cache = {}
+        
+        def decode(value: str) -> datetime:
+            result = cache.get(value)
+            if result is None:
+                result = cache[value] = datetime.fromisoformat(value)
+            return result
+        
+        from_dict = cls._from_dict
+        with paused_gc():
+            return [from_dict(data, decode) for data in records]
+    
+    @classmethod
+    def _from_dict(cls, data: Dict, decode: Callable[[str], datetime]) -> 'BiddingInfo':
+        """从字典创建实例，decode 负责把发布日期和截止时间的 ISO 字符串解析为 datetime"""
         # 处理可能缺失的新字段
         if 'keyword_location' not in data:
             data['keyword_location'] = []
@@ -75,10 +184,14 @@ class BiddingInfo:
             data['detail_url'] = data.get('source_url', '')
         
         # 转换 ISO 格式字符串为 datetime
-        if isinstance(data.get('publish_date'), str):
-            data['publish_date'] = datetime.fromisoformat(data['publish_date'])
-        if data.get('bidding_deadline') and isinstance(data['bidding_deadline'], str):
-            data['bidding_deadline'] = datetime.fromisoformat(data['bidding_deadline'])
-        if isinstance(data.get('crawled_at'), str):
-            data['crawled_at'] = datetime.fromisoformat(data['crawled_at'])
+        value = data.get('publish_date')
+        if isinstance(value, str):
+            data['publish_date'] = decode(value)
+        value = data.get('bidding_deadline')
+        if value and isinstance(value, str):
+            data['bidding_deadline'] = decode(value)
+        value = data.get('crawled_at')
+        if isinstance(value, str):
+            # 每条记录各不相同，缓存只会增长而不会命中
+            data['crawled_at'] = datetime.fromisoformat(value)
         return cls(**data)
@@ -0,0 +1,248 @@
+"""近似重复公告检测
+
+爬虫生成的ID带有抓取时间戳（``temp_<timestamp>_<i>`` / ``browser_<timestamp>_<i>``），
+同一条公告在不同日期抓取会得到不同的ID。这里对规范化后的标题计算 MinHash
+签名，按分带（banding）放入 LSH 桶中，新公告只需与同桶的候选比较，
+再结合信息类型、业主单位和发布日期确认是否为同一条公告（同一项目的招标公告、
+变更和结果公告标题相同，但不是重复）。
+"""
+import hashlib
+import json
+import os
+import re
+import struct
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from data.models import BiddingInfo
+
+
+# 标题末尾的关键字位置标注，如 "(广告,标识等在内容中)"、"（广告等在内容或附件中）"
+_LOCATION_SUFFIX = re.compile(r'\s*[\(（][^()（）]*(?:在内容|在正文|附件|标书)[^()（）]*[\)）]\s*$')
+# 标点、空白等不参与比较的字符
+_NOISE = re.compile(r'[\s\-_—·,，.。:：;；、()（）\[\]【】<>《》"“”\'‘’/\\|]+')
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_title(title: str) -> str:
+    """
+    规范化标题：去掉位置标注、标点和空白，统一为小写
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        str: 规范化后的标题
+    """
+    if not title:
+        return ""
+    title = _LOCATION_SUFFIX.sub('', title)
+    return _NOISE.sub('', title).lower()
+
+
+def _shingles(text: str, size: int = 2) -> set:
+    """字符 n-gram 集合"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _hash64(value: str) -> int:
+    return struct.unpack('<Q', hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest())[0]
+
+
+class NearDuplicateDetector:
+    """基于 MinHash + LSH 的近似重复检测器"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        num_perm: int = 32,
+        bands: int = 8,
+        threshold: float = 0.8,
+        max_date_gap_days: int = 3
+    ):
+        """
+        初始化检测器
+
+        Args:
+            path: 指纹持久化文件（JSONL），为空时只在内存中保存
+            num_perm: MinHash 签名长度
+            bands: LSH 分带数（每带 num_perm // bands 行）
+            threshold: 判定为重复的最小估计 Jaccard 相似度
+            max_date_gap_days: 发布日期相差超过该天数时不视为重复
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm 必须能被 bands 整除")
+
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_date_gap_days = max_date_gap_days
+
+        # 固定种子生成哈希参数，保证持久化的签名在不同进程间可比
+        self._params = [
+            (_hash64(f"a{i}") % (_MERSENNE_PRIME - 1) + 1, _hash64(f"b{i}") % _MERSENNE_PRIME)
+            for i in range(num_perm)
+        ]
+
+        self._entries: Dict[str, Dict] = {}
+        self._buckets: Dict[Tuple[int, int], List[str]] = {}
+        self._pending: List[Dict] = []
+        self._loaded = False
+
+    def signature(self, title: str) -> List[int]:
+        """
+        计算标题的 MinHash 签名
+
+        Args:
+            title: 原始标题
+
+        Returns:
+            List[int]: 签名
+        """
+        hashes = [_hash64(shingle) for shingle in _shingles(normalize_title(title))]
+        if not hashes:
+            return [0] * self.num_perm
+        return [
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes) & 0xFFFFFFFF
+            for a, b in self._params
+        ]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, int]]:
+        return [
+            (band, hash(tuple(signature[band * self.rows:(band + 1) * self.rows])))
+            for band in range(self.bands)
+        ]
+
+    def _ensure_loaded(self) -> None:
+        """首次使用时从持久化文件加载指纹"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path and os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        self._index(json.loads(line))
+
+    def _index(self, entry: Dict) -> None:
+        self._entries[entry['id']] = entry
+        for key in self._band_keys(entry['sig']):
+            self._buckets.setdefault(key, []).append(entry['id'])
+
+    def _entry(self, item: BiddingInfo) -> Dict:
+        publish_date = item.publish_date
+        return {
+            'id': item.id,
+            'sig': self.signature(item.title),
+            'type': item.info_type or "",
+            'owner': item.owner_unit or "",
+            'date': publish_date.strftime("%Y-%m-%d") if isinstance(publish_date, datetime) else None,
+        }
+
+    def _is_same_notice(self, entry: Dict, other: Dict) -> bool:
+        """确认候选是否为同一条公告"""
+        # 旧版本持久化的指纹没有信息类型，此时不比较
+        if entry.get('type') and other.get('type') and entry['type'] != other['type']:
+            return False
+
+        if entry['owner'] and other['owner'] and entry['owner'] != other['owner']:
+            return False
+
+        if entry['date'] and other['date']:
+            gap = abs((datetime.fromisoformat(entry['date']) - datetime.fromisoformat(other['date'])).days)
+            if gap > self.max_date_gap_days:
+                return False
+
+        same = sum(1 for x, y in zip(entry['sig'], other['sig']) if x == y)
+        return same / self.num_perm >= self.threshold
+
+    def _match(self, entry: Dict) -> Optional[str]:
+        checked = set()
+        for key in self._band_keys(entry['sig']):
+            for candidate_id in self._buckets.get(key, ()):
+                if candidate_id in checked or candidate_id == entry['id']:
+                    continue
+                checked.add(candidate_id)
+                if self._is_same_notice(entry, self._entries[candidate_id]):
+                    return candidate_id
+        return None
+
+    def find_duplicate(self, item: BiddingInfo) -> Optional[str]:
+        """
+        查找与项目近似重复的已有项目
+
+        Args:
+            item: 待检查项目
+
+        Returns:
+            Optional[str]: 重复项目的ID，没有则返回 None
+        """
+        self._ensure_loaded()
+        return self._match(self._entry(item))
+
+    def add(self, item: BiddingInfo) -> None:
+        """登记项目指纹（调用 flush 后持久化）"""
+        self._ensure_loaded()
+        entry = self._entry(item)
+        self._index(entry)
+        self._pending.append(entry)
+
+    def filter(self, items: List[BiddingInfo]) -> Tuple[List[BiddingInfo], List[Tuple[BiddingInfo, str]]]:
+        """
+        过滤近似重复项目（批内重复同样会被识别）
+
+        Args:
+            items: 新项目列表
+
+        Returns:
+            Tuple: (保留的项目, [(重复项目, 对应的已有项目ID)])
+        """
+        self._ensure_loaded()
+        kept = []
+        duplicates = []
+        for item in items:
+            entry = self._entry(item)
+            duplicate_of = self._match(entry)
+            if duplicate_of is None:
+                self._index(entry)
+                self._pending.append(entry)
+                kept.append(item)
+            else:
+                duplicates.append((item, duplicate_of))
+        return kept, duplicates
+
+    def flush(self) -> None:
+        """把新登记的指纹追加写入持久化文件"""
+        if not self.path or not self._pending:
+            self._pending = []
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for entry in self._pending:
+                f.write(json.dumps(entry, ensure_ascii=False))
+                f.write('\n')
+        self._pending = []
+
+    def rebuild(self, items: Iterable[BiddingInfo]) -> None:
+        """
+        用全部项目重建指纹（全量保存后调用）
+
+        Args:
+            items: 全部项目
+        """
+        self._entries = {}
+        self._buckets = {}
+        self._pending = []
+        self._loaded = True
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+        for item in items:
+            self.add(item)
+        self.flush()
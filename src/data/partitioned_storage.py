@@ -0,0 +1,389 @@
+"""按发布月份分区的存储
+
+数据按发布日期写入 ``<root>/<yyyy>/<mm>/items.jsonl``，每个分区目录下的
+``stats.json`` 记录条数和发布日期的最小/最大值。按日期范围读取时只打开
+与范围重叠的分区，过期数据可以按整个分区删除。没有发布日期的项目写入
+``<root>/unknown/`` 分区。
+
+各文件的写入顺序保证任意一步中断后数据都不会丢失或重复：
+
+- 追加：分区数据 → 分区统计 → ID索引 → 索引中记录各分区数据文件的标记。
+  标记与数据不一致时（追加中途中断），下次读取或追加前重新读取变化的分区，
+  补充ID索引并重算统计
+- 全量保存：新分区先写入暂存目录 ``<root>/.partitions.new/``，写完后放入完成标记，
+  再把原分区移入 ``<root>/.partitions.old/``、换入新分区。分区根目录通常与其他
+  数据文件共用（默认 ./data），所以逐个换入分区目录而不是替换整个根目录；
+  中途中断时，下次列出分区前继续换入（已有完成标记）或丢弃暂存目录（没有完成标记）
+"""
+import json
+import os
+import shutil
+from datetime import datetime
+from typing import List, Dict, Tuple, Iterator, Callable, Optional
+from data.models import BiddingInfo
+from data.deduplicator import DataDeduplicator
+from data.id_index import IDIndex
+
+
+class PartitionedStorage:
+    """按发布月份分区的存储"""
+
+    ITEMS_NAME = "items.jsonl"
+    STATS_NAME = "stats.json"
+    METADATA_NAME = "partitions_metadata.json"
+    UNKNOWN_PARTITION = "unknown"
+    STAGING_NAME = ".partitions.new"
+    RETIRED_NAME = ".partitions.old"
+    COMPLETE_MARKER = ".complete"
+    RETIRED_MARKER = ".retired"
+
+    def __init__(self, root_dir: str):
+        """
+        初始化存储
+
+        Args:
+            root_dir: 分区根目录
+        """
+        self.root_dir = root_dir
+        self.metadata_path = os.path.join(root_dir, self.METADATA_NAME)
+        self.deduplicator = DataDeduplicator()
+        self.id_index = IDIndex(os.path.join(root_dir, ".partition_ids"))
+
+    def _partition_key(self, item: BiddingInfo) -> str:
+        """项目所属分区（相对路径）"""
+        if isinstance(item.publish_date, datetime):
+            return item.publish_date.strftime("%Y/%m")
+        return self.UNKNOWN_PARTITION
+
+    def _partition_dir(self, key: str) -> str:
+        return os.path.join(self.root_dir, *key.split('/'))
+
+    def _top_level_entries(self, root: str) -> List[str]:
+        """root 下的分区目录名（年份目录和 unknown）"""
+        if not os.path.isdir(root):
+            return []
+        return sorted(
+            name for name in os.listdir(root)
+            if ((len(name) == 4 and name.isdigit()) or name == self.UNKNOWN_PARTITION)
+            and os.path.isdir(os.path.join(root, name))
+        )
+
+    def _finish_save(self) -> None:
+        """完成中断的全量保存：暂存目录已写完（有完成标记）时继续换入，否则丢弃"""
+        staging = os.path.join(self.root_dir, self.STAGING_NAME)
+        if not os.path.isdir(staging):
+            return
+        if not os.path.exists(os.path.join(staging, self.COMPLETE_MARKER)):
+            shutil.rmtree(staging)
+            return
+
+        retired = os.path.join(self.root_dir, self.RETIRED_NAME)
+        retired_marker = os.path.join(staging, self.RETIRED_MARKER)
+        if not os.path.exists(retired_marker):
+            # 先移走全部原分区，移完后根目录中的分区都来自暂存目录
+            os.makedirs(retired, exist_ok=True)
+            for name in self._top_level_entries(self.root_dir):
+                os.replace(os.path.join(self.root_dir, name), os.path.join(retired, name))
+            open(retired_marker, 'w').close()
+        for name in self._top_level_entries(staging):
+            os.replace(os.path.join(staging, name), os.path.join(self.root_dir, name))
+        shutil.rmtree(retired, ignore_errors=True)
+        shutil.rmtree(staging)
+
+    def _partition_keys(self) -> List[str]:
+        """列出所有有数据文件的分区（先完成中断的全量保存）"""
+        self._finish_save()
+        keys = []
+        for name in self._top_level_entries(self.root_dir):
+            if name == self.UNKNOWN_PARTITION:
+                continue
+            year_dir = os.path.join(self.root_dir, name)
+            keys.extend(f"{name}/{month}" for month in sorted(os.listdir(year_dir))
+                        if len(month) == 2 and month.isdigit())
+        keys.append(self.UNKNOWN_PARTITION)
+        return [key for key in keys
+                if os.path.exists(os.path.join(self._partition_dir(key), self.ITEMS_NAME))]
+
+    def _read_stats(self, key: str) -> Optional[Dict]:
+        stats_path = os.path.join(self._partition_dir(key), self.STATS_NAME)
+        if not os.path.exists(stats_path):
+            return None
+        with open(stats_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def partitions(self) -> Dict[str, Dict]:
+        """
+        列出所有分区及其统计信息
+
+        Returns:
+            Dict[str, Dict]: {分区: {"count", "min_publish_date", "max_publish_date"}}
+        """
+        result = {}
+        for key in self._partition_keys():
+            stats = self._read_stats(key)
+            if stats is not None:
+                result[key] = stats
+        return result
+
+    def _write_stats(self, key: str, stats: Dict) -> None:
+        path = os.path.join(self._partition_dir(key), self.STATS_NAME)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def _stats(items: List[BiddingInfo], stats: Optional[Dict] = None) -> Dict:
+        """在已有统计（为空时从零开始）上计入 items"""
+        stats = dict(stats or {"count": 0, "min_publish_date": None, "max_publish_date": None})
+        dates = [item.publish_date.isoformat() for item in items if isinstance(item.publish_date, datetime)]
+        if stats["min_publish_date"]:
+            dates.append(stats["min_publish_date"])
+        if stats["max_publish_date"]:
+            dates.append(stats["max_publish_date"])
+        stats["count"] += len(items)
+        stats["min_publish_date"] = min(dates) if dates else None
+        stats["max_publish_date"] = max(dates) if dates else None
+        return stats
+
+    def _write_partition(self, key: str, items: List[BiddingInfo], mode: str) -> None:
+        """写入（mode='w'）或追加（mode='a'）分区数据并更新统计"""
+        partition_dir = self._partition_dir(key)
+        os.makedirs(partition_dir, exist_ok=True)
+
+        with open(os.path.join(partition_dir, self.ITEMS_NAME), mode, encoding='utf-8') as f:
+            for item in items:
+                f.write(json.dumps(item.to_dict(), ensure_ascii=False))
+                f.write('\n')
+
+        self._write_stats(key, self._stats(items, self._read_stats(key) if mode == 'a' else None))
+
+    def _read_partition(self, key: str) -> Iterator[BiddingInfo]:
+        """逐条读取一个分区的项目"""
+        path = os.path.join(self._partition_dir(key), self.ITEMS_NAME)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield BiddingInfo.from_dict(json.loads(line))
+
+    def _partition_stamp(self) -> Dict[str, List[int]]:
+        """各分区数据文件的标记（大小 + 修改时间），用于判断ID索引和统计是否与数据同步"""
+        stamp = {}
+        for key in self._partition_keys():
+            stat = os.stat(os.path.join(self._partition_dir(key), self.ITEMS_NAME))
+            stamp[key] = [stat.st_size, stat.st_mtime_ns]
+        return stamp
+
+    def _reconcile(self) -> None:
+        """
+        ID索引或分区统计与数据不同步时（追加中途中断、索引缺失），从变化的分区补齐
+
+        只补充ID不删除ID：drop_before 删除的分区中的ID仍保留在索引中
+        """
+        stamp = self._partition_stamp()
+        if not self.id_index.exists():
+            # 索引缺失（首次使用或被删除）：从全部分区重建
+            ids = []
+            for key in stamp:
+                items = list(self._read_partition(key))
+                ids.extend(item.id for item in items)
+                self._write_stats(key, self._stats(items))
+            if stamp:
+                self.id_index.rebuild(ids, stamp)
+            return
+
+        recorded = self.id_index.read_meta().get('stamp')
+        if recorded == stamp:
+            return
+        if not isinstance(recorded, dict):
+            recorded = {}
+
+        for key, file_stamp in stamp.items():
+            if recorded.get(key) == file_stamp:
+                continue
+            items = list(self._read_partition(key))
+            self.id_index.add(self.id_index.filter_new(item.id for item in items))
+            self._write_stats(key, self._stats(items))
+        self.id_index.set_stamp(stamp)
+
+    def _group(self, items: List[BiddingInfo]) -> Dict[str, List[BiddingInfo]]:
+        groups = {}
+        for item in items:
+            groups.setdefault(self._partition_key(item), []).append(item)
+        return groups
+
+    def _write_metadata(self, metadata: Dict) -> None:
+        os.makedirs(self.root_dir, exist_ok=True)
+        with open(self.metadata_path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        os.replace(self.metadata_path + ".tmp", self.metadata_path)
+
+    def save(self, items: List[BiddingInfo], metadata: Dict) -> None:
+        """
+        保存数据（全量覆盖所有分区）
+
+        Args:
+            items: 项目列表
+            metadata: 元数据
+        """
+        # 新分区写入暂存目录，写完后整体换入，中途中断时原分区保持不变
+        self._finish_save()
+        staging_dir = os.path.join(self.root_dir, self.STAGING_NAME)
+        staging = PartitionedStorage(staging_dir)
+        for key, group in self._group(items).items():
+            staging._write_partition(key, group, 'w')
+        os.makedirs(staging_dir, exist_ok=True)
+        open(os.path.join(staging_dir, self.COMPLETE_MARKER), 'w').close()
+        self._finish_save()
+
+        self._write_metadata(metadata)
+        self.id_index.rebuild((item.id for item in items), self._partition_stamp())
+
+    def load(self) -> Tuple[List[BiddingInfo], Dict]:
+        """
+        加载全部分区的数据和元数据
+
+        Returns:
+            Tuple[List[BiddingInfo], Dict]: (项目列表, 元数据)
+        """
+        return list(self.iter_items()), self.load_metadata()
+
+    def iter_items(
+        self,
+        predicate: Optional[Callable[[BiddingInfo], bool]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Iterator[BiddingInfo]:
+        """
+        流式读取项目，只打开与日期范围重叠的分区
+
+        Args:
+            predicate: 过滤函数，返回 True 的项目才会产出
+            start_date: 发布日期下限（含当天）
+            end_date: 发布日期上限（含当天）
+
+        Yields:
+            BiddingInfo: 项目
+        """
+        self._reconcile()
+        start = start_date.strftime("%Y-%m-%d") if start_date else None
+        # ISO 字符串按字典序比较，上限取当天最后时刻
+        end = end_date.strftime("%Y-%m-%dT23:59:59.999999") if end_date else None
+        bounded = start is not None or end is not None
+
+        for key, stats in self.partitions().items():
+            if bounded:
+                if key == self.UNKNOWN_PARTITION or not stats.get("min_publish_date"):
+                    continue
+                if start and stats["max_publish_date"] < start:
+                    continue
+                if end and stats["min_publish_date"] > end:
+                    continue
+
+            for item in self._read_partition(key):
+                if bounded:
+                    published = item.publish_date.isoformat()
+                    if (start and published < start) or (end and published > end):
+                        continue
+                if predicate is None or predicate(item):
+                    yield item
+
+    def append(self, items: List[BiddingInfo]) -> int:
+        """
+        追加新数据（基于ID索引去重），只写入受影响的分区
+
+        Args:
+            items: 新项目列表
+
+        Returns:
+            int: 实际新增的数量
+        """
+        # 上次追加中途中断时先补齐ID索引，已写入分区的项目不会再次写入
+        self._reconcile()
+
+        unique_items = self.deduplicator.deduplicate_by_index(items, self.id_index)
+
+        if not unique_items:
+            return 0
+
+        for key, group in self._group(unique_items).items():
+            self._write_partition(key, group, 'a')
+        self.id_index.add(item.id for item in unique_items)
+        self.id_index.set_stamp(self._partition_stamp())
+
+        metadata = self.load_metadata()
+        metadata['last_incremental_crawl'] = datetime.now().isoformat()
+        metadata['total_count'] = sum(stats["count"] for stats in self.partitions().values())
+        self._write_metadata(metadata)
+
+        return len(unique_items)
+
+    def drop_before(self, cutoff: datetime) -> int:
+        """
+        删除发布日期全部早于 cutoff 的分区（保留策略）
+
+        被删除项目的ID仍保留在ID索引中，之后再次抓取到的过期公告不会被重新写入。
+
+        Args:
+            cutoff: 截止日期
+
+        Returns:
+            int: 删除的项目数
+        """
+        cutoff_str = cutoff.isoformat()
+        dropped = 0
+        for key, stats in self.partitions().items():
+            if key == self.UNKNOWN_PARTITION or not stats.get("max_publish_date"):
+                continue
+            if stats["max_publish_date"] < cutoff_str:
+                partition_dir = self._partition_dir(key)
+                shutil.rmtree(partition_dir)
+                year_dir = os.path.dirname(partition_dir)
+                if not os.listdir(year_dir):
+                    os.rmdir(year_dir)
+                dropped += stats["count"]
+
+        if dropped:
+            metadata = self.load_metadata()
+            metadata['total_count'] = sum(stats["count"] for stats in self.partitions().values())
+            metadata['last_retention'] = datetime.now().isoformat()
+            self._write_metadata(metadata)
+
+        return dropped
+
+    def load_metadata(self) -> Dict:
+        """
+        只加载元数据
+
+        Returns:
+            Dict: 元数据
+        """
+        if not os.path.exists(self.metadata_path):
+            return {}
+        with open(self.metadata_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def get_last_crawl_time(self) -> datetime:
+        """
+        获取上次抓取时间
+
+        Returns:
+            datetime: 上次抓取时间
+        """
+        metadata = self.load_metadata()
+
+        last_crawl = metadata.get('last_incremental_crawl') or metadata.get('last_full_crawl')
+
+        if last_crawl:
+            return datetime.fromisoformat(last_crawl)
+
+        return None
+
+    def is_first_run(self) -> bool:
+        """
+        判断是否首次运行
+
+        Returns:
+            bool: True 表示首次运行
+        """
+        return not os.path.exists(self.metadata_path) and not self.partitions()
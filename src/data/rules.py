@@ -0,0 +1,178 @@
+"""关键字规则编译
+
+规则语法（运算符大写且前后留空格，优先级 NOT > AND > OR，相邻的项默认为 AND）::
+
+    标识 AND NOT 停车场
+    (标识 OR 标牌 OR 导视) NOT 交通
+    "文化 墙" AND NOT title:(招聘 OR 结果)
+    牌 AND owner_unit:学校
+
+- 含空格的短语用双引号括起来
+- ``字段:项`` / ``字段:(...)`` 把匹配范围限定在某个字段，支持的字段见 FIELDS；
+  未限定字段的项在标题和内容中匹配
+
+同一字段中的全部项合并为一个匹配器，每个字段只扫描一遍，得到命中项集合后
+再逐条规则求值；增加排除条件只增加集合查询，不增加文本扫描次数。
+"""
+import re
+from typing import Callable, Dict, List, Set, Tuple
+
+
+# 可限定的字段；TEXT_FIELD 为未限定字段时使用的范围（标题 + 内容）
+FIELDS = ('title', 'content', 'owner_unit', 'project_address')
+TEXT_FIELD = 'text'
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([A-Za-z_]+):|([^\s()"]+))')
+_OPERATORS = {'AND', 'OR', 'NOT'}
+# 出现这些写法时才按规则解析，其余字符串视为普通关键字
+_RULE_SYNTAX = re.compile(r'[()"]|\b(?:AND|OR|NOT)\b|(?:^|\s)[A-Za-z_]+:')
+
+
+class Rule:
+    """编译后的规则"""
+
+    def __init__(
+        self,
+        source: str,
+        evaluate: Callable[[Set[int]], bool],
+        positive: List[int],
+        plain: bool = False
+    ):
+        """
+        Args:
+            source: 规则原文
+            evaluate: 求值函数，参数为命中项的编号集合
+            positive: 不在 NOT 之下的项编号（规则成立时据此报告命中的关键字）
+            plain: 是否为普通关键字（不含运算符、括号、引号和字段限定）
+        """
+        self.source = source
+        self.evaluate = evaluate
+        self.positive = positive
+        self.plain = plain
+
+
+def _tokenize(source: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    source = source.strip()
+    while pos < len(source):
+        match = _TOKEN.match(source, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"规则语法错误：{source!r} 第 {pos} 个字符")
+        pos = match.end()
+        open_paren, close_paren, phrase, field, word = match.groups()
+        if open_paren:
+            tokens.append(('(', open_paren))
+        elif close_paren:
+            tokens.append((')', close_paren))
+        elif phrase is not None:
+            tokens.append(('term', phrase))
+        elif field:
+            tokens.append(('field', field))
+        elif word in _OPERATORS:
+            tokens.append((word, word))
+        else:
+            tokens.append(('term', word))
+    return tokens
+
+
+class RuleCompiler:
+    """把规则编译为求值函数，同时为所有规则中的 (字段, 项) 统一编号"""
+
+    def __init__(self):
+        self.terms: Dict[Tuple[str, str], int] = {}
+
+    def _term_id(self, field: str, term: str) -> int:
+        key = (field, term)
+        if key not in self.terms:
+            self.terms[key] = len(self.terms)
+        return self.terms[key]
+
+    def compile(self, source: str) -> Rule:
+        """
+        编译一条规则
+
+        Args:
+            source: 规则原文
+
+        Returns:
+            Rule: 编译结果
+
+        Raises:
+            ValueError: 语法错误或字段不受支持
+        """
+        if not source or not source.strip():
+            raise ValueError("规则不能为空")
+
+        # 普通关键字：保持旧版语义，整个字符串作为一个关键字做子串匹配
+        if not _RULE_SYNTAX.search(source):
+            term_id = self._term_id(TEXT_FIELD, source)
+            return Rule(source, lambda hits: term_id in hits, [term_id], plain=True)
+
+        self._tokens = _tokenize(source)
+        self._pos = 0
+        positive = []
+        evaluate = self._parse_or(TEXT_FIELD, False, positive)
+        if self._pos != len(self._tokens):
+            raise ValueError(f"规则语法错误：{source!r} 中多余的 {self._tokens[self._pos][1]!r}")
+        if not positive:
+            raise ValueError(f"规则至少需要一个不带 NOT 的项：{source!r}")
+        return Rule(source, evaluate, positive)
+
+    def _peek(self) -> str:
+        return self._tokens[self._pos][0] if self._pos < len(self._tokens) else ''
+
+    def _take(self) -> Tuple[str, str]:
+        if self._pos >= len(self._tokens):
+            raise ValueError("规则语法错误：表达式不完整")
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _parse_or(self, field: str, negated: bool, positive: List[int]):
+        operands = [self._parse_and(field, negated, positive)]
+        while self._peek() == 'OR':
+            self._take()
+            operands.append(self._parse_and(field, negated, positive))
+        if len(operands) == 1:
+            return operands[0]
+        return lambda hits: any(operand(hits) for operand in operands)
+
+    def _parse_and(self, field: str, negated: bool, positive: List[int]):
+        operands = [self._parse_not(field, negated, positive)]
+        while self._peek() in ('AND', 'NOT', 'term', 'field', '('):
+            if self._peek() == 'AND':
+                self._take()
+            operands.append(self._parse_not(field, negated, positive))
+        if len(operands) == 1:
+            return operands[0]
+        return lambda hits: all(operand(hits) for operand in operands)
+
+    def _parse_not(self, field: str, negated: bool, positive: List[int]):
+        if self._peek() == 'NOT':
+            self._take()
+            operand = self._parse_not(field, not negated, positive)
+            return lambda hits: not operand(hits)
+        return self._parse_atom(field, negated, positive)
+
+    def _parse_atom(self, field: str, negated: bool, positive: List[int]):
+        kind, value = self._take()
+        if kind == 'field':
+            if value not in FIELDS:
+                raise ValueError(f"不支持的字段：{value}（可用字段：{', '.join(FIELDS)}）")
+            field = value
+            kind, value = self._take()
+
+        if kind == '(':
+            evaluate = self._parse_or(field, negated, positive)
+            if self._take()[0] != ')':
+                raise ValueError("规则语法错误：括号不匹配")
+            return evaluate
+
+        if kind != 'term':
+            raise ValueError(f"规则语法错误：意外的 {value!r}")
+
+        term_id = self._term_id(field, value)
+        if not negated:
+            positive.append(term_id)
+        return lambda hits: term_id in hits
@@ -0,0 +1,235 @@
+"""追加式分段日志存储
+
+全量快照沿用 JSONStorage 的文件格式，增量数据以 JSONL 分段文件的形式
+追加写入 ``<快照文件名>.segments/`` 目录，并由一个小的 manifest 文件记录
+分段列表和元数据。追加只写新数据，合并（compact）时再把分段并入快照。
+
+各文件的写入顺序保证任意一步中断后数据都不会丢失或重复：
+
+- 追加：分段文件 → manifest → ID索引。索引标记包含 manifest 的分段号，
+  manifest 已登记而索引未更新时，下次使用会从数据重建索引
+- 合并/全量保存：快照（原子替换，元数据中记录已并入的分段）→ manifest → 删除分段文件。
+  快照替换后 manifest 未更新时，读取会跳过快照中记录为已并入的分段
+"""
+import json
+import os
+from datetime import datetime
+from typing import List, Dict, Tuple, Iterable, Iterator, Callable, Optional
+from data.models import BiddingInfo
+from data.storage import JSONStorage
+
+
+class SegmentLogStorage(JSONStorage):
+    """追加式分段日志存储"""
+
+    MANIFEST_NAME = "manifest.json"
+    SEGMENT_TEMPLATE = "segment_{:06d}.jsonl"
+
+    def __init__(
+        self,
+        file_path: str,
+        segment_dir: str = None,
+        near_duplicate: bool = False,
+        text_index: bool = False
+    ):
+        """
+        初始化存储
+
+        Args:
+            file_path: 快照 JSON 文件路径
+            segment_dir: 分段目录，默认为 ``<file_path 去扩展名>.segments``
+            near_duplicate: 是否启用近似重复检测
+            text_index: 是否维护全文索引
+        """
+        super().__init__(file_path, near_duplicate, text_index)
+        if segment_dir is None:
+            segment_dir = os.path.splitext(file_path)[0] + ".segments"
+        self.segment_dir = segment_dir
+        self.manifest_path = os.path.join(segment_dir, self.MANIFEST_NAME)
+
+    def _read_manifest(self) -> Dict:
+        """读取 manifest，不存在时返回空结构"""
+        if not os.path.exists(self.manifest_path):
+            return {"next_segment": 1, "segments": [], "snapshot_count": None, "metadata": None}
+
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        """原子写入 manifest（先写临时文件再替换）"""
+        os.makedirs(self.segment_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _file_stamp(self) -> List:
+        """
+        快照文件标记加上 manifest 的下一个分段号（追加分段后ID索引也需要同步）
+
+        元数据旁路文件只描述快照，仍按快照文件标记校验，追加分段不会使其失效
+        """
+        stamp = self._snapshot_stamp() or [None, None]
+        return stamp + [self._read_manifest().get("next_segment", 1)]
+
+    def _clear_segments(self, manifest: Dict) -> None:
+        """删除 manifest 中登记的分段文件"""
+        for segment in manifest.get("segments", []):
+            path = os.path.join(self.segment_dir, segment["name"])
+            if os.path.exists(path):
+                os.unlink(path)
+
+    def _iter_segment_dicts(self, manifest: Dict, merged: Iterable[str] = ()) -> Iterator[Dict]:
+        """按顺序逐条读取所有分段中的原始记录（跳过 merged 中已并入快照的分段）"""
+        merged = set(merged)
+        for segment in manifest.get("segments", []):
+            if segment["name"] in merged:
+                continue
+            path = os.path.join(self.segment_dir, segment["name"])
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+
+    def save(self, items: List[BiddingInfo], metadata: Dict) -> None:
+        """
+        保存数据（全量覆盖快照，并清空分段）
+
+        Args:
+            items: 项目列表
+            metadata: 元数据
+        """
+        manifest = self._read_manifest()
+        # 快照中记录已并入（被覆盖）的分段，快照替换后、manifest 更新前中断时读取会跳过它们
+        metadata = dict(metadata, merged_segments=[segment["name"] for segment in manifest.get("segments", [])])
+        super().save(items, metadata)
+
+        self._write_manifest({
+            "next_segment": manifest.get("next_segment", 1),
+            "segments": [],
+            "snapshot_count": len(items),
+            "metadata": metadata,
+        })
+        # manifest 不再登记后才删除分段文件
+        self._clear_segments(manifest)
+
+    def load(self) -> Tuple[List[BiddingInfo], Dict]:
+        """
+        加载快照和所有分段中的数据
+
+        Returns:
+            Tuple[List[BiddingInfo], Dict]: (项目列表, 元数据)
+        """
+        items, metadata = super().load()
+        manifest = self._read_manifest()
+
+        merged = metadata.get("merged_segments", ())
+        items.extend(BiddingInfo.from_dicts(self._iter_segment_dicts(manifest, merged)))
+        if manifest.get("metadata") is not None:
+            metadata = manifest["metadata"]
+
+        return items, metadata
+
+    def iter_items(
+        self,
+        predicate: Optional[Callable[[BiddingInfo], bool]] = None
+    ) -> Iterator[BiddingInfo]:
+        """
+        流式逐条读取快照和分段中的项目
+
+        Args:
+            predicate: 过滤函数，返回 True 的项目才会产出
+
+        Yields:
+            BiddingInfo: 项目
+        """
+        yield from super().iter_items(predicate)
+
+        merged = super().load_metadata().get("merged_segments", ())
+        for record in self._iter_segment_dicts(self._read_manifest(), merged):
+            item = BiddingInfo.from_dict(record)
+            if predicate is None or predicate(item):
+                yield item
+
+    def append(self, items: List[BiddingInfo]) -> int:
+        """
+        追加新数据（自动去重），只写入一个新的分段文件
+
+        Args:
+            items: 新项目列表
+
+        Returns:
+            int: 实际新增的数量
+        """
+        unique_items = self._select_new(items)
+
+        if not unique_items:
+            return 0
+
+        manifest = self._read_manifest()
+        if manifest.get("metadata") is None:
+            manifest["metadata"] = super().load_metadata()
+            manifest["snapshot_count"] = self.id_index.read_meta().get('count', 0)
+
+        # 先写临时文件再改名，未登记进 manifest 的分段不会被读取
+        segment_no = manifest.get("next_segment", 1)
+        segment_name = self.SEGMENT_TEMPLATE.format(segment_no)
+        segment_path = os.path.join(self.segment_dir, segment_name)
+        os.makedirs(self.segment_dir, exist_ok=True)
+        with open(segment_path + ".tmp", 'w', encoding='utf-8') as f:
+            for item in unique_items:
+                f.write(json.dumps(item.to_dict(), ensure_ascii=False))
+                f.write('\n')
+        os.replace(segment_path + ".tmp", segment_path)
+
+        # 先登记分段再更新索引：中断时索引标记与 manifest 不一致，下次使用时重建
+        metadata = manifest["metadata"]
+        metadata['last_incremental_crawl'] = datetime.now().isoformat()
+        metadata['total_count'] = self.id_index.read_meta().get('count', 0) + len(unique_items)
+        manifest["segments"].append({"name": segment_name, "count": len(unique_items)})
+        manifest["next_segment"] = segment_no + 1
+        self._write_manifest(manifest)
+
+        self._record_added(unique_items)
+        self.id_index.set_stamp(self._file_stamp())
+
+        return len(unique_items)
+
+    def compact(self) -> int:
+        """
+        合并分段：把所有分段写入新的快照并删除分段文件
+
+        Returns:
+            int: 合并后的总记录数
+        """
+        items, metadata = self.load()
+        metadata['last_compaction'] = datetime.now().isoformat()
+        metadata['total_count'] = len(items)
+        self.save(items, metadata)
+        return len(items)
+
+    def segment_count(self) -> int:
+        """返回尚未合并的分段数量"""
+        return len(self._read_manifest().get("segments", []))
+
+    def load_metadata(self) -> Dict:
+        """
+        只加载元数据（优先读取 manifest）
+
+        Returns:
+            Dict: 元数据
+        """
+        metadata = self._read_manifest().get("metadata")
+        if metadata is None:
+            return super().load_metadata()
+        return metadata
+
+    def is_first_run(self) -> bool:
+        """
+        判断是否首次运行（快照和分段都不存在）
+
+        Returns:
+            bool: True 表示首次运行
+        """
+        return super().is_first_run() and self.segment_count() == 0
@@ -0,0 +1,170 @@
+"""列式二进制快照
+
+将数据导出为未压缩的 Feather v2（Arrow IPC）文件：低基数的字符串列使用
+字典编码，发布日期存为时间戳列。读取时以内存映射方式打开，只读取需要的列，
+Streamlit 界面冷启动时无需解析 JSON、构造字典再转换为 DataFrame。
+字符串列和列表列在 DataFrame 中仍由 Arrow 存储（直接引用映射的缓冲区），
+不为每个单元格创建 Python 对象；列表列展示时用 join_list_column 转换为字符串。
+
+依赖 pyarrow（见 requirements.txt）。
+"""
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+
+# (列名, 类型)；类型取值：string / dict（字典编码字符串）/ timestamp / list / bool
+SNAPSHOT_SCHEMA = [
+    ('id', 'string'),
+    ('title', 'string'),
+    ('info_type', 'dict'),
+    ('publish_date', 'timestamp'),
+    ('province', 'dict'),
+    ('city', 'dict'),
+    ('district', 'dict'),
+    ('owner_unit', 'string'),
+    ('budget_amount', 'string'),
+    ('procurement_type', 'dict'),
+    ('bidding_deadline', 'string'),
+    ('keywords_matched', 'list'),
+    ('keyword_location', 'list'),
+    ('keyword_location_tag', 'dict'),
+    ('project_address', 'string'),
+    ('has_attachments', 'bool'),
+    ('has_bidding_docs', 'bool'),
+    ('source_url', 'string'),
+    ('detail_url', 'string'),
+]
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _record_value(record: Dict, name: str):
+    """取记录字段（兼容 JSONStorage 格式和界面使用的原始格式）"""
+    if name == 'id':
+        return record.get('id') or record.get('project_id')
+    value = record.get(name)
+    if name == 'bidding_deadline' and value is not None:
+        return str(value)
+    return value
+
+
+def export_snapshot(records: Iterable[Dict], path: str) -> int:
+    """
+    导出列式快照
+
+    Args:
+        records: 记录字典（BiddingInfo.to_dict() 或原始 JSON 记录）
+        path: 快照文件路径（.feather）
+
+    Returns:
+        int: 导出的记录数
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    columns = {name: [] for name, _ in SNAPSHOT_SCHEMA}
+    count = 0
+    for record in records:
+        count += 1
+        for name, _ in SNAPSHOT_SCHEMA:
+            columns[name].append(_record_value(record, name))
+
+    arrays = []
+    names = []
+    for name, kind in SNAPSHOT_SCHEMA:
+        values = columns.pop(name)
+        # 源数据中完全不存在的字段不导出，与 pd.DataFrame(records) 的列保持一致
+        if all(value is None for value in values):
+            continue
+        if kind == 'timestamp':
+            array = pa.array([_parse_timestamp(v) for v in values], type=pa.timestamp('us'))
+        elif kind == 'list':
+            array = pa.array([list(v) if v else [] for v in values], type=pa.list_(pa.string()))
+        elif kind == 'bool':
+            array = pa.array([bool(v) for v in values], type=pa.bool_())
+        elif kind == 'dict':
+            array = pa.array(values, type=pa.string()).dictionary_encode()
+        else:
+            array = pa.array(values, type=pa.string())
+        arrays.append(array)
+        names.append(name)
+
+    table = pa.Table.from_arrays(arrays, names=names)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    # 不压缩，读取时才能直接内存映射
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+    return count
+
+
+def load_snapshot(path: str, columns: Optional[List[str]] = None):
+    """
+    以内存映射方式读取列式快照
+
+    Args:
+        path: 快照文件路径
+        columns: 需要读取的列，为空时读取全部；快照中不存在的列会被忽略
+
+    Returns:
+        pandas.DataFrame: 字典编码列为 Categorical，字符串列为 Arrow 存储的 string，
+            列表列为 Arrow 存储的 list<string>（ArrowDtype）
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+
+    def arrow_dtype(arrow_type):
+        # 字典编码列返回 None，按默认转换为 Categorical（只有整数编码和少量类别）
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return pd.StringDtype('pyarrow')
+        if pa.types.is_list(arrow_type):
+            return pd.ArrowDtype(arrow_type)
+        return None
+
+    if columns is not None:
+        with pa.memory_map(path, 'r') as source:
+            available = set(ipc.open_file(source).schema.names)
+        columns = [name for name in columns if name in available]
+
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    return table.to_pandas(types_mapper=arrow_dtype)
+
+
+def join_list_column(series, separator: str = ', '):
+    """
+    把列表列转换为以 separator 连接的字符串列（用于展示和导出）
+
+    Arrow 存储的列表列在 Arrow 中整列连接；JSON 数据加载的 Python list 列逐行连接。
+
+    Args:
+        series: 列表列
+        separator: 分隔符
+
+    Returns:
+        pandas.Series: 字符串列
+    """
+    import pandas as pd
+
+    if isinstance(series.dtype, pd.ArrowDtype):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        if pa.types.is_list(series.dtype.pyarrow_dtype):
+            joined = pc.fill_null(pc.binary_join(pa.array(series.array), separator), '')
+            return pd.Series(pd.array(joined, dtype=pd.StringDtype('pyarrow')), index=series.index)
+
+    return series.apply(lambda value: separator.join(value) if isinstance(value, list) else str(value))
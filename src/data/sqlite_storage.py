@@ -0,0 +1,308 @@
+"""SQLite 存储
+
+与 JSONStorage 提供相同的 save/load/append/get_last_crawl_time/is_first_run
+接口。项目ID为主键，追加时用 INSERT OR IGNORE 完成去重；侧边栏筛选用到的
+发布日期、省份、城市、信息类型建有二级索引，按条件查询无需加载全部数据。
+"""
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+from typing import List, Dict, Tuple, Optional, Iterator, Callable
+from data.models import BiddingInfo
+
+
+# 列表字段以 JSON 文本存储
+_LIST_FIELDS = ('keywords_matched', 'keyword_location', 'attachments')
+# 布尔字段以 0/1 存储
+_BOOL_FIELDS = ('has_attachments', 'has_bidding_docs')
+
+_COLUMNS = (
+    'id', 'title', 'info_type', 'publish_date',
+    'province', 'city', 'district',
+    'owner_unit', 'budget_amount', 'procurement_type',
+    'bidding_deadline',
+    'keywords_matched', 'keyword_location', 'keyword_location_tag', 'project_address', 'attachments',
+    'has_attachments', 'has_bidding_docs',
+    'source_url', 'detail_url', 'crawled_at',
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    info_type TEXT,
+    publish_date TEXT,
+    province TEXT,
+    city TEXT,
+    district TEXT,
+    owner_unit TEXT,
+    budget_amount TEXT,
+    procurement_type TEXT,
+    bidding_deadline TEXT,
+    keywords_matched TEXT,
+    keyword_location TEXT,
+    keyword_location_tag TEXT DEFAULT '',
+    project_address TEXT,
+    attachments TEXT,
+    has_attachments INTEGER DEFAULT 0,
+    has_bidding_docs INTEGER DEFAULT 0,
+    source_url TEXT,
+    detail_url TEXT,
+    crawled_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_items_publish_date ON items (publish_date);
+CREATE INDEX IF NOT EXISTS idx_items_province ON items (province);
+CREATE INDEX IF NOT EXISTS idx_items_city ON items (city);
+CREATE INDEX IF NOT EXISTS idx_items_info_type ON items (info_type);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# 旧版数据库中缺少、打开时补建的列
+_ADDED_COLUMNS = (
+    ('keyword_location_tag', "TEXT DEFAULT ''"),
+)
+
+
+class SQLiteStorage:
+    """SQLite 存储"""
+
+    def __init__(self, db_path: str):
+        """
+        初始化存储
+
+        Args:
+            db_path: SQLite 数据库文件路径
+        """
+        self.db_path = db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开连接并确保表结构存在"""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(_SCHEMA)
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(items)")}
+        for name, definition in _ADDED_COLUMNS:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE items ADD COLUMN {name} {definition}")
+        return conn
+
+    @staticmethod
+    def _to_row(item: BiddingInfo) -> Tuple:
+        """BiddingInfo 转换为数据库行"""
+        data = item.to_dict()
+        for name in _LIST_FIELDS:
+            data[name] = json.dumps(data[name] or [], ensure_ascii=False)
+        for name in _BOOL_FIELDS:
+            data[name] = int(bool(data[name]))
+        return tuple(data[name] for name in _COLUMNS)
+
+    @staticmethod
+    def _from_row(row: Tuple) -> BiddingInfo:
+        """数据库行转换为 BiddingInfo"""
+        data = dict(zip(_COLUMNS, row))
+        for name in _LIST_FIELDS:
+            data[name] = json.loads(data[name]) if data[name] else []
+        for name in _BOOL_FIELDS:
+            data[name] = bool(data[name])
+        data['keyword_location_tag'] = data['keyword_location_tag'] or ''
+        return BiddingInfo.from_dict(data)
+
+    @staticmethod
+    def _read_metadata(conn: sqlite3.Connection) -> Dict:
+        """读取元数据表"""
+        rows = conn.execute("SELECT key, value FROM metadata").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    @staticmethod
+    def _write_metadata(conn: sqlite3.Connection, metadata: Dict) -> None:
+        """写入元数据表（按键覆盖）"""
+        conn.executemany(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in metadata.items()]
+        )
+
+    def _insert_sql(self, conflict: str) -> str:
+        """生成插入语句，conflict 为主键冲突时的处理方式（IGNORE/REPLACE）"""
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        return f"INSERT OR {conflict} INTO items ({', '.join(_COLUMNS)}) VALUES ({placeholders})"
+
+    def save(self, items: List[BiddingInfo], metadata: Dict) -> None:
+        """
+        保存数据（全量覆盖）
+
+        Args:
+            items: 项目列表
+            metadata: 元数据
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM items")
+            conn.execute("DELETE FROM metadata")
+            conn.executemany(self._insert_sql("REPLACE"), [self._to_row(item) for item in items])
+            self._write_metadata(conn, metadata)
+
+    def load(self) -> Tuple[List[BiddingInfo], Dict]:
+        """
+        加载数据和元数据
+
+        Returns:
+            Tuple[List[BiddingInfo], Dict]: (项目列表, 元数据)
+        """
+        if not os.path.exists(self.db_path):
+            return [], {}
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM items ORDER BY rowid").fetchall()
+            metadata = self._read_metadata(conn)
+
+        return [self._from_row(row) for row in rows], metadata
+
+    def iter_items(
+        self,
+        predicate: Optional[Callable[[BiddingInfo], bool]] = None
+    ) -> Iterator[BiddingInfo]:
+        """
+        流式逐条读取项目（游标逐行读取）
+
+        Args:
+            predicate: 过滤函数，返回 True 的项目才会产出
+
+        Yields:
+            BiddingInfo: 项目
+        """
+        if not os.path.exists(self.db_path):
+            return
+
+        with closing(self._connect()) as conn:
+            for row in conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM items ORDER BY rowid"):
+                item = self._from_row(row)
+                if predicate is None or predicate(item):
+                    yield item
+
+    def append(self, items: List[BiddingInfo]) -> int:
+        """
+        追加新数据（主键冲突即视为重复）
+
+        Args:
+            items: 新项目列表
+
+        Returns:
+            int: 实际新增的数量
+        """
+        with closing(self._connect()) as conn, conn:
+            before = conn.total_changes
+            conn.executemany(self._insert_sql("IGNORE"), [self._to_row(item) for item in items])
+            added = conn.total_changes - before
+
+            if added:
+                total = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+                self._write_metadata(conn, {
+                    'last_incremental_crawl': datetime.now().isoformat(),
+                    'total_count': total,
+                })
+
+        return added
+
+    def query(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        province: Optional[str] = None,
+        city: Optional[str] = None,
+        info_type: Optional[str] = None
+    ) -> List[BiddingInfo]:
+        """
+        按条件查询（走索引，不加载全部数据）
+
+        Args:
+            start_date: 发布日期下限（含）
+            end_date: 发布日期上限（含当天）
+            province: 省份
+            city: 城市
+            info_type: 信息类型
+
+        Returns:
+            List[BiddingInfo]: 符合条件的项目，按发布日期倒序
+        """
+        if not os.path.exists(self.db_path):
+            return []
+
+        conditions = []
+        params = []
+        if start_date is not None:
+            conditions.append("publish_date >= ?")
+            params.append(start_date.strftime("%Y-%m-%d"))
+        if end_date is not None:
+            # ISO 字符串按字典序比较，以次日零点为开区间上限
+            conditions.append("publish_date < ?")
+            params.append((end_date + timedelta(days=1)).strftime("%Y-%m-%d"))
+        if province is not None:
+            conditions.append("province = ?")
+            params.append(province)
+        if city is not None:
+            conditions.append("city = ?")
+            params.append(city)
+        if info_type is not None:
+            conditions.append("info_type = ?")
+            params.append(info_type)
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM items"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY publish_date DESC"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [self._from_row(row) for row in rows]
+
+    def load_metadata(self) -> Dict:
+        """
+        只加载元数据
+
+        Returns:
+            Dict: 元数据
+        """
+        if not os.path.exists(self.db_path):
+            return {}
+
+        with closing(self._connect()) as conn:
+            return self._read_metadata(conn)
+
+    def get_last_crawl_time(self) -> datetime:
+        """
+        获取上次抓取时间
+
+        Returns:
+            datetime: 上次抓取时间
+        """
+        metadata = self.load_metadata()
+
+        last_crawl = metadata.get('last_incremental_crawl') or metadata.get('last_full_crawl')
+
+        if last_crawl:
+            return datetime.fromisoformat(last_crawl)
+
+        return None
+
+    def is_first_run(self) -> bool:
+        """
+        判断是否首次运行
+
+        Returns:
+            bool: True 表示首次运行
+        """
+        if not os.path.exists(self.db_path) or os.path.getsize(self.db_path) == 0:
+            return True
+
+        with closing(self._connect()) as conn:
+            has_items = conn.execute("SELECT 1 FROM items LIMIT 1").fetchone() is not None
+            has_metadata = conn.execute("SELECT 1 FROM metadata LIMIT 1").fetchone() is not None
+
+        return not (has_items or has_metadata)
@@ -0,0 +1,33 @@
+"""数据统计"""
+from collections import Counter
+from typing import Dict, Iterable
+from data.models import BiddingInfo
+
+
+def summarize(items: Iterable[BiddingInfo]) -> Dict:
+    """
+    单次遍历统计项目分布（可直接使用 iter_items 返回的迭代器）
+    
+    Args:
+        items: 项目列表或迭代器
+        
+    Returns:
+        Dict: 总数及按省份、城市、信息类型的分布
+    """
+    total = 0
+    by_province = Counter()
+    by_city = Counter()
+    by_info_type = Counter()
+    
+    for item in items:
+        total += 1
+        by_province[item.province or "未知"] += 1
+        by_city[item.city or "未知"] += 1
+        by_info_type[item.info_type or "未知"] += 1
+    
+    return {
+        "total": total,
+        "by_province": dict(by_province.most_common()),
+        "by_city": dict(by_city.most_common()),
+        "by_info_type": dict(by_info_type.most_common()),
+    }
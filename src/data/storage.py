@@ -2,23 +2,82 @@
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Tuple
-from data.models import BiddingInfo
+from typing import List, Dict, Tuple, Iterator, Callable, Optional
+from data.models import BiddingInfo, paused_gc
+from data.json_stream import iter_json_array
 from data.deduplicator import DataDeduplicator
+from data.id_index import IDIndex
+from data.near_duplicate import NearDuplicateDetector
+from data.text_index import TextIndex, INDEXED_FIELDS
 
 
 class JSONStorage:
     """JSON 文件存储"""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, near_duplicate: bool = False, text_index: bool = False):
         """
         初始化存储
         
         Args:
             file_path: JSON 文件路径
+            near_duplicate: 是否启用近似重复检测（按标题指纹识别不同ID的同一公告）
+            text_index: 是否维护标题/业主单位/地址的全文索引（追加时增量更新）
         """
         self.file_path = file_path
         self.deduplicator = DataDeduplicator()
+        base_path = os.path.splitext(file_path)[0]
+        self.meta_path = base_path + ".meta.json"
+        self.id_index = IDIndex(base_path + ".ids")
+        self.near_detector = NearDuplicateDetector(base_path + ".minhash.jsonl") if near_duplicate else None
+        self.text_index = TextIndex(base_path + ".text.jsonl") if text_index else None
+    
+    def _snapshot_stamp(self) -> List[int]:
+        """数据文件标记（大小 + 修改时间），用于识别数据文件被外部修改"""
+        if not os.path.exists(self.file_path):
+            return None
+        stat = os.stat(self.file_path)
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def _file_stamp(self) -> List[int]:
+        """ID索引的同步标记（默认即数据文件标记）"""
+        return self._snapshot_stamp()
+    
+    def _ensure_indexes(self) -> None:
+        """ID索引/指纹/全文索引缺失或数据文件被外部修改时，从数据重建"""
+        stamp = self._file_stamp()
+        index_stale = not self.id_index.exists() or self.id_index.read_meta().get('stamp') != stamp
+        detector_stale = self.near_detector is not None and (
+            index_stale or not os.path.exists(self.near_detector.path)
+        )
+        text_stale = self.text_index is not None and (
+            index_stale or not os.path.exists(self.text_index.path)
+        )
+        if not index_stale and not detector_stale and not text_stale:
+            return
+        
+        if index_stale:
+            self.id_index.rebuild((item.id for item in self.iter_items()), stamp)
+        if detector_stale:
+            self.near_detector.rebuild(self.iter_items())
+        if text_stale:
+            self.text_index.rebuild(self.iter_items())
+    
+    def _select_new(self, items: List[BiddingInfo]) -> List[BiddingInfo]:
+        """挑出需要写入的新项目（ID去重，启用时再做近似重复过滤）"""
+        self._ensure_indexes()
+        unique_items = self.deduplicator.deduplicate_by_index(items, self.id_index)
+        if self.near_detector is not None and unique_items:
+            unique_items = self.deduplicator.deduplicate_near(unique_items, self.near_detector)
+        return unique_items
+    
+    def _record_added(self, items: List[BiddingInfo]) -> None:
+        """新项目写入后同步ID索引、指纹和全文索引"""
+        self.id_index.add(item.id for item in items)
+        if self.near_detector is not None:
+            self.near_detector.flush()
+        if self.text_index is not None:
+            self.text_index.add(items)
+            self.text_index.flush()
     
     def save(self, items: List[BiddingInfo], metadata: Dict) -> None:
         """
@@ -28,6 +87,35 @@ class JSONStorage:
             items: 项目列表
             metadata: 元数据
         """
+        self._write(items, metadata)
+        self.id_index.rebuild((item.id for item in items), self._file_stamp())
+        if self.near_detector is not None:
+            self.near_detector.rebuild(items)
+        if self.text_index is not None:
+            self.text_index.rebuild(items)
+    
+    def search(self, query: str, fields=INDEXED_FIELDS, limit: Optional[int] = None) -> List[str]:
+        """
+        全文查找标题/业主单位/项目地址中包含查询串的项目
+        
+        Args:
+            query: 查询串，多个词以空格分隔时要求全部出现
+            fields: 查询的字段
+            limit: 最多返回的数量
+            
+        Returns:
+            List[str]: 项目ID
+            
+        Raises:
+            ValueError: 未启用全文索引
+        """
+        if self.text_index is None:
+            raise ValueError("未启用全文索引，请在配置中设置 storage.text_index: true")
+        self._ensure_indexes()
+        return self.text_index.search(query, fields, limit)
+    
+    def _write(self, items: List[BiddingInfo], metadata: Dict) -> None:
+        """写入数据文件"""
         data = {
             "metadata": metadata,
             "data": [item.to_dict() for item in items]
@@ -36,8 +124,44 @@ class JSONStorage:
         # 确保目录存在
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
         
-        with open(self.file_path, 'w', encoding='utf-8') as f:
+        # 先写临时文件再替换，中断时原文件保持完整
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.file_path)
+        
+        self._write_meta_sidecar(metadata)
+    
+    def _write_meta_sidecar(self, metadata: Dict) -> None:
+        """写入元数据旁路文件（带数据文件标记，用于识别外部修改）"""
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"stamp": self._snapshot_stamp(), "metadata": metadata}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.meta_path)
+    
+    def load_metadata(self) -> Dict:
+        """
+        只加载元数据（读取旁路文件，不解析数据数组）
+        
+        Returns:
+            Dict: 元数据
+        """
+        if not os.path.exists(self.file_path):
+            return {}
+        
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+            if sidecar.get('stamp') == self._snapshot_stamp():
+                return sidecar.get('metadata', {})
+        
+        # 旁路文件缺失或数据文件被外部修改，回退读取数据文件并重建旁路文件
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        metadata = data.get('metadata', {}) if isinstance(data, dict) else {}
+        self._write_meta_sidecar(metadata)
+        
+        return metadata
     
     def load(self) -> Tuple[List[BiddingInfo], Dict]:
         """
@@ -49,14 +173,35 @@ class JSONStorage:
         if not os.path.exists(self.file_path):
             return [], {}
         
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        items = [BiddingInfo.from_dict(item) for item in data.get('data', [])]
+        with paused_gc():
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            items = BiddingInfo.from_dicts(data.get('data', []))
         metadata = data.get('metadata', {})
         
         return items, metadata
     
+    def iter_items(
+        self,
+        predicate: Optional[Callable[[BiddingInfo], bool]] = None
+    ) -> Iterator[BiddingInfo]:
+        """
+        流式逐条读取项目（内存占用与数据总量无关）
+        
+        Args:
+            predicate: 过滤函数，返回 True 的项目才会产出
+            
+        Yields:
+            BiddingInfo: 项目
+        """
+        if not os.path.exists(self.file_path):
+            return
+        
+        for record in iter_json_array(self.file_path):
+            item = BiddingInfo.from_dict(record)
+            if predicate is None or predicate(item):
+                yield item
+    
     def append(self, items: List[BiddingInfo]) -> int:
         """
         追加新数据（自动去重）
@@ -67,23 +212,24 @@ class JSONStorage:
         Returns:
             int: 实际新增的数量
         """
-        existing_items, metadata = self.load()
-        
-        # 去重
-        unique_items = self.deduplicator.deduplicate(items, existing_items)
+        # 去重（只查询ID索引，全部重复时无需读取数据文件）
+        unique_items = self._select_new(items)
         
         if not unique_items:
             return 0
         
         # 合并数据
+        existing_items, metadata = self.load()
         all_items = existing_items + unique_items
         
         # 更新元数据
         metadata['last_incremental_crawl'] = datetime.now().isoformat()
         metadata['total_count'] = len(all_items)
         
-        # 保存
-        self.save(all_items, metadata)
+        # 保存并同步ID索引
+        self._write(all_items, metadata)
+        self._record_added(unique_items)
+        self.id_index.set_stamp(self._file_stamp())
         
         return len(unique_items)
     
@@ -94,7 +240,7 @@ class JSONStorage:
         Returns:
             datetime: 上次抓取时间
         """
-        _, metadata = self.load()
+        metadata = self.load_metadata()
         
         last_crawl = metadata.get('last_incremental_crawl') or metadata.get('last_full_crawl')
         
@@ -111,3 +257,37 @@ class JSONStorage:
             bool: True 表示首次运行
         """
         return not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0
+
+
+def create_storage(storage_config: Dict):
+    """
+    根据配置创建存储实例
+
+    Args:
+        storage_config: config.yaml 中的 storage 配置段
+
+    Returns:
+        存储实例（JSONStorage / SegmentLogStorage / SQLiteStorage / PartitionedStorage）
+    """
+    storage_type = storage_config.get('type', 'json')
+    json_path = storage_config['json_path']
+
+    near_duplicate = storage_config.get('near_duplicate', False)
+    text_index = storage_config.get('text_index', False)
+
+    if storage_type == 'json':
+        return JSONStorage(json_path, near_duplicate, text_index)
+
+    if storage_type == 'segment':
+        from data.segment_storage import SegmentLogStorage
+        return SegmentLogStorage(json_path, storage_config.get('segment_dir'), near_duplicate, text_index)
+
+    if storage_type == 'sqlite':
+        from data.sqlite_storage import SQLiteStorage
+        return SQLiteStorage(storage_config.get('sqlite_path', './data/bidding_data.db'))
+
+    if storage_type == 'partitioned':
+        from data.partitioned_storage import PartitionedStorage
+        return PartitionedStorage(storage_config.get('partition_dir', './data'))
+
+    raise ValueError(f"不支持的存储类型: {storage_type}")
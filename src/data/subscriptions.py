@@ -0,0 +1,89 @@
+"""多订阅方关键字分发
+
+每个订阅方（如不同销售团队）有自己的关键字或规则列表。全部订阅方的规则
+去重后编译进同一个 KeywordMatcher，每条公告只扫描一遍，再按规则序号分发给
+订阅了该规则的订阅方。新增订阅方只增加规则到订阅方的映射，不增加扫描次数。
+"""
+from typing import Dict, Iterable, List, Union
+from data.matcher import KeywordMatcher
+
+
+class SubscriptionMatcher:
+    """多订阅方共享一次扫描的匹配器"""
+
+    def __init__(self, subscriptions: Dict[str, List[str]]):
+        """
+        初始化匹配器
+
+        Args:
+            subscriptions: {订阅方名称: 关键字或规则列表}（语法见 data/rules.py）
+
+        Raises:
+            ValueError: 规则语法错误
+        """
+        self.subscriptions = subscriptions
+
+        rules: List[str] = []
+        rule_index: Dict[str, int] = {}
+        # 规则序号 -> 订阅了该规则的订阅方
+        self._subscribers: List[List[str]] = []
+        for name, sources in subscriptions.items():
+            for source in sources:
+                if source not in rule_index:
+                    rule_index[source] = len(rules)
+                    rules.append(source)
+                    self._subscribers.append([])
+                subscribers = self._subscribers[rule_index[source]]
+                if name not in subscribers:
+                    subscribers.append(name)
+
+        self.matcher = KeywordMatcher(rules)
+
+    def match(self, item: Union[Dict, object]) -> Dict[str, List[str]]:
+        """
+        匹配单个项目
+
+        Args:
+            item: 项目信息字典或 BiddingInfo
+
+        Returns:
+            Dict[str, List[str]]: {命中的订阅方: 匹配到的关键字}，未命中的订阅方不出现
+        """
+        hits: Dict[str, List[str]] = {}
+        subscribers = self._subscribers
+        for index, terms in self.matcher.match_rules(item).items():
+            for name in subscribers[index]:
+                matched = hits.setdefault(name, [])
+                for term in terms:
+                    if term not in matched:
+                        matched.append(term)
+        return hits
+
+    def match_items(self, items: Iterable) -> List[Dict[str, List[str]]]:
+        """
+        批量匹配
+
+        Args:
+            items: 项目信息字典或 BiddingInfo 列表
+
+        Returns:
+            List[Dict[str, List[str]]]: 每个项目的匹配结果
+        """
+        match = self.match
+        return [match(item) for item in items]
+
+    def route(self, items: Iterable) -> Dict[str, List]:
+        """
+        把项目分发给各订阅方
+
+        Args:
+            items: 项目信息字典或 BiddingInfo 列表
+
+        Returns:
+            Dict[str, List]: {订阅方: 命中的项目}，包含全部订阅方（没有命中时为空列表）
+        """
+        routed = {name: [] for name in self.subscriptions}
+        for item in items:
+            for name in self.match(item):
+                routed[name].append(item)
+        return routed
@@ -0,0 +1,235 @@
+"""标题/业主单位/项目地址的全文倒排索引
+
+中文连续段和英文数字串（转为小写）都按单字和相邻两字（bigram）切分，
+英文数字串也按字切分是为了支持部分词查询（如 led 命中 LED显示屏）。
+查询词切分后取各词项倒排列表的交集（从最短的列表开始），再对候选项目做一次
+子串确认，结果与逐条 ``query in text`` 一致，耗时与倒排列表长度有关、
+与数据总量无关。
+
+索引以 JSONL 追加写入（每行一个项目的 ID 和被索引字段），首次查询时载入内存。
+"""
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from data.models import BiddingInfo
+
+
+INDEXED_FIELDS = ('title', 'owner_unit', 'project_address')
+
+# 中日韩统一表意文字连续段 / 字母数字串（文本已转为小写）
+_RUN = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+|[0-9a-z]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    切分文本为索引词项（去重）
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        List[str]: 词项列表
+    """
+    if not text:
+        return []
+    tokens = set()
+    for run in _RUN.findall(text.lower()):
+        tokens.update(run)
+        tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+    return list(tokens)
+
+
+def _query_tokens(query: str) -> List[str]:
+    """查询词项：每个连续段取 bigram，只有一个字的段取单字"""
+    tokens = set()
+    for run in _RUN.findall(query.lower()):
+        if len(run) == 1:
+            tokens.add(run)
+        else:
+            tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+    return list(tokens)
+
+
+def _intersect(postings: List[List[int]]) -> List[int]:
+    """有序倒排列表求交集（从最短的列表开始）"""
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for other in postings[1:]:
+        if not result:
+            break
+        other_set = set(other) if len(other) > 4 * len(result) else None
+        if other_set is not None:
+            result = [doc for doc in result if doc in other_set]
+        else:
+            result = sorted(set(result).intersection(other))
+    return result
+
+
+class TextIndex:
+    """全文倒排索引"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        初始化索引
+
+        Args:
+            path: 持久化文件（JSONL），为空时只在内存中保存
+        """
+        self.path = path
+        self._ids: List[str] = []
+        self._texts: List[Tuple[str, ...]] = []
+        self._doc_of: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, List[int]]] = {field: {} for field in INDEXED_FIELDS}
+        self._pending: List[Dict] = []
+        self._loaded = False
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._ids)
+
+    def _ensure_loaded(self) -> None:
+        """首次使用时从持久化文件载入"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path and os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        self._index(json.loads(line))
+
+    def _index(self, entry: Dict) -> bool:
+        item_id = entry['id']
+        if item_id in self._doc_of:
+            return False
+        doc = len(self._ids)
+        self._ids.append(item_id)
+        self._doc_of[item_id] = doc
+        texts = tuple(entry.get(field) or '' for field in INDEXED_FIELDS)
+        self._texts.append(texts)
+        for field, text in zip(INDEXED_FIELDS, texts):
+            postings = self._postings[field]
+            for token in tokenize(text):
+                postings.setdefault(token, []).append(doc)
+        return True
+
+    def add(self, items: Iterable[BiddingInfo]) -> int:
+        """
+        登记项目（调用 flush 后持久化，已登记的ID会被跳过）
+
+        Args:
+            items: 项目列表
+
+        Returns:
+            int: 新登记的数量
+        """
+        self._ensure_loaded()
+        added = 0
+        for item in items:
+            entry = {'id': item.id}
+            for field in INDEXED_FIELDS:
+                entry[field] = getattr(item, field) or ''
+            if self._index(entry):
+                self._pending.append(entry)
+                added += 1
+        return added
+
+    def flush(self) -> None:
+        """把新登记的项目追加写入持久化文件"""
+        if not self.path or not self._pending:
+            self._pending = []
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for entry in self._pending:
+                f.write(json.dumps(entry, ensure_ascii=False))
+                f.write('\n')
+        self._pending = []
+
+    def rebuild(self, items: Iterable[BiddingInfo]) -> None:
+        """
+        用全部项目重建索引（全量保存后调用）
+
+        Args:
+            items: 全部项目
+        """
+        self._ids = []
+        self._texts = []
+        self._doc_of = {}
+        self._postings = {field: {} for field in INDEXED_FIELDS}
+        self._pending = []
+        self._loaded = True
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+        self.add(items)
+        self.flush()
+
+    def _candidates(self, field: str, tokens: Sequence[str]) -> List[int]:
+        postings = self._postings[field]
+        lists = []
+        for token in tokens:
+            docs = postings.get(token)
+            if not docs:
+                return []
+            lists.append(docs)
+        return _intersect(lists)
+
+    def search(self, query: str, fields: Sequence[str] = INDEXED_FIELDS, limit: Optional[int] = None) -> List[str]:
+        """
+        查找字段中包含查询串的项目（不区分英文大小写）
+
+        Args:
+            query: 查询串，多个词以空格分隔时要求全部出现（可以出现在不同字段中）
+            fields: 查询的字段，默认全部被索引字段
+            limit: 最多返回的数量
+
+        Returns:
+            List[str]: 项目ID，按登记顺序
+        """
+        self._ensure_loaded()
+        terms = [term.lower() for term in query.split()]
+        if not terms:
+            return []
+
+        field_positions = [INDEXED_FIELDS.index(field) for field in fields]
+        result = None
+        for term in terms:
+            tokens = _query_tokens(term)
+            docs = set()
+            for field, position in zip(fields, field_positions):
+                if tokens:
+                    candidates = self._candidates(field, tokens)
+                else:
+                    # 只有标点等无法切分的字符时退化为逐条查找
+                    candidates = range(len(self._ids))
+                # 词项交集可能不相邻，逐条确认子串
+                docs.update(doc for doc in candidates if term in self._texts[doc][position].lower())
+            result = docs if result is None else result & docs
+            if not result:
+                return []
+
+        ordered = sorted(result)
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [self._ids[doc] for doc in ordered]
+
+    def get_text(self, item_id: str, field: str = 'title') -> Optional[str]:
+        """
+        返回项目被索引的字段文本
+
+        Args:
+            item_id: 项目ID
+            field: 字段名
+
+        Returns:
+            Optional[str]: 字段文本，项目未登记时返回 None
+        """
+        self._ensure_loaded()
+        doc = self._doc_of.get(item_id)
+        if doc is None:
+            return None
+        return self._texts[doc][INDEXED_FIELDS.index(field)]
@@ -2,12 +2,23 @@
 Streamlit Web 应用 - 招投标信息展示
 """
 
+import sys
 import streamlit as st
 import pandas as pd
 import json
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from data.snapshot import join_list_column, load_snapshot
+
+# 界面筛选和展示用到的列，读取列式快照时只加载这些列
+UI_COLUMNS = [
+    'title', 'publish_date', 'info_type', 'city', 'owner_unit', 'budget_amount',
+    'procurement_type', 'bidding_deadline', 'keywords_matched', 'keyword_location_tag',
+    'project_address', 'detail_url',
+]
+
 # 页面配置
 st.set_page_config(
     page_title="招投标信息监控系统",
@@ -29,16 +40,23 @@ def load_data():
     fixed_file = base_dir / "data" / "bidding_data_fixed.json"
     original_file = base_dir / "data" / "bidding_data.json"
     
+    snapshot_file = base_dir / "data" / "bidding_data.feather"
+    
     data_file = fixed_file if fixed_file.exists() else original_file
     
-    if not data_file.exists():
+    # 列式快照存在且不旧于数据文件时，内存映射读取需要的列（由 export_snapshot.py 生成）
+    if snapshot_file.exists() and (
+        not data_file.exists() or snapshot_file.stat().st_mtime >= data_file.stat().st_mtime
+    ):
+        df = load_snapshot(str(snapshot_file), UI_COLUMNS)
+    elif data_file.exists():
+        with open(data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        df = pd.DataFrame(data)
+    else:
         return pd.DataFrame()
     
-    with open(data_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    df = pd.DataFrame(data)
-    
     # 转换日期格式
     if 'publish_date' in df.columns:
         df['publish_date'] = pd.to_datetime(df['publish_date']).dt.date
@@ -78,14 +96,14 @@ if 'publish_date' in df.columns:
 
 # 城市筛选
 if 'city' in df.columns:
-    cities = ['全部'] + sorted([c for c in df['city'].unique() if c])
+    cities = ['全部'] + sorted([c for c in df['city'].dropna().unique() if c])
     selected_city = st.sidebar.selectbox("城市", cities)
     if selected_city != '全部':
         df = df[df['city'] == selected_city]
 
 # 信息类型筛选
 if 'info_type' in df.columns:
-    info_types = ['全部'] + sorted(df['info_type'].unique().tolist())
+    info_types = ['全部'] + sorted(df['info_type'].dropna().unique().tolist())
     selected_type = st.sidebar.selectbox("信息类型", info_types)
     if selected_type != '全部':
         df = df[df['info_type'] == selected_type]
@@ -191,9 +209,7 @@ display_df = display_df.rename(columns=column_mapping)
 
 # 处理关键字列表显示
 if '匹配关键字' in display_df.columns:
-    display_df['匹配关键字'] = display_df['匹配关键字'].apply(
-        lambda x: ', '.join(x) if isinstance(x, list) else str(x)
-    )
+    display_df['匹配关键字'] = join_list_column(display_df['匹配关键字'])
 
 # 显示数据表格
 st.dataframe(
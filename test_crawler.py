@@ -7,7 +7,9 @@ import structlog
 from datetime import datetime
 
 from crawler.search_crawler import SearchCrawler, CrawlerConfig
-from data.storage import JSONStorage
+from crawler.browser_pool import BrowserPool
+from crawler.resource_filter import create_resource_filter
+from data.storage import create_storage
 from data.models import BiddingInfo
 from data.matcher import KeywordMatcher
 
@@ -40,26 +42,37 @@ def main():
     crawler_config = CrawlerConfig(
         min_delay=config['crawler']['anti_crawl']['min_delay'],
         max_delay=config['crawler']['anti_crawl']['max_delay'],
-        max_retries=config['crawler']['anti_crawl']['max_retries']
+        max_retries=config['crawler']['anti_crawl']['max_retries'],
+        max_pages=config['crawler']['search'].get('max_pages', 50)
     )
     
+    browser_config = config['crawler'].get('browser', {})
+    pool = BrowserPool(
+        size=browser_config.get('pool_size', 2),
+        max_pages_per_context=browser_config.get('max_pages_per_context', 50)
+    )
     crawler = SearchCrawler(
         keywords=config['crawler']['keywords'],
-        config=crawler_config
+        config=crawler_config,
+        pool=pool,
+        resource_filter=create_resource_filter(config['crawler'].get('resource_filter'))
     )
     
     # 初始化关键字匹配器
-    matcher = KeywordMatcher(config['crawler']['keywords'])
+    matcher = KeywordMatcher(config['crawler'].get('match_rules') or config['crawler']['keywords'])
     
     logger.info("crawler.initialized", keywords=config['crawler']['keywords'])
     
     # 执行搜索
     logger.info("crawler.searching", message="正在抓取采招网数据...")
-    results = crawler.search_full(
-        time_range="近三月",
-        region=config['crawler']['search']['region'],
-        info_types=config['crawler']['search']['info_types']
-    )
+    try:
+        results = crawler.search_full(
+            time_range="近三月",
+            region=config['crawler']['search']['region'],
+            info_types=config['crawler']['search']['info_types']
+        )
+    finally:
+        pool.close()
     
     logger.info("crawler.results", count=len(results))
     
@@ -67,14 +80,9 @@ def main():
         logger.warning("no_results", message="未抓取到数据，请检查网络或页面结构")
         return
     
-    # 转换为 BiddingInfo 对象并匹配关键字
+    # 匹配关键字、标注关键字位置并转换为 BiddingInfo 对象
     bidding_items = []
-    for item in results:
-        # 匹配关键字
-        text = f"{item['title']}"
-        matched_keywords = matcher.match(text)
-        item['keywords_matched'] = matched_keywords
-        
+    for item in matcher.annotate_items(results):
         # 创建 BiddingInfo 对象
         bidding_info = BiddingInfo(**item)
         bidding_items.append(bidding_info)
@@ -98,7 +106,7 @@ def main():
     save = input("\n是否保存到数据库？(y/n): ").strip().lower()
     
     if save == 'y':
-        storage = JSONStorage(config['storage']['json_path'])
+        storage = create_storage(config['storage'])
         
         # 保存数据
         metadata = {
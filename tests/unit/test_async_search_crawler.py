@@ -0,0 +1,250 @@
+"""异步搜索爬虫单元测试（用假的浏览器池和页面代替 Playwright）"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+import pytest
+
+pytest.importorskip("structlog")
+
+from crawler.async_search_crawler import AsyncSearchCrawler
+from crawler.pagination import PAGINATION_SCRIPT
+from crawler.search_crawler import EXTRACT_RECORDS_SCRIPT, CrawlerConfig
+from crawler.throttle import HostThrottle
+
+_sleep = asyncio.sleep
+
+# 挂起的页面只能靠取消结束，取消失效时测试在这个时间后失败而不是一直等待
+TIMEOUT = 5
+
+# 找不到结构化结果时退回文本解析的整页文本，各页内容相同
+LISTING_TEXT = """
+招标公告 成都市政务服务中心标识标牌采购项目
+采购预算：50万元
+四川
+2026-02-02
+招标公告 绵阳市宣传栏制作安装项目
+四川
+2026-02-03
+"""
+
+
+def _records(page_no, count=2):
+    return [
+        {
+            'project_id': str(page_no * 100 + i),
+            'info_type': '招标公告',
+            'raw_title': f'第{page_no}页标识标牌采购项目{i}',
+            'region': '四川',
+            'date': '2026-02-01',
+            'href': f'https://www.bidcenter.com.cn/news-{page_no * 100 + i}-1.html',
+        }
+        for i in range(count)
+    ]
+
+
+class FakeSite:
+    """
+    按 (关键字, 页码) 返回的结果页，页面行为：
+
+    - records: 页面内提取的记录（缺省时为空，退回 text 的文本解析）
+    - total: 第一页分页栏的总页数
+    - fail: 前若干次导航失败
+    - captcha: 触发人机验证
+    - hang: 导航一直不返回，直到被取消
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.visits = Counter()
+        self.cancelled = []
+
+    def spec(self, url):
+        query = parse_qs(urlsplit(url).query)
+        key = (query['keywords'][0], int(query.get('page', ['1'])[0]))
+        return key, self.pages.get(key, {})
+
+
+class FakePage:
+    def __init__(self, site):
+        self.site = site
+        self.url = None
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        key, spec = self.site.spec(url)
+        self.site.visits[key] += 1
+        if spec.get('hang'):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.site.cancelled.append(key)
+                raise
+        await _sleep(0)
+        if self.site.visits[key] <= spec.get('fail', 0):
+            raise RuntimeError("net::ERR_CONNECTION_RESET")
+        return SimpleNamespace(status=200)
+
+    async def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    async def evaluate(self, script, arg=None):
+        _, spec = self.site.spec(self.url)
+        if script == PAGINATION_SCRIPT:
+            return {'total': spec.get('total', 1), 'links': {}}
+        if script == EXTRACT_RECORDS_SCRIPT:
+            return spec.get('records', [])
+        if 'aliyunCaptcha' in script:
+            return spec.get('captcha', False)
+        # document.body.innerText
+        return spec.get('text', '')
+
+
+class FakePool:
+    def __init__(self, site):
+        self.site = site
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    @asynccontextmanager
+    async def page(self):
+        yield FakePage(self.site)
+
+
+def _crawler(site, max_retries=3, max_pages=50):
+    crawler = AsyncSearchCrawler(['广告'], CrawlerConfig(min_delay=0, max_delay=0.5, max_retries=max_retries,
+                                                       max_pages=max_pages), pool=FakePool(site))
+    # 不做主机间隔，asyncio.sleep 只来自重试退避
+    crawler.throttle = HostThrottle(0, 0, per_host=4)
+    return crawler
+
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    """记录 asyncio.sleep 的参数，不实际等待"""
+    delays = []
+
+    async def sleep(delay, result=None):
+        delays.append(delay)
+        return await _sleep(0, result)
+    monkeypatch.setattr(asyncio, 'sleep', sleep)
+    return delays
+
+
+def test_retry_backoff_doubles(backoffs):
+    site = FakeSite({('广告', 1): {'records': _records(1), 'fail': 2}})
+
+    async def main():
+        async with _crawler(site) as crawler:
+            return await crawler.fetch(crawler.search_url())
+
+    items = asyncio.run(main())
+    assert [item['id'] for item in items] == ['100', '101']
+    assert site.visits[('广告', 1)] == 3
+    assert backoffs == [0.5, 1.0]
+
+
+def test_retries_exhausted_returns_empty(backoffs):
+    site = FakeSite({('广告', 1): {'records': _records(1), 'fail': 5}})
+
+    async def main():
+        async with _crawler(site) as crawler:
+            return await crawler.fetch(crawler.search_url())
+
+    assert asyncio.run(main()) == []
+    assert site.visits[('广告', 1)] == 3
+    assert backoffs == [0.5, 1.0]
+
+
+def test_captcha_cancels_other_searches(backoffs):
+    """人机验证不重试，并取消其余搜索；已完成的搜索结果保留"""
+    site = FakeSite({
+        ('广告', 1): {'records': _records(1)},
+        ('标识', 1): {'captcha': True},
+        ('标牌', 1): {'hang': True},
+    })
+
+    async def main():
+        async with _crawler(site) as crawler:
+            items = await asyncio.wait_for(
+                crawler.search_many([(['广告'], '四川'), (['标识'], '四川'), (['标牌'], '四川')]), TIMEOUT)
+            return items, crawler._tasks
+
+    items, pending = asyncio.run(main())
+    assert [item['id'] for item in items] == ['100', '101']
+    assert site.visits[('标识', 1)] == 1
+    assert site.cancelled == [('标牌', 1)]
+    assert not pending
+    assert backoffs == []
+
+
+def test_captcha_on_later_page_cancels_remaining_pages(backoffs):
+    site = FakeSite({
+        ('广告', 1): {'records': _records(1), 'total': 4},
+        ('广告', 2): {'records': _records(2)},
+        ('广告', 3): {'captcha': True},
+        ('广告', 4): {'hang': True},
+    })
+
+    async def main():
+        async with _crawler(site) as crawler:
+            return await asyncio.wait_for(crawler.search_pages(), TIMEOUT)
+
+    items = asyncio.run(main())
+    assert [item['id'] for item in items] == ['100', '101', '200', '201']
+    assert site.cancelled == [('广告', 4)]
+
+
+def test_pages_merge_by_id_across_searches(backoffs):
+    site = FakeSite({
+        ('广告', 1): {'records': _records(1), 'total': 2},
+        ('广告', 2): {'records': _records(2)},
+        # 与另一组搜索的第 2 页是同一批项目
+        ('标识', 1): {'records': _records(2)},
+    })
+
+    async def main():
+        async with _crawler(site) as crawler:
+            return await crawler.search_many([(['广告'], '四川'), (['标识'], '四川')])
+
+    items = asyncio.run(main())
+    # 同一项目ID在不同搜索中出现，只保留一条，按 查询→页码 的顺序
+    assert [item['id'] for item in items] == ['100', '101', '200', '201']
+
+
+def test_fallback_items_dedup_by_content(backoffs):
+    """退回文本解析的项目只有临时ID，各页重复的按内容去重后重新编号"""
+    site = FakeSite({
+        ('广告', 1): {'text': LISTING_TEXT, 'total': 3},
+        ('广告', 2): {'text': LISTING_TEXT},
+        ('广告', 3): {'text': LISTING_TEXT},
+    })
+
+    async def main():
+        async with _crawler(site) as crawler:
+            return await crawler.search_pages(region='四川')
+
+    items = asyncio.run(main())
+    assert [item['title'] for item in items] == ['成都市政务服务中心标识标牌采购项目', '绵阳市宣传栏制作安装项目']
+    assert len({item['id'] for item in items}) == 2
+    assert all(item['id'].startswith('temp_') for item in items)
+    assert sum(site.visits.values()) == 3
+
+
+def test_max_pages_limits_pages(backoffs):
+    site = FakeSite({('广告', page_no): {'records': _records(page_no), 'total': 10} for page_no in range(1, 11)})
+
+    async def main():
+        async with _crawler(site, max_pages=3) as crawler:
+            return [page_no async for page_no, _ in crawler.iter_pages()]
+
+    assert sorted(asyncio.run(main())) == [1, 2, 3]
+    assert sum(site.visits.values()) == 3
@@ -0,0 +1,64 @@
+"""批量解析单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+from crawler.batch_parser import expand_paths, parse_files
+
+
+PAGE_A = """
+招标公告 学校标识标牌采购项目 (广告,标识等在内容中)
+采购预算：12万元
+四川
+2026-02-02
+中标结果 社区宣传栏制作
+广东
+2026-02-02
+"""
+
+PAGE_B = """
+招标公告 学校标识标牌采购项目 (广告,标识等在内容或附件中) 附件
+四川
+2026-02-02
+采购信息 景区导视系统设计
+四川
+2026-02-03
+"""
+
+
+def _write_pages(tmp_path):
+    (tmp_path / 'a.txt').write_text(PAGE_A, encoding='utf-8')
+    (tmp_path / 'b.txt').write_text(PAGE_B, encoding='utf-8')
+    (tmp_path / 'notes.md').write_text(PAGE_A, encoding='utf-8')
+    return [str(tmp_path / 'a.txt'), str(tmp_path / 'b.txt')]
+
+
+def test_expand_paths(tmp_path):
+    """测试目录只取 txt 文件，通配符按文件名排序"""
+    paths = _write_pages(tmp_path)
+    assert expand_paths(str(tmp_path)) == paths
+    assert expand_paths(str(tmp_path / '*.txt')) == paths
+    assert expand_paths(str(tmp_path / 'missing*.txt')) == []
+
+
+def test_parse_files_merges_and_deduplicates(tmp_path):
+    """测试跨文件去重（保留先出现的一条）并统一生成ID"""
+    paths = _write_pages(tmp_path)
+    items, stats = parse_files(paths, 'browser', 'https://example.com', processes=1)
+
+    assert [item['title'] for item in items] == ['学校标识标牌采购项目', '社区宣传栏制作', '景区导视系统设计']
+    assert items[0]['budget_amount'] == '12万元'
+    assert len({item['id'] for item in items}) == 3
+    assert all(item['source_url'] == 'https://example.com' for item in items)
+    assert [(s['items'], s['new_items']) for s in stats] == [(2, 2), (2, 1)]
+    assert stats[0]['lines'] == PAGE_A.count('\n')
+
+
+def test_parse_files_with_pool(tmp_path):
+    """测试进程池解析结果与单进程一致"""
+    paths = _write_pages(tmp_path)
+    serial, _ = parse_files(paths, 'browser', '', region_filter='四川', processes=1)
+    pooled, _ = parse_files(paths, 'browser', '', region_filter='四川', processes=2)
+
+    strip = lambda items: [{k: v for k, v in item.items() if k != 'id'} for item in items]
+    assert strip(pooled) == strip(serial)
+    assert [item['title'] for item in pooled] == ['学校标识标牌采购项目', '景区导视系统设计']
@@ -0,0 +1,262 @@
+"""浏览器池单元测试（用假的 Playwright 代替浏览器）"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import asyncio
+from types import ModuleType
+import pytest
+
+pytest.importorskip("structlog")
+
+from crawler.browser_pool import AsyncBrowserPool, BrowserPool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    page_class = FakePage
+
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    def add_init_script(self, script):
+        pass
+
+    def new_page(self):
+        page = self.page_class()
+        self.pages.append(page)
+        return page
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+        self.fail = False
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **kwargs):
+        if self.fail:
+            raise RuntimeError("Target page, context or browser has been closed")
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self, browser_class):
+        self.browsers = []
+        self.chromium = self
+        self.browser_class = browser_class
+
+    def launch(self, **kwargs):
+        browser = self.browser_class()
+        self.browsers.append(browser)
+        return browser
+
+    def stop(self):
+        pass
+
+
+class AsyncFakePage(FakePage):
+    async def close(self):
+        self.closed = True
+
+
+class AsyncFakeContext(FakeContext):
+    page_class = AsyncFakePage
+
+    async def add_init_script(self, script):
+        pass
+
+    async def new_page(self):
+        await asyncio.sleep(0)
+        return FakeContext.new_page(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncFakeBrowser(FakeBrowser):
+    async def new_context(self, **kwargs):
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("Target page, context or browser has been closed")
+        context = AsyncFakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class AsyncFakePlaywright(FakePlaywright):
+    async def launch(self, **kwargs):
+        return FakePlaywright.launch(self, **kwargs)
+
+    async def stop(self):
+        pass
+
+
+class _Starter:
+    def __init__(self, playwright):
+        self.playwright = playwright
+
+    def start(self):
+        return self.playwright
+
+
+class _AsyncStarter(_Starter):
+    async def start(self):
+        return self.playwright
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    """替换 playwright.sync_api / playwright.async_api，返回两个假的 Playwright 实例"""
+    sync_fake = FakePlaywright(FakeBrowser)
+    async_fake = AsyncFakePlaywright(AsyncFakeBrowser)
+    sync_api = ModuleType('playwright.sync_api')
+    sync_api.sync_playwright = lambda: _Starter(sync_fake)
+    async_api = ModuleType('playwright.async_api')
+    async_api.async_playwright = lambda: _AsyncStarter(async_fake)
+    monkeypatch.setitem(sys.modules, 'playwright', ModuleType('playwright'))
+    monkeypatch.setitem(sys.modules, 'playwright.sync_api', sync_api)
+    monkeypatch.setitem(sys.modules, 'playwright.async_api', async_api)
+    return sync_fake, async_fake
+
+
+def test_recycles_context_after_max_pages(playwright):
+    sync_fake, _ = playwright
+    with BrowserPool(size=1, max_pages_per_context=2) as pool:
+        contexts = []
+        for _ in range(3):
+            with pool.page() as page:
+                contexts.append(next(c for c in sync_fake.browsers[0].contexts if page in c.pages))
+
+        first, _, third = contexts
+        assert contexts[1] is first
+        assert first.closed
+        assert third is not first and not third.closed
+        assert all(page.closed for page in first.pages)
+        assert pool.stats == {'contexts_created': 2, 'contexts_recycled': 1, 'pages': 3}
+
+
+def test_nested_borrow_uses_temporary_context(playwright):
+    """空闲上下文都被借出时临时新建一个，归还后多余的关闭，空闲数保持 size"""
+    sync_fake, _ = playwright
+    with BrowserPool(size=1) as pool:
+        with pool.page():
+            with pool.page():
+                pass
+        browser = sync_fake.browsers[0]
+        assert len(browser.contexts) == 2
+        assert [context.closed for context in browser.contexts] == [True, False]
+        assert len(pool._idle) == 1
+
+        # 之后的借用复用留下的上下文
+        with pool.page():
+            pass
+        assert len(browser.contexts) == 2
+
+
+def test_relaunches_disconnected_browser(playwright):
+    sync_fake, _ = playwright
+    with BrowserPool(size=2) as pool:
+        with pool.page():
+            pass
+        first = sync_fake.browsers[0]
+        first.connected = False
+
+        with pool.page():
+            pass
+
+        assert len(sync_fake.browsers) == 2
+        second = sync_fake.browsers[1]
+        assert len(second.contexts) == 2
+        assert len(pool._idle) == 2
+        # 断开前的上下文不再借出
+        assert sum(len(context.pages) for context in first.contexts) == 1
+        assert sum(len(context.pages) for context in second.contexts) == 1
+
+
+def test_async_pool_limits_open_pages(playwright):
+    async def main():
+        active = [0, 0]
+
+        async def borrow():
+            async with pool.page():
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+                await asyncio.sleep(0.01)
+                active[0] -= 1
+
+        async with AsyncBrowserPool(size=2) as pool:
+            await asyncio.gather(*(borrow() for _ in range(6)))
+            return active[1], pool.stats
+
+    peak, stats = asyncio.run(main())
+    assert peak == 2
+    assert stats == {'contexts_created': 2, 'contexts_recycled': 0, 'pages': 6}
+
+
+def test_async_pool_recycles_context(playwright):
+    _, async_fake = playwright
+
+    async def main():
+        async with AsyncBrowserPool(size=1, max_pages_per_context=1) as pool:
+            for _ in range(2):
+                async with pool.page():
+                    pass
+            return pool.stats
+
+    stats = asyncio.run(main())
+    first, second, third = async_fake.browsers[0].contexts
+    assert first.closed and second.closed
+    assert stats == {'contexts_created': 3, 'contexts_recycled': 2, 'pages': 2}
+
+
+def test_async_pool_keeps_slot_when_recycle_fails(playwright):
+    """换新上下文失败时空位仍归还，下次借用时重建，池不会少一个上下文而一直等待"""
+    _, async_fake = playwright
+
+    async def main():
+        async with AsyncBrowserPool(size=1, max_pages_per_context=1) as pool:
+            browser = async_fake.browsers[0]
+            browser.fail = True
+            # 页面本身正常，换新失败不影响调用方
+            async with pool.page():
+                pass
+            assert browser.contexts[0].closed
+
+            # 重建仍失败：错误交给调用方，空位再次归还
+            with pytest.raises(RuntimeError):
+                async with pool.page():
+                    pass
+
+            browser.fail = False
+            async with asyncio.timeout(1):
+                async with pool.page():
+                    pass
+            return pool._idle.qsize(), browser.contexts
+
+    idle, contexts = asyncio.run(main())
+    # 池中仍是一个上下文：第一个在换新时关闭，空位重建出第二个，第二个用满后换成第三个
+    assert idle == 1
+    assert len(contexts) == 3
+    assert all(context.closed for context in contexts)
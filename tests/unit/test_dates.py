@@ -0,0 +1,39 @@
+"""日期解析单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+from datetime import datetime
+from data.dates import parse_date
+
+
+def test_parse_date_formats():
+    """测试支持的日期格式"""
+    assert parse_date('2026-02-02') == datetime(2026, 2, 2)
+    assert parse_date(' 2026-02-02 ') == datetime(2026, 2, 2)
+    assert parse_date('2026-2-3') == datetime(2026, 2, 3)
+    assert parse_date('2026/02/03') == datetime(2026, 2, 3)
+    assert parse_date('2026年2月3日') == datetime(2026, 2, 3)
+    assert parse_date('截止2026年2月3日') == datetime(2026, 2, 3)
+
+
+def test_parse_deadline_with_time():
+    """测试带时间的截止时间"""
+    assert parse_date('2026-02-20 17:00') == datetime(2026, 2, 20, 17, 0)
+    assert parse_date('2026-02-20T09:30:15') == datetime(2026, 2, 20, 9, 30, 15)
+    assert parse_date('2026年2月20日 17:30') == datetime(2026, 2, 20, 17, 30)
+    assert parse_date('2026年2月20日9时30分') == datetime(2026, 2, 20, 9, 30)
+    assert parse_date('2026-02-20 详见公告') == datetime(2026, 2, 20)
+    assert parse_date('2026-02-20 25:00') == datetime(2026, 2, 20)
+
+
+def test_parse_date_invalid():
+    """测试无法解析的输入"""
+    assert parse_date('详见内容') is None
+    assert parse_date('2026-13-45') is None
+    assert parse_date('') is None
+    assert parse_date(None) is None
+
+
+def test_parse_date_returns_shared_instances():
+    """测试相同输入复用缓存结果"""
+    assert parse_date('2026-02-02') is parse_date('2026-02-02')
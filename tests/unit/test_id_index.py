@@ -0,0 +1,56 @@
+"""持久化ID索引单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import tempfile
+from datetime import datetime
+from data.models import BiddingInfo
+from data.id_index import IDIndex
+from data.deduplicator import DataDeduplicator
+
+
+def test_filter_new_against_sorted_file():
+    """测试在有序文件中二分查找已存在的ID"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = IDIndex(os.path.join(temp_dir, "ids"))
+        index.rebuild(f"id_{i}" for i in range(20000))
+
+        result = index.filter_new(["id_0", "id_19999", "id_7777", "new_1", "new_1", "id_20000"])
+
+        assert result == ["new_1", "id_20000"]
+
+
+def test_add_and_merge():
+    """测试追加日志与合并"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index_dir = os.path.join(temp_dir, "ids")
+        index = IDIndex(index_dir, merge_threshold=3)
+        index.rebuild(["a", "b"])
+
+        index.add(["c", "d"])
+        assert index.contains("c")
+        assert index.filter_new(["a", "c", "e"]) == ["e"]
+
+        index.add(["e"])  # 达到阈值，触发合并
+        assert not os.path.exists(index.log_path)
+
+        reopened = IDIndex(index_dir)
+        assert reopened.filter_new(["a", "b", "c", "d", "e", "f"]) == ["f"]
+        assert reopened.read_meta()["count"] == 5
+
+
+def test_deduplicate_by_index():
+    """测试基于ID索引去重"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = IDIndex(os.path.join(temp_dir, "ids"))
+        index.rebuild(["1"])
+        new = [
+            BiddingInfo(id=item_id, title="项目", info_type="招标公告",
+                        publish_date=datetime.now(), province="四川")
+            for item_id in ["1", "2", "2"]
+        ]
+
+        result = DataDeduplicator().deduplicate_by_index(new, index)
+
+        assert [item.id for item in result] == ["2"]
@@ -0,0 +1,34 @@
+"""JSON 流式读取单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import json
+import os
+import tempfile
+from data.json_stream import iter_json_array
+
+
+def test_iter_object_with_small_chunks():
+    """测试对象格式文件在很小的读块下逐条解析"""
+    records = [{"id": str(i), "title": f"项目{i}", "budget": 12345678 + i} for i in range(50)]
+    payload = {"metadata": {"total_count": 50, "keywords": ["广告", "data"]}, "data": records}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "data.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        
+        assert list(iter_json_array(path, chunk_size=7)) == records
+
+
+def test_iter_top_level_array_and_empty():
+    """测试顶层数组与空数组"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "data.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([{"id": "1"}, {"id": "2"}], f)
+        assert [r["id"] for r in iter_json_array(path, chunk_size=3)] == ["1", "2"]
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"metadata": {}, "data": []}, f)
+        assert list(iter_json_array(path)) == []
@@ -0,0 +1,46 @@
+"""关键字位置标注单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+from data.keyword_location import split_location_tag, keyword_locations
+from data.matcher import KeywordMatcher
+
+
+def test_split_location_tag():
+    """测试拆分标题和位置标注"""
+    assert split_location_tag("绿色矿山建设标识标牌建设项目谈判公告-交易公告") == \
+        ("绿色矿山建设标识标牌建设项目谈判公告-交易公告", "", False, False)
+    assert split_location_tag(" 气体循环演示系统-采购公告 (广告,标识等在内容中)") == \
+        ("气体循环演示系统-采购公告", "(广告,标识等在内容中)", False, False)
+    assert split_location_tag("区委办后勤服务项目竞争性磋商公告 (广告,标识等在内容或附件中) 附件") == \
+        ("区委办后勤服务项目竞争性磋商公告", "(广告,标识等在内容或附件中)", True, False)
+    assert split_location_tag("校园维修服务采购项目（广告,标识等在内容或标书中） 标书") == \
+        ("校园维修服务采购项目", "（广告,标识等在内容或标书中）", False, True)
+
+
+def test_split_keeps_other_parentheses():
+    """测试标题中其他括号内容不会被当作位置标注"""
+    assert split_location_tag("设施设备采购项目(二次)") == ("设施设备采购项目(二次)", "", False, False)
+
+
+def test_keyword_locations():
+    """测试位置列表"""
+    assert keyword_locations(True, "") == ["标题"]
+    assert keyword_locations(False, "") == ["正文"]
+    assert keyword_locations(False, "(广告,标识等在内容中)") == ["正文"]
+    assert keyword_locations(True, "(广告,标识等在内容或附件中)") == ["标题", "正文", "附件"]
+    assert keyword_locations(False, "(广告,标识等在内容或标书中)") == ["正文", "标书"]
+
+
+def test_matcher_annotate():
+    """测试匹配时同时标注位置"""
+    matcher = KeywordMatcher(["广告", "标识"])
+    in_title = {"title": "景区标识标牌采购", "keyword_location_tag": ""}
+    in_content = {"title": "后勤服务项目", "keyword_location_tag": "(广告,标识等在内容或附件中)"}
+    
+    matcher.annotate_items([in_title, in_content])
+    
+    assert in_title["keywords_matched"] == ["标识"]
+    assert in_title["keyword_location"] == ["标题"]
+    assert in_content["keywords_matched"] == []
+    assert in_content["keyword_location"] == ["正文", "附件"]
@@ -54,3 +54,57 @@ def test_is_relevant_false():
         "content": "详细内容..."
     }
     assert matcher.is_relevant(item) == False
+
+
+def test_find_returns_offsets_including_overlaps():
+    """测试 find 返回关键字位置（包括重叠和重复出现）"""
+    matcher = KeywordMatcher(["标识", "标识牌", "牌", "广告"])
+    text = "标识牌和广告牌"
+    
+    assert matcher.find(text) == [("标识", 0), ("标识牌", 0), ("牌", 2), ("广告", 4), ("牌", 6)]
+    assert matcher.find("") == []
+
+
+def test_automaton_matches_substring_loop_for_large_keyword_lists():
+    """测试关键字较多（使用自动机）时结果与逐个子串查找一致且保持顺序"""
+    keywords = [f"关键字{i}" for i in range(150)] + ["宣传", "宣传栏", "栏"]
+    matcher = KeywordMatcher(keywords)
+    text = "关键字12与关键字7的宣传栏采购"
+    
+    assert matcher._scanner.automaton_for(text)
+    assert matcher.match(text) == [keyword for keyword in keywords if keyword in text]
+
+
+def test_long_text_uses_substring_loop_until_more_keywords():
+    """测试长文本（标题+正文）在关键字不够多时仍用子串循环，结果一致"""
+    body = "关键字3项目的宣传栏采购，" + "施工内容" * 100
+    for count in (150, 400):
+        keywords = [f"关键字{i}" for i in range(count)] + ["宣传", "宣传栏", "栏"]
+        matcher = KeywordMatcher(keywords)
+        item = {"title": "关键字12与关键字7", "content": body}
+        text = f"{item['title']} {body}"
+        
+        assert matcher._scanner.automaton_for(text) == (count == 400)
+        assert matcher.match_item(item) == [keyword for keyword in keywords if keyword in text]
+        assert matcher.is_relevant(item)
+
+
+def test_match_many_and_filter_relevant():
+    """测试批量匹配和批量筛选与逐条结果一致"""
+    matcher = KeywordMatcher(["广告", "标识"])
+    texts = ["户外广告牌采购", "道路施工", "", "标识标牌及广告"]
+    items = [{"title": text, "content": "详细内容..."} for text in texts]
+    
+    assert matcher.match_many(texts) == [matcher.match(text) for text in texts]
+    assert matcher.filter_relevant(items) == [item for item in items if matcher.is_relevant(item)]
+
+
+def test_match_many_with_process_pool(monkeypatch):
+    """测试使用进程池时结果与顺序不变"""
+    import data.matcher as matcher_module
+    monkeypatch.setattr(matcher_module, "POOL_MIN_TEXTS", 10)
+    
+    matcher = KeywordMatcher(["广告", "标识"])
+    texts = [f"第{i}号{'广告' if i % 3 == 0 else '施工'}项目" for i in range(3000)]
+    
+    assert matcher.match_many(texts, processes=2) == matcher.match_many(texts)
@@ -0,0 +1,140 @@
+"""列表解析单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+from datetime import datetime
+from crawler.listing_parser import iter_listing, iter_listing_items, parse_listing, parse_records
+
+
+SAMPLE = """
+采招网 搜索结果
+招标公告 沙湾区寨子村传统村落保护改造提升项目-交易公告 (广告,标识等在内容中)
+采购预算：27218.16万元
+ 采购方式：比选 截止时间：2026-02-20 17:00
+四川
+2026-02-02
+招标预告 江门市棠下镇地块项目设计招标 (广告,标识等在内容或附件中) 附件
+采购预算：详见内容 采购方式：公开招标 截止时间：详见内容
+标书
+广东
+2026-02-03
+"""
+
+
+def test_parse_listing():
+    """测试解析字段、位置标注和标签行"""
+    items = parse_listing(SAMPLE, 'browser', 'https://example.com')
+    assert len(items) == 2
+
+    first, second = items
+    assert first['info_type'] == '招标公告'
+    assert first['title'] == '沙湾区寨子村传统村落保护改造提升项目-交易公告'
+    assert first['keyword_location_tag'] == '(广告,标识等在内容中)'
+    assert first['budget_amount'] == '27218.16万元'
+    assert first['procurement_type'] == '比选'
+    assert first['bidding_deadline'] == datetime(2026, 2, 20, 17, 0)
+    assert first['province'] == '四川'
+    assert first['publish_date'] == datetime(2026, 2, 2)
+    assert first['id'].startswith('browser_')
+    assert first['source_url'] == 'https://example.com'
+
+    assert second['info_type'] == '招标预告'
+    assert second['has_attachments'] and second['has_bidding_docs']
+    assert second['budget_amount'] == '详见内容'
+    assert second['procurement_type'] == '公开招标'
+    assert second['bidding_deadline'] is None
+    assert second['province'] == '广东'
+
+
+def test_region_filter_keeps_ids():
+    """测试地区筛选不改变项目序号"""
+    items = parse_listing(SAMPLE, 'temp', '', region_filter='广东')
+    assert [item['title'] for item in items] == ['江门市棠下镇地块项目设计招标']
+    assert items[0]['id'].endswith('_1')
+
+
+def test_info_type_only_as_prefix():
+    """测试标题行以外出现信息类型文字时不会开始新项目"""
+    items = list(iter_listing([
+        '中标结果 学校标识标牌采购',
+        '原招标公告编号：ZB-001',
+        '四川',
+    ]))
+    assert len(items) == 1
+    assert items[0]['province'] == '四川'
+
+
+def test_items_without_title_are_dropped():
+    """测试只有信息类型没有标题的行被丢弃"""
+    items = list(iter_listing(['招标公告', '四川', '采购信息 展板制作']))
+    assert [item['title'] for item in items] == ['展板制作']
+
+
+def test_iter_listing_items_is_incremental():
+    """测试流式解析读到下一个标题行就产出上一个项目"""
+    consumed = []
+
+    def lines():
+        for line in SAMPLE.split('\n'):
+            consumed.append(line)
+            yield line
+
+    items = iter_listing_items(lines(), 'browser', '')
+    first = next(items)
+    assert first['title'] == '沙湾区寨子村传统村落保护改造提升项目-交易公告'
+    assert consumed[-1].startswith('招标预告')
+    assert [item['title'] for item in items] == ['江门市棠下镇地块项目设计招标']
+
+
+def test_iter_listing_items_from_file(tmp_path):
+    """测试直接从文件对象逐行解析，结果与整体解析一致"""
+    path = tmp_path / 'page.txt'
+    path.write_text(SAMPLE, encoding='utf-8')
+    with open(path, 'r', encoding='utf-8') as f:
+        streamed = list(iter_listing_items(f, 'browser', '', region_filter='四川'))
+    parsed = parse_listing(SAMPLE, 'browser', '', region_filter='四川')
+    assert [item['title'] for item in streamed] == [item['title'] for item in parsed]
+    assert streamed[0]['id'].endswith('_0')
+
+
+def test_parse_records():
+    """测试转换页面提取的结构化记录"""
+    records = [
+        {
+            'project_id': '403962314',
+            'info_type': '招标公告',
+            'raw_title': ' 沙湾区项目-交易公告 (广告,标识等在内容或附件中) 附件',
+            'link_title': '沙湾区项目-交易公告',
+            'budget': '12万元',
+            'method': '比选',
+            'deadline': '2026-02-20 17:00',
+            'region': '四川',
+            'date': '2026-02-02',
+            'labels': ['标书'],
+            'href': 'https://www.bidcenter.com.cn/news-403962314-1.html',
+        },
+        # 重复的项目ID
+        {'project_id': '403962314', 'raw_title': '沙湾区项目-交易公告', 'region': '四川'},
+        # 没有信息类型行时使用链接标题
+        {'project_id': '403958838', 'link_title': '德阳市材料采购询比公告', 'region': '广东'},
+        {'project_id': None, 'link_title': '没有项目ID'},
+    ]
+    items = parse_records(records, 'https://example.com')
+    assert [item['id'] for item in items] == ['403962314', '403958838']
+
+    first = items[0]
+    assert first['title'] == '沙湾区项目-交易公告'
+    assert first['info_type'] == '招标公告'
+    assert first['keyword_location_tag'] == '(广告,标识等在内容或附件中)'
+    assert first['has_attachments'] and first['has_bidding_docs']
+    assert first['budget_amount'] == '12万元'
+    assert first['procurement_type'] == '比选'
+    assert first['bidding_deadline'] == datetime(2026, 2, 20, 17, 0)
+    assert first['publish_date'] == datetime(2026, 2, 2)
+    assert first['province'] == '四川'
+    assert first['detail_url'] == 'https://www.bidcenter.com.cn/news-403962314-1.html'
+    assert first['source_url'] == 'https://example.com'
+
+    assert items[1]['title'] == '德阳市材料采购询比公告'
+    assert items[1]['info_type'] == ''
+    assert [item['id'] for item in parse_records(records, '', region_filter='广东')] == ['403958838']
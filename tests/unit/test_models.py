@@ -0,0 +1,59 @@
+"""数据模型单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import dataclasses
+from datetime import datetime
+from data.models import BiddingInfo
+
+
+def _make_item(**kwargs) -> BiddingInfo:
+    data = dict(
+        id="1",
+        title="项目A",
+        info_type="招标公告",
+        publish_date=datetime(2026, 2, 1),
+        province="四川",
+        bidding_deadline=datetime(2026, 2, 20, 17, 0),
+        keywords_matched=["广告", "标识"],
+        crawled_at=datetime(2026, 2, 2, 8, 0)
+    )
+    data.update(kwargs)
+    return BiddingInfo(**data)
+
+
+def test_slotted_without_instance_dict():
+    """测试使用 __slots__ 且低基数字段被驻留"""
+    item = _make_item(city="".join(["成", "都"]))
+    
+    assert not hasattr(item, '__dict__')
+    assert item.city is sys.intern("成都")
+
+
+def test_to_dict_matches_asdict_and_round_trips():
+    """测试 to_dict 与 asdict 结果一致并可往返转换"""
+    item = _make_item()
+    data = item.to_dict()
+    
+    expected = dataclasses.asdict(item)
+    for name in ('publish_date', 'bidding_deadline', 'crawled_at'):
+        expected[name] = expected[name].isoformat()
+    assert data == expected
+    
+    data['keywords_matched'].append("牌")
+    assert item.keywords_matched == ["广告", "标识"]
+    assert BiddingInfo.from_dict(item.to_dict()) == item
+
+
+def test_from_dicts_shares_decoded_datetimes():
+    """测试批量创建时相同发布日期只解析一次且结果一致"""
+    records = [_make_item(id=str(i)).to_dict() for i in range(3)]
+    expected = [BiddingInfo.from_dict(dict(record)) for record in records]
+    
+    items = BiddingInfo.from_dicts(records)
+    
+    assert items == expected
+    assert items[0].publish_date is items[2].publish_date
+    # 抓取时间每条不同，不进入缓存
+    assert items[0].crawled_at == items[1].crawled_at
+    assert items[0].crawled_at is not items[1].crawled_at
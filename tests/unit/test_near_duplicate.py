@@ -0,0 +1,77 @@
+"""近似重复检测单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import tempfile
+from datetime import datetime
+from data.models import BiddingInfo
+from data.near_duplicate import NearDuplicateDetector, normalize_title
+from data.storage import JSONStorage
+
+
+def _make_item(
+    item_id: str, title: str, publish_date: datetime, owner_unit: str = None, info_type: str = "招标公告"
+) -> BiddingInfo:
+    return BiddingInfo(
+        id=item_id,
+        title=title,
+        info_type=info_type,
+        publish_date=publish_date,
+        province="四川",
+        owner_unit=owner_unit
+    )
+
+
+def test_normalize_title_strips_location_suffix():
+    """测试去除位置标注"""
+    assert normalize_title("沙湾区寨子村传统村落保护改造提升项目-交易公告 (广告,标识等在内容中)") == \
+        "沙湾区寨子村传统村落保护改造提升项目交易公告"
+    assert normalize_title("标识标牌采购（广告,标识等在内容或附件中）") == "标识标牌采购"
+
+
+def test_filter_detects_same_notice_with_different_ids():
+    """测试不同ID的同一公告被识别为重复"""
+    detector = NearDuplicateDetector()
+    detector.filter([_make_item("temp_1_0", "德阳市涟江路下穿宝成铁路工程材料采购询比公告", datetime(2026, 2, 1))])
+
+    kept, duplicates = detector.filter([
+        _make_item("browser_2_0", "德阳市涟江路下穿宝成铁路工程材料采购询比公告 (广告,标识等在内容中)", datetime(2026, 2, 1)),
+        _make_item("browser_2_1", "成都市锦江区文化馆2026年文化活动宣传推广项目", datetime(2026, 2, 1)),
+        _make_item("browser_2_2", "德阳市涟江路下穿宝成铁路工程材料采购询比公告", datetime(2026, 3, 20)),
+    ])
+
+    assert [item.id for item in kept] == ["browser_2_1", "browser_2_2"]
+    assert duplicates[0][1] == "temp_1_0"
+
+
+def test_filter_keeps_other_notice_types_of_same_project():
+    """测试同一项目的变更、结果公告不被当作招标公告的重复"""
+    title = "德阳市涟江路下穿宝成铁路工程材料采购询比公告"
+    detector = NearDuplicateDetector()
+    kept, duplicates = detector.filter([
+        _make_item("temp_1_0", title, datetime(2026, 2, 1)),
+        _make_item("temp_1_1", title, datetime(2026, 2, 3), info_type="中标结果"),
+        _make_item("temp_1_2", title, datetime(2026, 2, 2), info_type="招标变更"),
+        _make_item("temp_1_3", title, datetime(2026, 2, 2)),
+    ])
+    assert [item.id for item in kept] == ["temp_1_0", "temp_1_1", "temp_1_2"]
+    assert duplicates[0][1] == "temp_1_0"
+
+
+def test_storage_drops_near_duplicates():
+    """测试存储追加时过滤近似重复并持久化指纹"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bidding.json")
+        storage = JSONStorage(path, near_duplicate=True)
+        storage.save([_make_item("temp_1_0", "绿色矿山建设标识标牌建设项目谈判公告", datetime(2026, 2, 1))], {})
+
+        reopened = JSONStorage(path, near_duplicate=True)
+        added = reopened.append([
+            _make_item("temp_2_0", "绿色矿山建设标识标牌建设项目谈判公告", datetime(2026, 2, 2)),
+            _make_item("temp_2_1", "广元市利州区户外广告牌安全检测及整治项目", datetime(2026, 2, 2)),
+        ])
+
+        assert added == 1
+        items, _ = reopened.load()
+        assert [item.id for item in items] == ["temp_1_0", "temp_2_1"]
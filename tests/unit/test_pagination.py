@@ -0,0 +1,83 @@
+"""结果分页单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+from urllib.parse import parse_qs, urlsplit
+from crawler.pagination import CrawlMetrics, merge_pages, page_urls
+
+FIRST = "https://search.bidcenter.com.cn/search?keywords=广告,标识&mod=0"
+
+
+def _query(url):
+    return {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+
+
+def test_single_page():
+    assert page_urls(FIRST, {'total': 1, 'links': {}}) == []
+    assert page_urls(FIRST, None) == []
+
+
+def test_uses_pager_links_and_derives_missing_pages():
+    links = {
+        '1': "https://search.bidcenter.com.cn/search?keywords=广告&page=1",
+        '2': "https://search.bidcenter.com.cn/search?keywords=广告&page=2",
+        '3': "https://search.bidcenter.com.cn/search?keywords=广告&page=3",
+    }
+    urls = page_urls(FIRST, {'total': 6, 'links': links})
+    assert len(urls) == 5
+    assert urls[0] == links['2']
+    assert urls[1] == links['3']
+    # 分页栏未显示的页码按链接中的页码参数推出
+    assert [_query(url)['page'] for url in urls[2:]] == ['4', '5', '6']
+    assert _query(urls[-1])['keywords'] == '广告'
+
+
+def test_detects_page_parameter_name():
+    links = {2: "https://search.bidcenter.com.cn/search?keywords=广告&pageIndex=2&size=20"}
+    urls = page_urls(FIRST, {'total': 4, 'links': links})
+    assert [_query(url)['pageIndex'] for url in urls] == ['2', '3', '4']
+    assert all(_query(url)['size'] == '20' for url in urls)
+
+
+def test_script_links_fall_back_to_page_parameter():
+    links = {2: "javascript:void(0)", 3: "javascript:void(0)"}
+    urls = page_urls(FIRST, {'total': 3, 'links': links})
+    assert [_query(url)['page'] for url in urls] == ['2', '3']
+    assert _query(urls[0])['keywords'] == '广告,标识'
+    assert _query(urls[0])['mod'] == '0'
+
+
+def test_max_pages_limits_total():
+    urls = page_urls(FIRST, {'total': 120, 'links': {}}, max_pages=5)
+    assert len(urls) == 4
+
+
+def test_merge_pages_dedups_in_order():
+    pages = [
+        [{'id': '101', 'title': 'A'}, {'id': '102', 'title': 'B'}],
+        None,
+        [{'id': '102', 'title': 'B'}, {'id': '103', 'title': 'C'}],
+    ]
+    assert [item['id'] for item in merge_pages(pages)] == ['101', '102', '103']
+
+
+def test_merge_pages_renumbers_temp_items():
+    item = {'info_type': '招标公告', 'title': '宣传栏采购', 'publish_date': None, 'province': '四川'}
+    pages = [
+        [dict(item, id='temp_1_0'), dict(item, id='temp_1_1', title='标识牌采购')],
+        [dict(item, id='temp_2_0')],
+    ]
+    merged = merge_pages(pages)
+    assert len(merged) == 2
+    assert len({entry['id'] for entry in merged}) == 2
+
+
+def test_metrics_summary():
+    metrics = CrawlMetrics()
+    metrics.add_page(20)
+    metrics.add_page(15)
+    summary = metrics.summary()
+    assert summary['pages'] == 2
+    assert summary['items'] == 35
+    assert summary['pages_per_second'] >= 0
+    assert summary['items_per_second'] >= summary['pages_per_second']
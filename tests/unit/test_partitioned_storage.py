@@ -0,0 +1,159 @@
+"""按月分区存储单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import tempfile
+from datetime import datetime
+from data.models import BiddingInfo
+from data.partitioned_storage import PartitionedStorage
+
+
+def _make_item(item_id: str, publish_date: datetime) -> BiddingInfo:
+    return BiddingInfo(
+        id=item_id,
+        title=f"项目{item_id}",
+        info_type="招标公告",
+        publish_date=publish_date,
+        province="四川"
+    )
+
+
+def test_partitions_and_date_range_pruning():
+    """测试按月分区写入与日期范围读取"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = PartitionedStorage(temp_dir)
+        storage.save([
+            _make_item("1", datetime(2025, 12, 30)),
+            _make_item("2", datetime(2026, 1, 15)),
+        ], {"last_full_crawl": "2026-01-16T00:00:00"})
+        
+        added = storage.append([_make_item("2", datetime(2026, 1, 15)), _make_item("3", datetime(2026, 2, 1))])
+        
+        assert added == 1
+        partitions = storage.partitions()
+        assert sorted(partitions) == ["2025/12", "2026/01", "2026/02"]
+        assert partitions["2026/01"]["min_publish_date"] == "2026-01-15T00:00:00"
+        assert os.path.exists(os.path.join(temp_dir, "2026", "02", "items.jsonl"))
+        
+        items = list(storage.iter_items(start_date=datetime(2026, 1, 15), end_date=datetime(2026, 1, 31)))
+        assert [item.id for item in items] == ["2"]
+        assert storage.load_metadata()["total_count"] == 3
+
+
+def test_drop_before_removes_whole_partitions():
+    """测试保留策略按分区删除"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = PartitionedStorage(temp_dir)
+        storage.save([
+            _make_item("1", datetime(2025, 11, 3)),
+            _make_item("2", datetime(2025, 12, 30)),
+            _make_item("3", datetime(2026, 1, 2)),
+        ], {})
+        
+        dropped = storage.drop_before(datetime(2026, 1, 1))
+        
+        assert dropped == 2
+        assert [item.id for item in storage.iter_items()] == ["3"]
+        assert storage.append([_make_item("1", datetime(2025, 11, 3))]) == 0
+
+
+def _crash(*args, **kwargs):
+    raise RuntimeError("crash")
+
+
+def test_crash_before_index_update_does_not_duplicate():
+    """测试分区写入后、ID索引更新前中断：下次追加从分区补齐索引，不会重复写入"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = PartitionedStorage(temp_dir)
+        storage.save([_make_item("1", datetime(2026, 1, 2))], {})
+
+        storage.id_index.add = _crash
+        try:
+            storage.append([_make_item("2", datetime(2026, 1, 20))])
+        except RuntimeError:
+            pass
+
+        reopened = PartitionedStorage(temp_dir)
+        assert reopened.append([_make_item("2", datetime(2026, 1, 20)), _make_item("3", datetime(2026, 2, 1))]) == 1
+        assert [item.id for item in reopened.iter_items()] == ["1", "2", "3"]
+        assert reopened.partitions()["2026/01"]["count"] == 2
+
+
+def test_crash_before_stats_update_recomputes_stats():
+    """测试分区写入后、统计更新前中断：按日期范围读取不会漏掉已写入的项目"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = PartitionedStorage(temp_dir)
+        storage.save([_make_item("1", datetime(2026, 1, 2))], {})
+
+        storage._write_stats = _crash
+        try:
+            storage.append([_make_item("2", datetime(2026, 1, 20)), _make_item("3", datetime(2026, 3, 5))])
+        except RuntimeError:
+            pass
+
+        # 第一个分区（2026/01）的数据已写入，统计未更新
+        reopened = PartitionedStorage(temp_dir)
+        items = list(reopened.iter_items(start_date=datetime(2026, 1, 10)))
+        assert [item.id for item in items] == ["2"]
+        assert reopened.partitions()["2026/01"] == {
+            "count": 2, "min_publish_date": "2026-01-02T00:00:00", "max_publish_date": "2026-01-20T00:00:00"
+        }
+        assert reopened.append([_make_item("2", datetime(2026, 1, 20)), _make_item("3", datetime(2026, 3, 5))]) == 1
+        assert [item.id for item in reopened.iter_items(start_date=datetime(2026, 1, 10))] == ["2", "3"]
+
+
+def test_crash_while_staging_save_keeps_old_partitions():
+    """测试全量保存写暂存目录时中断：原分区保持不变，暂存目录被丢弃"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = PartitionedStorage(temp_dir)
+        storage.save([_make_item("1", datetime(2025, 12, 30)), _make_item("2", datetime(2026, 1, 2))], {})
+
+        write_partition = PartitionedStorage._write_partition
+        calls = []
+
+        def crash_on_second(self, key, items, mode):
+            calls.append(key)
+            if len(calls) == 2:
+                raise RuntimeError("crash")
+            write_partition(self, key, items, mode)
+        PartitionedStorage._write_partition = crash_on_second
+        try:
+            storage.save([_make_item("3", datetime(2026, 2, 1)), _make_item("4", datetime(2026, 3, 1))], {})
+        except RuntimeError:
+            pass
+        finally:
+            PartitionedStorage._write_partition = write_partition
+
+        reopened = PartitionedStorage(temp_dir)
+        assert [item.id for item in reopened.iter_items()] == ["1", "2"]
+        assert not os.path.exists(os.path.join(temp_dir, PartitionedStorage.STAGING_NAME))
+
+
+def test_crash_while_swapping_save_finishes_on_next_use():
+    """测试原分区已移走、新分区尚未换入时中断：下次使用时继续换入，数据不丢失"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = PartitionedStorage(temp_dir)
+        storage.save([_make_item("1", datetime(2025, 12, 30)), _make_item("2", datetime(2026, 1, 2))], {})
+
+        staging = os.path.join(temp_dir, PartitionedStorage.STAGING_NAME)
+        top_level_entries = storage._top_level_entries
+
+        def crash_before_swap_in(root):
+            if root == staging and os.path.exists(os.path.join(staging, PartitionedStorage.RETIRED_MARKER)):
+                raise RuntimeError("crash")
+            return top_level_entries(root)
+        storage._top_level_entries = crash_before_swap_in
+        try:
+            storage.save([_make_item("2", datetime(2026, 1, 2)), _make_item("3", datetime(2026, 2, 1))],
+                         {"total_count": 2})
+        except RuntimeError:
+            pass
+        assert not os.path.exists(os.path.join(temp_dir, "2026"))
+
+        reopened = PartitionedStorage(temp_dir)
+        assert [item.id for item in reopened.iter_items()] == ["2", "3"]
+        assert sorted(reopened.partitions()) == ["2026/01", "2026/02"]
+        assert not os.path.exists(staging)
+        assert not os.path.exists(os.path.join(temp_dir, PartitionedStorage.RETIRED_NAME))
+        assert reopened.append([_make_item("3", datetime(2026, 2, 1)), _make_item("4", datetime(2026, 3, 1))]) == 1
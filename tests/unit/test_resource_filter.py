@@ -0,0 +1,121 @@
+"""请求拦截单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import asyncio
+from crawler.resource_filter import ResourceFilter, create_resource_filter
+
+SITE = "https://search.bidcenter.com.cn"
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.result = None
+
+    def abort(self):
+        self.result = 'abort'
+
+    def continue_(self):
+        self.result = 'continue'
+
+
+class AsyncFakeRoute(FakeRoute):
+    async def abort(self):
+        self.result = 'abort'
+
+    async def continue_(self):
+        self.result = 'continue'
+
+
+class FakePage:
+    def __init__(self):
+        self.handler = None
+
+    def route(self, pattern, handler):
+        self.handler = handler
+
+
+class AsyncFakePage(FakePage):
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+
+def test_blocks_resource_types():
+    rules = ResourceFilter()
+    assert rules.should_block('image', f"{SITE}/logo.png") == 'image'
+    assert rules.should_block('stylesheet', f"{SITE}/style.css") is None
+    assert rules.should_block('font', "https://fonts.example.com/a.woff2") == 'font'
+    assert rules.should_block('script', f"{SITE}/app.js") is None
+    assert rules.should_block('xhr', f"{SITE}/api/list") is None
+
+
+def test_stylesheet_blocking_is_opt_in():
+    rules = ResourceFilter(block_types=['image', 'stylesheet'])
+    assert rules.should_block('stylesheet', f"{SITE}/style.css") == 'stylesheet'
+
+
+def test_never_blocks_document_or_non_http():
+    rules = ResourceFilter(block_types=['document', 'image'], block_third_party=True)
+    assert rules.should_block('document', "https://other.example.com/") is None
+    assert rules.should_block('image', "data:image/png;base64,AAAA") is None
+
+
+def test_blocks_tracker_domains_and_subdomains():
+    rules = ResourceFilter()
+    assert rules.should_block('script', "https://hm.baidu.com/hm.js?abc") == 'tracker'
+    assert rules.should_block('script', "https://s4.cnzz.com/z_stat.php") == 'tracker'
+    assert rules.should_block('script', "https://notcnzz.com/a.js") is None
+
+
+def test_third_party_blocking():
+    rules = ResourceFilter(block_third_party=True)
+    assert rules.should_block('script', "https://cdn.example.com/lib.js") == 'third_party'
+    assert rules.should_block('script', "https://static.bidcenter.com.cn/lib.js") is None
+    assert ResourceFilter().should_block('script', "https://cdn.example.com/lib.js") is None
+
+
+def test_install_counts_per_page():
+    page = FakePage()
+    resources = ResourceFilter().install(page)
+    routes = [
+        FakeRoute('document', f"{SITE}/search"),
+        FakeRoute('image', f"{SITE}/a.png"),
+        FakeRoute('image', f"{SITE}/b.png"),
+        FakeRoute('script', "https://hm.baidu.com/hm.js"),
+    ]
+    for route in routes:
+        page.handler(route)
+    assert [route.result for route in routes] == ['continue', 'abort', 'abort', 'abort']
+    assert resources.summary() == {'allowed': 1, 'blocked': 3, 'blocked_by': {'image': 2, 'tracker': 1}}
+    resources.reset()
+    assert resources.summary() == {'allowed': 0, 'blocked': 0, 'blocked_by': {}}
+
+
+def test_install_async():
+    async def main():
+        page = AsyncFakePage()
+        resources = await ResourceFilter().install_async(page)
+        routes = [AsyncFakeRoute('font', f"{SITE}/a.woff"), AsyncFakeRoute('fetch', f"{SITE}/api")]
+        for route in routes:
+            await page.handler(route)
+        return routes, resources
+
+    routes, resources = asyncio.run(main())
+    assert [route.result for route in routes] == ['abort', 'continue']
+    assert resources.summary()['blocked_by'] == {'font': 1}
+
+
+def test_create_resource_filter():
+    assert create_resource_filter(None) is None
+    assert create_resource_filter({'enabled': False}) is None
+    rules = create_resource_filter({'block_types': ['image'], 'block_third_party': True})
+    assert rules.block_types == frozenset(['image'])
+    assert rules.block_third_party
+    assert rules.should_block('stylesheet', f"{SITE}/a.css") is None
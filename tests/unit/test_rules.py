@@ -0,0 +1,47 @@
+"""关键字规则单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import pytest
+from data.matcher import KeywordMatcher
+from data.rules import RuleCompiler
+
+
+def test_plain_keywords_are_not_parsed_as_rules():
+    """测试不含规则语法的关键字保持原有的子串语义"""
+    compiler = RuleCompiler()
+    
+    assert compiler.compile("标识").plain
+    assert compiler.compile("户外 广告").plain
+    assert not compiler.compile("标识 AND NOT 停车场").plain
+
+
+def test_exclusion_and_phrase_groups():
+    """测试排除条件和短语组"""
+    matcher = KeywordMatcher(["标识 AND NOT 停车场", "(宣传 OR 文化) 栏"])
+    
+    assert matcher.match("景区标识标牌采购") == ["标识"]
+    assert matcher.match("停车场标识改造") == []
+    assert matcher.match("社区文化宣传栏制作") == ["宣传", "文化", "栏"]
+    assert matcher.match("社区文化活动") == []
+
+
+def test_field_scopes():
+    """测试字段限定"""
+    matcher = KeywordMatcher(["牌 AND owner_unit:学校", "title:广告 NOT content:结果"])
+    school = {"title": "校园指示牌采购", "owner_unit": "某市实验学校"}
+    hospital = {"title": "院区指示牌采购", "owner_unit": "某市人民医院"}
+    
+    assert matcher.match_item(school) == ["牌", "学校"]
+    assert matcher.match_item(hospital) == []
+    assert not matcher.is_relevant(hospital)
+    assert matcher.match_item({"title": "广告位租赁", "content": "公告内容"}) == ["广告"]
+    assert matcher.match_item({"title": "广告位租赁", "content": "中标结果"}) == []
+    assert matcher.match_items([school, hospital]) == [["牌", "学校"], []]
+
+
+def test_invalid_rules():
+    """测试规则语法错误"""
+    for source in ["标识 AND", "(标识 OR 标牌", "city:成都 AND 标识", "NOT 停车场"]:
+        with pytest.raises(ValueError):
+            KeywordMatcher([source])
@@ -0,0 +1,120 @@
+"""搜索爬虫翻页单元测试（用假的浏览器池和页面代替 Playwright）"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+import pytest
+
+pytest.importorskip("structlog")
+
+from crawler.pagination import PAGINATION_SCRIPT
+from crawler.search_crawler import EXTRACT_RECORDS_SCRIPT, CrawlerConfig, SearchCrawler
+
+
+def _page_no(url):
+    return int(parse_qs(urlsplit(url).query).get('page', ['1'])[0])
+
+
+def _records(page_no, region='四川', count=2):
+    return [
+        {
+            'project_id': str(page_no * 100 + i),
+            'info_type': '招标公告',
+            'raw_title': f'第{page_no}页标识标牌采购项目{i}',
+            'region': region,
+            'date': '2026-02-01',
+            'href': f'https://www.bidcenter.com.cn/news-{page_no * 100 + i}-1.html',
+        }
+        for i in range(count)
+    ]
+
+
+class FakePage:
+    """按URL中的页码返回结果：pages 中的值为记录列表或要抛出的异常，缺失的页码为空页"""
+
+    def __init__(self, pages, total):
+        self.pages = pages
+        self.total = total
+        self.visited = []
+        self.url = None
+
+    def goto(self, url, **kwargs):
+        self.url = url
+        self.visited.append(_page_no(url))
+        result = self.pages.get(_page_no(url), [])
+        if isinstance(result, Exception):
+            raise result
+        return SimpleNamespace(status=200)
+
+    def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    def content(self):
+        return '<html><body></body></html>'
+
+    def evaluate(self, script, arg=None):
+        if script == PAGINATION_SCRIPT:
+            return {'total': self.total, 'links': {}}
+        if script == EXTRACT_RECORDS_SCRIPT:
+            return self.pages.get(_page_no(self.url), [])
+        # 找不到结构化结果时的整页文本
+        return ''
+
+
+class FakePool:
+    def __init__(self, page):
+        self._page = page
+
+    @contextmanager
+    def page(self):
+        yield self._page
+
+
+def _search(pages, total, max_pages=50, region='四川'):
+    page = FakePage(pages, total)
+    crawler = SearchCrawler(['标识'], CrawlerConfig(min_delay=0, max_delay=0, max_pages=max_pages),
+                            pool=FakePool(page))
+    items = crawler.search_full(region=region)
+    return [item['id'] for item in items], page.visited
+
+
+def test_first_page_outside_region_still_paginates():
+    """第一页没有目标地区的项目时仍继续翻页，地区在合并后筛选"""
+    pages = {1: _records(1, region='重庆'), 2: _records(2), 3: _records(3, region='重庆') + _records(4)}
+    ids, visited = _search(pages, total=3)
+    assert visited == [1, 2, 3]
+    assert ids == ['200', '201', '400', '401']
+
+    ids, _ = _search(pages, total=3, region=None)
+    assert ids == ['100', '101', '200', '201', '300', '301', '400', '401']
+
+
+def test_failed_page_keeps_other_pages():
+    """中间一页失败时跳过该页，已抓取和之后的页都保留"""
+    pages = {1: _records(1), 2: RuntimeError("net::ERR_CONNECTION_RESET"), 3: _records(3)}
+    ids, visited = _search(pages, total=3)
+    assert visited == [1, 2, 3]
+    assert ids == ['100', '101', '300', '301']
+
+
+def test_stops_at_empty_page():
+    """遇到空页（或人机验证）时停止翻页"""
+    pages = {1: _records(1), 2: _records(2), 4: _records(4)}
+    ids, visited = _search(pages, total=5)
+    assert visited == [1, 2, 3]
+    assert ids == ['100', '101', '200', '201']
+
+
+def test_empty_first_page_does_not_paginate():
+    ids, visited = _search({}, total=5)
+    assert visited == [1]
+    assert ids == []
+
+
+def test_max_pages_caps_walk():
+    pages = {page_no: _records(page_no) for page_no in range(1, 11)}
+    ids, visited = _search(pages, total=10, max_pages=3)
+    assert visited == [1, 2, 3]
+    assert len(ids) == 6
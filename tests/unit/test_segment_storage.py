@@ -0,0 +1,123 @@
+"""追加式分段存储单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from data.models import BiddingInfo
+from data.segment_storage import SegmentLogStorage
+
+
+def _make_item(item_id: str, title: str) -> BiddingInfo:
+    return BiddingInfo(
+        id=item_id,
+        title=title,
+        info_type="招标公告",
+        publish_date=datetime(2026, 2, 1),
+        province="四川"
+    )
+
+
+def test_append_writes_segment_without_rewriting_snapshot():
+    """测试追加只写分段，不改写快照"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SegmentLogStorage(os.path.join(temp_dir, "bidding.json"))
+        storage.save([_make_item("1", "项目A")], {"last_full_crawl": "2026-02-01T00:00:00"})
+        snapshot_mtime = os.path.getmtime(storage.file_path)
+
+        added = storage.append([_make_item("1", "项目A"), _make_item("2", "项目B")])
+
+        assert added == 1
+        assert storage.segment_count() == 1
+        assert os.path.getmtime(storage.file_path) == snapshot_mtime
+
+        items, metadata = storage.load()
+        assert [item.id for item in items] == ["1", "2"]
+        assert metadata["total_count"] == 2
+        assert storage.get_last_crawl_time() is not None
+
+
+def test_compact_merges_segments():
+    """测试合并分段到快照"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SegmentLogStorage(os.path.join(temp_dir, "bidding.json"))
+        storage.save([_make_item("1", "项目A")], {})
+        storage.append([_make_item("2", "项目B")])
+        storage.append([_make_item("3", "项目C")])
+
+        total = storage.compact()
+
+        assert total == 3
+        assert storage.segment_count() == 0
+
+        reopened = SegmentLogStorage(storage.file_path)
+        items, metadata = reopened.load()
+        assert [item.id for item in items] == ["1", "2", "3"]
+        assert reopened.append([_make_item("3", "项目C")]) == 0
+
+
+def test_crash_before_index_update_keeps_records():
+    """测试分段登记后、ID索引更新前中断：记录不丢失，索引在下次使用时重建"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SegmentLogStorage(os.path.join(temp_dir, "bidding.json"))
+        storage.save([_make_item("1", "项目A")], {})
+
+        def crash(items):
+            raise RuntimeError("crash")
+        storage._record_added = crash
+        try:
+            storage.append([_make_item("2", "项目B")])
+        except RuntimeError:
+            pass
+
+        reopened = SegmentLogStorage(storage.file_path)
+        assert [item.id for item in reopened.load()[0]] == ["1", "2"]
+        assert reopened.append([_make_item("2", "项目B"), _make_item("3", "项目C")]) == 1
+        assert [item.id for item in reopened.load()[0]] == ["1", "2", "3"]
+
+
+def test_crash_during_compact_does_not_duplicate():
+    """测试快照替换后、manifest 重置前中断：分段记录不会重复读取"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SegmentLogStorage(os.path.join(temp_dir, "bidding.json"))
+        storage.save([_make_item("1", "项目A")], {})
+        storage.append([_make_item("2", "项目B")])
+
+        def crash(manifest):
+            raise RuntimeError("crash")
+        storage._write_manifest = crash
+        try:
+            storage.compact()
+        except RuntimeError:
+            pass
+
+        reopened = SegmentLogStorage(storage.file_path)
+        assert reopened.segment_count() == 1
+        assert [item.id for item in reopened.load()[0]] == ["1", "2"]
+        assert [item.id for item in reopened.iter_items()] == ["1", "2"]
+        assert reopened.append([_make_item("3", "项目C")]) == 1
+        assert [item.id for item in reopened.load()[0]] == ["1", "2", "3"]
+        assert reopened.compact() == 3
+        assert [item.id for item in SegmentLogStorage(storage.file_path).load()[0]] == ["1", "2", "3"]
+
+
+def test_iter_items_after_append_streams_snapshot(monkeypatch):
+    """测试追加后流式读取仍使用元数据旁路文件，不整体解析快照"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SegmentLogStorage(os.path.join(temp_dir, "bidding.json"))
+        storage.save([_make_item("1", "项目A")], {})
+        storage.append([_make_item("2", "项目B")])
+
+        loaded = []
+        json_load = json.load
+
+        def spy(f, *args, **kwargs):
+            loaded.append(os.path.abspath(f.name))
+            return json_load(f, *args, **kwargs)
+        monkeypatch.setattr(json, "load", spy)
+
+        assert [item.id for item in storage.iter_items()] == ["1", "2"]
+        assert [item.id for item in SegmentLogStorage(storage.file_path).iter_items()] == ["1", "2"]
+        assert os.path.abspath(storage.file_path) not in loaded
@@ -0,0 +1,57 @@
+"""列式快照单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import tempfile
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("pandas")
+
+import pandas as pd
+from data.snapshot import export_snapshot, join_list_column, load_snapshot
+
+
+def test_export_and_load_selected_columns():
+    """测试导出快照并只读取部分列"""
+    records = [
+        {"project_id": "1", "title": "项目A", "info_type": "招标公告", "publish_date": "2026-02-02",
+         "city": "成都", "keywords_matched": ["广告", "标识"], "bidding_deadline": "详见内容"},
+        {"project_id": "2", "title": "项目B", "info_type": "中标结果", "publish_date": "2026-02-01",
+         "city": None, "keywords_matched": [], "bidding_deadline": "2026-02-28"},
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bidding.feather")
+        assert export_snapshot(records, path) == 2
+        
+        df = load_snapshot(path, ["title", "city", "keywords_matched", "owner_unit"])
+        
+        assert list(df.columns) == ["title", "city", "keywords_matched"]
+        assert df["keywords_matched"].tolist() == [["广告", "标识"], []]
+        assert str(df["city"].dtype) == "category"
+        # 字符串和列表列保持 Arrow 存储
+        assert isinstance(df["keywords_matched"].dtype, pd.ArrowDtype)
+        assert load_snapshot(path, ["title"])["title"].dtype == pd.StringDtype('pyarrow')
+
+
+def test_join_list_column():
+    """测试列表列（Arrow 存储或 Python list）转换为展示用字符串"""
+    records = [
+        {"id": "1", "title": "项目A", "keywords_matched": ["广告", "标识"]},
+        {"id": "2", "title": "项目B", "keywords_matched": []},
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bidding.feather")
+        export_snapshot(records, path)
+        df = load_snapshot(path, ["keywords_matched"])
+        filtered = df[df.index == 1]
+        
+        assert join_list_column(df["keywords_matched"]).tolist() == ["广告, 标识", ""]
+        assert join_list_column(filtered["keywords_matched"]).tolist() == [""]
+        assert list(join_list_column(filtered["keywords_matched"]).index) == [1]
+    
+    plain = pd.Series([["广告", "标识"], []])
+    assert join_list_column(plain).tolist() == ["广告, 标识", ""]
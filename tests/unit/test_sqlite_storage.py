@@ -0,0 +1,58 @@
+"""SQLite 存储单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import tempfile
+from datetime import datetime
+from data.models import BiddingInfo
+from data.sqlite_storage import SQLiteStorage
+
+
+def _make_item(item_id: str, city: str, publish_date: datetime) -> BiddingInfo:
+    return BiddingInfo(
+        id=item_id,
+        title=f"项目{item_id}",
+        info_type="招标公告",
+        publish_date=publish_date,
+        province="四川",
+        city=city,
+        keywords_matched=["广告"]
+    )
+
+
+def test_save_append_and_load():
+    """测试保存、追加去重和加载"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SQLiteStorage(os.path.join(temp_dir, "bidding.db"))
+        assert storage.is_first_run() == True
+
+        storage.save([_make_item("1", "成都", datetime(2026, 2, 1))], {"last_full_crawl": "2026-02-01T00:00:00"})
+        assert storage.is_first_run() == False
+
+        added = storage.append([
+            _make_item("1", "成都", datetime(2026, 2, 1)),
+            _make_item("2", "绵阳", datetime(2026, 2, 2))
+        ])
+        assert added == 1
+
+        items, metadata = storage.load()
+        assert [item.id for item in items] == ["1", "2"]
+        assert items[0].keywords_matched == ["广告"]
+        assert metadata["total_count"] == 2
+        assert storage.get_last_crawl_time() is not None
+
+
+def test_query_by_date_range_and_city():
+    """测试按日期范围和城市查询"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SQLiteStorage(os.path.join(temp_dir, "bidding.db"))
+        storage.save([
+            _make_item("1", "成都", datetime(2026, 1, 20)),
+            _make_item("2", "成都", datetime(2026, 2, 1, 9, 30)),
+            _make_item("3", "绵阳", datetime(2026, 2, 1)),
+        ], {})
+
+        result = storage.query(start_date=datetime(2026, 2, 1), end_date=datetime(2026, 2, 1), city="成都")
+
+        assert [item.id for item in result] == ["2"]
@@ -9,26 +9,19 @@ from data.models import BiddingInfo
 from data.storage import JSONStorage
 
 
-def test_is_first_run():
+def test_is_first_run(tmp_path):
     """测试首次运行判断"""
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        temp_path = f.name
-    
-    # 删除临时文件，模拟首次运行
-    os.unlink(temp_path)
+    # 数据文件不存在，模拟首次运行
+    temp_path = str(tmp_path / "bidding.json")
     
     storage = JSONStorage(temp_path)
     assert storage.is_first_run() == True
-    
-    # 清理
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
 
 
-def test_save_and_load():
+def test_save_and_load(tmp_path):
     """测试保存和加载"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as f:
-        temp_path = f.name
+    # ID索引和元数据旁路文件与数据文件同目录，放在 tmp_path 中由 pytest 清理
+    temp_path = str(tmp_path / "bidding.json")
     
     storage = JSONStorage(temp_path)
     
@@ -55,15 +48,11 @@ def test_save_and_load():
     assert loaded_items[0].id == "1"
     assert loaded_items[0].title == "项目A"
     assert loaded_metadata["total_count"] == 1
-    
-    # 清理
-    os.unlink(temp_path)
 
 
-def test_append_with_dedup():
+def test_append_with_dedup(tmp_path):
     """测试追加数据并去重"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as f:
-        temp_path = f.name
+    temp_path = str(tmp_path / "bidding.json")
     
     storage = JSONStorage(temp_path)
     
@@ -111,6 +100,37 @@ def test_append_with_dedup():
     
     assert len(loaded_items) == 2
     assert loaded_metadata["total_count"] == 2
-    
-    # 清理
-    os.unlink(temp_path)
+
+
+def test_load_metadata_from_sidecar():
+    """测试元数据旁路文件及外部修改后的回退"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, "bidding.json")
+        storage = JSONStorage(temp_path)
+        
+        storage.save([], {"last_full_crawl": "2026-02-01T00:00:00", "total_count": 0})
+        
+        assert os.path.exists(storage.meta_path)
+        assert storage.load_metadata()["total_count"] == 0
+        assert storage.get_last_crawl_time() == datetime(2026, 2, 1)
+        
+        # 外部工具直接改写数据文件，旁路文件应失效
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write('{"metadata": {"last_full_crawl": "2026-02-03T00:00:00"}, "data": []}')
+        
+        assert storage.get_last_crawl_time() == datetime(2026, 2, 3)
+
+
+def test_iter_items_with_predicate():
+    """测试流式读取与过滤"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = JSONStorage(os.path.join(temp_dir, "bidding.json"))
+        storage.save([
+            BiddingInfo(id=str(i), title=f"项目{i}", info_type="招标公告",
+                        publish_date=datetime(2026, 2, 1 + i % 3), province="四川")
+            for i in range(6)
+        ], {})
+        
+        items = list(storage.iter_items(lambda item: item.publish_date.day == 1))
+        
+        assert [item.id for item in items] == ["0", "3"]
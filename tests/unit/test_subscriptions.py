@@ -0,0 +1,42 @@
+"""多订阅方匹配单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+from data.subscriptions import SubscriptionMatcher
+
+
+def _matcher() -> SubscriptionMatcher:
+    return SubscriptionMatcher({
+        "销售一组": ["广告", "牌 AND NOT 停车场"],
+        "销售二组": ["广告", "文化 AND owner_unit:学校"],
+        "销售三组": ["导视"],
+    })
+
+
+def test_shared_rules_compiled_once():
+    """测试相同规则在订阅方之间只编译一次"""
+    matcher = _matcher()
+    
+    assert matcher.matcher.keywords == ["广告", "牌 AND NOT 停车场", "文化 AND owner_unit:学校", "导视"]
+
+
+def test_match_per_subscriber():
+    """测试一次匹配得到各订阅方的命中结果"""
+    matcher = _matcher()
+    
+    assert matcher.match({"title": "户外广告牌采购"}) == {
+        "销售一组": ["广告", "牌"],
+        "销售二组": ["广告"],
+    }
+    assert matcher.match({"title": "停车场指示牌"}) == {}
+    assert matcher.match({"title": "校园文化墙", "owner_unit": "某某学校"}) == {"销售二组": ["文化", "学校"]}
+
+
+def test_route():
+    """测试按订阅方分发项目"""
+    matcher = _matcher()
+    items = [{"title": "户外广告采购"}, {"title": "道路施工"}, {"title": "宣传牌制作"}]
+    
+    routed = matcher.route(items)
+    
+    assert routed == {"销售一组": [items[0], items[2]], "销售二组": [items[0]], "销售三组": []}
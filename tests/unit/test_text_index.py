@@ -0,0 +1,65 @@
+"""全文索引单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import os
+import tempfile
+from datetime import datetime
+from data.models import BiddingInfo
+from data.storage import JSONStorage
+from data.text_index import TextIndex, tokenize
+
+
+def _make_item(item_id: str, title: str, owner_unit: str = None, project_address: str = None) -> BiddingInfo:
+    return BiddingInfo(
+        id=item_id,
+        title=title,
+        info_type="招标公告",
+        publish_date=datetime(2026, 2, 1),
+        province="四川",
+        owner_unit=owner_unit,
+        project_address=project_address
+    )
+
+
+ITEMS = [
+    _make_item("1", "成都市景区标识标牌采购项目", "成都市文化广电旅游局", "成都市锦江区"),
+    _make_item("2", "绵阳市LED显示屏及宣传栏采购", "绵阳市实验学校"),
+    _make_item("3", "标牌识别系统维护", "德阳市交通运输局", "德阳市旌阳区"),
+    _make_item("4", "乡镇文化墙彩绘工程"),
+]
+
+
+def test_tokenize_bigrams_and_ascii():
+    """测试中文按单字和 bigram 切分，英文数字转为小写"""
+    assert set(tokenize("LED屏")) == {"l", "e", "d", "le", "ed", "屏"}
+    assert set(tokenize("标识牌")) == {"标", "识", "牌", "标识", "识牌"}
+
+
+def test_search_matches_substring_semantics():
+    """测试查询结果与逐条子串查找一致（bigram 都出现但不相邻的项目被排除）"""
+    index = TextIndex()
+    index.add(ITEMS)
+    
+    assert index.search("标识") == ["1"]
+    assert index.search("标牌") == ["1", "3"]
+    assert index.search("识牌") == []
+    assert index.search("led") == ["2"]
+    assert index.search("牌") == ["1", "3"]
+    assert index.search("文化") == ["1", "4"]
+    assert index.search("文化", fields=("title",)) == ["4"]
+    assert index.search("成都 标牌") == ["1"]
+
+
+def test_storage_appends_update_index_incrementally():
+    """测试 JSONStorage 追加时增量更新索引，重新打开后可直接查询"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "data.json")
+        storage = JSONStorage(file_path, text_index=True)
+        storage.save(ITEMS[:2], {})
+        storage.append(ITEMS[1:])
+        
+        reopened = JSONStorage(file_path, text_index=True)
+        assert reopened.search("标牌") == ["1", "3"]
+        assert reopened.search("学校", fields=("owner_unit",)) == ["2"]
+        assert len(reopened.text_index) == 4
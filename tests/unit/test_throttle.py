@@ -0,0 +1,53 @@
+"""按主机限速单元测试"""
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
+import asyncio
+from crawler.throttle import HostThrottle
+
+
+def _run_requests(throttle, urls, hold=0.0):
+    """并发发出请求，返回每个请求进入的时间（相对开始）和最大并发数"""
+    starts = {}
+    active = [0, 0]
+
+    async def request(index, url):
+        async with throttle.slot(url):
+            starts[index] = asyncio.get_running_loop().time()
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            await asyncio.sleep(hold)
+            active[0] -= 1
+
+    async def main():
+        begin = asyncio.get_running_loop().time()
+        await asyncio.gather(*(request(i, url) for i, url in enumerate(urls)))
+        return {i: t - begin for i, t in starts.items()}
+
+    return asyncio.run(main()), active[1]
+
+
+def test_same_host_requests_are_spaced():
+    """测试同一主机的请求按间隔依次开始"""
+    throttle = HostThrottle(0.05, 0.05, per_host=3)
+    starts, _ = _run_requests(throttle, ['https://search.bidcenter.com.cn/search?page=%d' % i for i in range(3)])
+    times = sorted(starts.values())
+    # 间隔按预约的开始时间计算：第 i 个请求不早于 i 个间隔后开始（实际唤醒可能稍晚，不比较相邻两次的差）
+    assert times[0] < 0.03
+    assert times[1] >= 0.045
+    assert times[2] >= 0.095
+
+
+def test_different_hosts_are_independent():
+    """测试不同主机互不等待"""
+    throttle = HostThrottle(0.2, 0.2)
+    starts, peak = _run_requests(throttle, ['https://a.example.com/', 'https://b.example.com/'], hold=0.05)
+    assert max(starts.values()) < 0.1
+    assert peak == 2
+
+
+def test_per_host_concurrency_limit():
+    """测试同一主机同时进行的请求数不超过限制"""
+    throttle = HostThrottle(0, 0, per_host=2)
+    _, peak = _run_requests(throttle, ['https://a.example.com/%d' % i for i in range(6)], hold=0.02)
+    assert peak == 2
@@ -1,76 +1,35 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-更新现有数据，添加关键字位置信息
+更新旧数据，添加关键字位置信息
+
+新抓取的数据在解析和匹配时已经完成位置标注（见 src/data/keyword_location.py），
+此脚本只用于补全旧版本抓取、缺少 keyword_location 的记录。
 """
 
+import sys
+sys.path.insert(0, '/home/ubuntu/bidding-crawler/src')
+
 import json
-import re
 
-# 关键字位置映射规则
-# 基于采招网页面的标注格式
-LOCATION_PATTERNS = {
-    r'在内容中': ['正文'],
-    r'在内容或附件中.*附件': ['正文', '附件'],
-    r'在内容或标书中.*标书': ['正文', '标书'],
-    r'在标题中': ['标题'],
-}
+from data.keyword_location import split_location_tag, keyword_locations
+
+KEYWORDS = ['广告', '标识', '牌', '标志', '宣传', '栏', '文化']
+
 
 def extract_keyword_location(title: str) -> tuple:
     """
     从标题中提取关键字位置信息
     
     Args:
-        title: 项目标题
+        title: 项目标题（可能带有位置标注）
         
     Returns:
         (keyword_location, has_attachments, has_bidding_docs)
     """
-    keyword_location = []
-    has_attachments = False
-    has_bidding_docs = False
-    
-    # 检查标题中是否包含关键字
-    keywords = ['广告', '标识', '牌', '标志', '宣传', '栏', '文化']
-    title_lower = title
-    
-    # 检查关键字是否在标题中（不在括号内）
-    title_without_brackets = re.sub(r'\([^)]*\)', '', title)
-    for keyword in keywords:
-        if keyword in title_without_brackets:
-            if '标题' not in keyword_location:
-                keyword_location.append('标题')
-            break
-    
-    # 检查括号中的位置标注
-    bracket_match = re.search(r'\(([^)]+)\)', title)
-    if bracket_match:
-        bracket_content = bracket_match.group(1)
-        
-        # 检查是否在正文中
-        if '在内容中' in bracket_content or '在正文中' in bracket_content:
-            if '正文' not in keyword_location:
-                keyword_location.append('正文')
-        
-        # 检查是否在附件中
-        if '附件' in bracket_content:
-            if '正文' not in keyword_location:
-                keyword_location.append('正文')
-            keyword_location.append('附件')
-            has_attachments = True
-        
-        # 检查是否在标书中
-        if '标书' in bracket_content:
-            if '正文' not in keyword_location:
-                keyword_location.append('正文')
-            keyword_location.append('标书')
-            has_bidding_docs = True
-    
-    # 如果没有任何位置信息，默认为正文
-    if not keyword_location:
-        keyword_location = ['正文']
-    
-    return keyword_location, has_attachments, has_bidding_docs
+    clean_title, tag, has_attachments, has_bidding_docs = split_location_tag(title)
+    in_title = any(keyword in clean_title for keyword in KEYWORDS)
+    return keyword_locations(in_title, tag), has_attachments, has_bidding_docs
 
 
 def main():
@@ -83,9 +42,11 @@ def main():
     
     print(f"读取到 {len(data)} 条数据")
     
-    # 更新每条数据
+    # 只更新缺少位置信息的记录
     updated_count = 0
     for item in data:
+        if item.get('keyword_location'):
+            continue
         title = item['title']
         
         # 提取关键字位置信息
@@ -110,6 +71,10 @@ def main():
         print(f"✓ {title[:40]}...")
         print(f"  位置: {location_str} {flags_str}")
     
+    if updated_count == 0:
+        print("\n✅ 所有记录都已有关键字位置信息，无需更新")
+        return
+    
     # 保存更新后的数据
     with open(data_file, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
@@ -122,11 +87,11 @@ def main():
     bidding_docs_count = 0
     
     for item in data:
-        for loc in item['keyword_location']:
+        for loc in item.get('keyword_location', []):
             location_stats[loc] = location_stats.get(loc, 0) + 1
-        if item['has_attachments']:
+        if item.get('has_attachments'):
             attachment_count += 1
-        if item['has_bidding_docs']:
+        if item.get('has_bidding_docs'):
             bidding_docs_count += 1
     
     print("\n📊 统计信息：")